@@ -1,12 +1,11 @@
 """Flask application factory."""
 import os
-import uuid
 
 from flask import Flask, g, jsonify, request
 from flask_login import current_user
 from loguru import logger
 from flask_migrate import upgrade
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 
 from app.core import api, cors, csrf, db, get_config, jwt, limiter, login_manager, mail, migrate, setup_logging
 
@@ -28,6 +27,11 @@ def create_app(config_name: str = None) -> Flask:
                 static_folder=os.path.join(root_dir, 'static'),
                 template_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates'))
 
+    # Serialize JSON responses with orjson
+    from app.core.json_provider import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+
     # Load configuration
     if config_name:
         from app.core.config import config_by_name
@@ -46,6 +50,21 @@ def create_app(config_name: str = None) -> Flask:
     jwt.init_app(app)
     cors.init_app(app, origins=app.config["CORS_ORIGINS"])
     api.init_app(app)
+
+    # Initialize Redis: one pool per process, built before any request so
+    # concurrent greenlets never race to create their own client
+    app.redis = Redis(
+        connection_pool=BlockingConnectionPool.from_url(
+            app.config["REDIS_URL"],
+            max_connections=app.config["REDIS_POOL_SIZE"],
+            timeout=app.config["REDIS_POOL_TIMEOUT"],
+            decode_responses=True,
+        )
+    )
+    if app.config["RATELIMIT_STORAGE_URI"] == app.config["REDIS_URL"]:
+        app.config.setdefault(
+            "RATELIMIT_STORAGE_OPTIONS", {"connection_pool": app.redis.connection_pool}
+        )
     limiter.init_app(app)
     mail.init_app(app)
     login_manager.init_app(app)
@@ -74,8 +93,10 @@ def create_app(config_name: str = None) -> Flask:
     csrf.exempt('app.api.v1.dashboards')
     csrf.exempt('app.api.v1.alerts')
 
-    # Initialize Redis
-    app.redis = Redis.from_url(app.config["REDIS_URL"], decode_responses=True)
+    # Initialize background audit writer
+    from app.services.audit import audit_queue
+
+    audit_queue.init_app(app)
 
     # Register middleware
     register_middleware(app)
@@ -251,10 +272,7 @@ def register_middleware(app: Flask) -> None:
     from app.middleware.tenancy import TenancyMiddleware
 
     # Request ID middleware (must be first)
-    @app.before_request
-    def add_request_id():
-        """Add unique request ID to g context."""
-        g.request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+    app.before_request(RequestIdMiddleware.add_request_id)
 
     @app.after_request
     def inject_request_id(response):
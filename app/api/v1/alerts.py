@@ -31,7 +31,7 @@ class AlertList(MethodView):
     """Alert list endpoint."""
 
     @blp.arguments(AlertListQuerySchema, location="query")
-    @blp.response(200, AlertSchema(many=True))
+    @blp.response(200)
     @roles_required("Owner", "Admin", "Analyst", "Member")
     def get(self, query_params):
         """
@@ -103,8 +103,10 @@ class AlertList(MethodView):
             f"Listed alerts for tenant {tenant_id}: {paginated.total} total, {unread_count} unread"
         )
         
+        # Serialize the page in one many=True dump; the response schema
+        # cannot describe this envelope
         return {
-            "items": paginated.items,
+            "items": AlertSchema(many=True).dump(paginated.items),
             "total": paginated.total,
             "page": page,
             "per_page": per_page,
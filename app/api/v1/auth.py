@@ -204,13 +204,15 @@ class Login(MethodView):
                 403,
             )
 
-        # Update login tracking
-        user.update_login()
-
-        # Log login action
+        # Log login action; written by the login-tracking commit below
         g.user_id = user.id
         g.tenant_id = tenant_id
-        AuditLog.log_action(action=AuditAction.LOGIN, resource_type="user", resource_id=user.id)
+        AuditLog.log_action(
+            action=AuditAction.LOGIN, entity_type="user", entity_id=user.id, commit=False
+        )
+
+        # Update login tracking
+        user.update_login()
 
         # Generate tokens
         tokens = generate_tokens(user)
@@ -298,16 +300,14 @@ class ChangePassword(MethodView):
                 400,
             )
 
-        # Set new password
+        # Set new password and log the change in the same commit
         user.set_password(data["new_password"])
-        db.session.commit()
-
-        # Log password change
         g.user_id = user.id
         g.tenant_id = user.tenant_id
         AuditLog.log_action(
-            action=AuditAction.PASSWORD_CHANGE, resource_type="user", resource_id=user.id
+            action=AuditAction.PASSWORD_CHANGE, entity_type="user", entity_id=user.id, commit=False
         )
+        db.session.commit()
 
         logger.info(f"Password changed", user_id=user.id)
 
@@ -468,13 +468,14 @@ class InviteUser(MethodView):
             # Log invitation
             AuditLog.log_action(
                 action=AuditAction.USER_INVITED,
-                resource_type="user",
-                resource_id=new_user.id,
-                details={
+                entity_type="user",
+                entity_id=new_user.id,
+                metadata={
                     "inviter_id": inviter_id,
                     "invited_email": data["email"],
                     "role": requested_role,
                 },
+                commit=False,
             )
             
             db.session.commit()
@@ -98,16 +98,17 @@ class BudgetStatus(MethodView):
         if not budget:
             return jsonify({"error": "Budget not found"}), 404
 
+        spent, remaining, utilization, exceeded, should_alert = budget.get_summary()
         status = {
             "budget_id": budget.id,
             "name": budget.name,
             "amount": str(budget.amount),
-            "spent": str(budget.get_spent_amount()),
-            "remaining": str(budget.get_remaining_amount()),
-            "utilization_percentage": budget.get_utilization_percentage(),
-            "is_exceeded": budget.is_exceeded(),
+            "spent": str(spent),
+            "remaining": str(remaining),
+            "utilization_percentage": utilization,
+            "is_exceeded": exceeded,
             "alert_threshold": budget.alert_threshold,
-            "should_alert": budget.should_alert(),
+            "should_alert": should_alert,
         }
 
         return jsonify(status)
@@ -1,15 +1,16 @@
 """Dashboards API endpoints."""
-from collections import defaultdict
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import timedelta
+from itertools import accumulate, groupby
+from operator import attrgetter
 
 from flask import jsonify, g
 from flask.views import MethodView
 from flask_login import login_required, current_user
 from flask_smorest import Blueprint
 from loguru import logger
-from sqlalchemy import func, extract
+from sqlalchemy import Float, and_, case, cast, extract, func, literal, select, union_all
 
 from app.core.extensions import db
 from app.middleware.tenancy import TenancyMiddleware
@@ -22,6 +23,123 @@ bp = Blueprint("dashboards", __name__, url_prefix="/dashboards", description="Da
 # Alias to keep registration consistent with other blueprints
 blp = bp
 
+ALERT_CATEGORIES = ("low_balance_accounts", "projects_ending_soon", "over_budget_projects")
+ALERT_DRILLDOWN_LIMIT = 10
+
+
+def _execute_concurrently(statements):
+    """
+    Execute independent read-only statements in parallel.
+    
+    Each statement runs on its own pooled connection so wall-clock time is
+    roughly that of the slowest query instead of the sum of all of them.
+    SQLite shares a single connection across threads, so it falls back to
+    sequential execution on the request session.
+    
+    Args:
+        statements: Mapping of result key to selectable
+        
+    Returns:
+        Mapping of result key to list of result rows
+    """
+    engine = db.engine
+    if engine.dialect.name == "sqlite":
+        return {key: db.session.execute(stmt).all() for key, stmt in statements.items()}
+
+    def _run(stmt):
+        with engine.connect() as conn:
+            return conn.execute(stmt).all()
+
+    with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+        futures = {key: executor.submit(_run, stmt) for key, stmt in statements.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _low_balance_criteria(tenant_id):
+    """Filter criteria for accounts at or below their low-balance threshold."""
+    return (
+        Account.tenant_id == tenant_id,
+        Account.is_deleted == False,
+        Account.current_balance <= Account.low_balance_threshold,
+    )
+
+
+def _project_summary_statement(project_id, tenant_id):
+    """
+    Build the project summary query.
+    
+    Returns the project together with starting budget, projected estimate,
+    total spend, remaining budget and budget utilization, all as floats.
+    """
+    spent = func.coalesce(func.sum(Expense.amount), 0)
+    budget = func.coalesce(Project.starting_budget, 0)
+    return (
+        select(
+            Project,
+            cast(budget, Float).label("starting_budget"),
+            cast(func.coalesce(Project.projected_estimate, 0), Float).label("projected_estimate"),
+            cast(spent, Float).label("total_spend"),
+            cast(budget - spent, Float).label("remaining_budget"),
+            cast(
+                case((budget > 0, 100 * spent / budget), else_=0), Float
+            ).label("budget_utilization"),
+        )
+        .outerjoin(
+            Expense,
+            and_(
+                Expense.project_id == Project.id,
+                Expense.tenant_id == tenant_id,
+                Expense.is_deleted == False,
+            ),
+        )
+        .where(
+            Project.id == project_id,
+            Project.tenant_id == tenant_id,
+            Project.is_deleted == False,
+        )
+        .group_by(Project.id)
+    )
+
+
+def _alert_counts_statement(tenant_id):
+    """
+    Build a single UNION ALL statement returning (category, count) rows.
+    
+    Covers low-balance accounts, projects ending in the next 14 days and
+    projects whose total spend exceeds their starting budget, so alert
+    totals never hydrate the underlying rows.
+    """
+    today = date.today()
+    soon = today + timedelta(days=14)
+
+    over_budget = (
+        select(Project.id)
+        .join(Expense, Expense.project_id == Project.id)
+        .where(
+            Project.tenant_id == tenant_id,
+            Project.is_deleted == False,
+            Expense.tenant_id == tenant_id,
+            Expense.is_deleted == False,
+        )
+        .group_by(Project.id, Project.starting_budget)
+        .having(func.sum(Expense.amount) > Project.starting_budget)
+        .subquery()
+    )
+
+    return union_all(
+        select(literal("low_balance_accounts"), func.count(Account.id)).where(
+            *_low_balance_criteria(tenant_id)
+        ),
+        select(literal("projects_ending_soon"), func.count(Project.id)).where(
+            Project.tenant_id == tenant_id,
+            Project.is_deleted == False,
+            Project.end_date != None,
+            Project.end_date >= today,
+            Project.end_date <= soon,
+        ),
+        select(literal("over_budget_projects"), func.count()).select_from(over_budget),
+    )
+
 
 def _get_tenant_id():
     """Resolve tenant id from request context or current user."""
@@ -52,52 +170,54 @@ class ProjectDashboard(MethodView):
         if not tenant_id:
             return jsonify({"error": "Tenant context required"}), 400
 
-        project = (
-            db.session.query(Project)
-            .filter_by(id=project_id, tenant_id=tenant_id, is_deleted=False)
-            .first()
-        )
-        if not project:
+        # Project and its budget totals in one statement, derived numerics
+        # computed and cast to float in SQL
+        summary = db.session.execute(_project_summary_statement(project_id, tenant_id)).first()
+        if not summary:
             return jsonify({"error": "Project not found"}), 404
 
-        # Totals
-        total_spend = (
-            db.session.query(func.sum(Expense.amount))
-            .filter(
-                Expense.tenant_id == tenant_id,
-                Expense.project_id == project.id,
-                Expense.is_deleted == False,
-            )
-            .scalar()
-            or Decimal("0.00")
-        )
-        remaining_budget = Decimal(project.starting_budget) - Decimal(total_spend)
-        budget_utilization = float((total_spend / project.starting_budget) * 100) if project.starting_budget else 0.0
+        project = summary.Project
+        total_spend = summary.total_spend
+        starting_budget = summary.starting_budget
+        projected_estimate = summary.projected_estimate
+        remaining_budget = summary.remaining_budget
+        budget_utilization = summary.budget_utilization
         days_remaining = project.days_remaining
         days_elapsed = project.days_elapsed or 1
-        burn_rate = float(total_spend) / float(days_elapsed) if days_elapsed else 0.0
-
-        # Accounts snapshot
-        accounts = (
-            db.session.query(Account)
-            .filter_by(tenant_id=tenant_id, is_deleted=False)
+        burn_rate = total_spend / days_elapsed if days_elapsed else 0.0
+
+        # Accounts snapshot (scalar columns only, no ORM hydration)
+        accounts = db.session.execute(
+            select(
+                Account.id,
+                Account.name,
+                Account.account_type,
+                Account.current_balance,
+                Account.low_balance_threshold,
+                Account.currency,
+            )
+            .where(Account.tenant_id == tenant_id, Account.is_deleted == False)
             .order_by(Account.name)
-            .all()
-        )
+        ).all()
+
+        # Category breakdown and monthly trend are necessarily empty when
+        # nothing has been spent yet, so skip those queries entirely.
+        category_rows = []
+        month_rows = []
 
         # Category breakdown
-        category_colors = []
-        category_rows = (
-            db.session.query(Category.id, Category.name, Category.color, func.sum(Expense.amount))
-            .join(Expense, Expense.category_id == Category.id)
-            .filter(
-                Expense.tenant_id == tenant_id,
-                Expense.project_id == project.id,
-                Expense.is_deleted == False,
+        if total_spend:
+            category_rows = (
+                db.session.query(Category.id, Category.name, Category.color, func.sum(Expense.amount))
+                .join(Expense, Expense.category_id == Category.id)
+                .filter(
+                    Expense.tenant_id == tenant_id,
+                    Expense.project_id == project.id,
+                    Expense.is_deleted == False,
+                )
+                .group_by(Category.id, Category.name, Category.color)
+                .all()
             )
-            .group_by(Category.id, Category.name, Category.color)
-            .all()
-        )
         category_labels = [row[1] for row in category_rows]
         category_data = [float(row[3]) for row in category_rows]
         category_colors = [row[2] or "#6366F1" for row in category_rows]
@@ -105,60 +225,55 @@ class ProjectDashboard(MethodView):
         # Fallback so charts render even if there are no categories
         if not category_labels and total_spend:
             category_labels = ["Uncategorized"]
-            category_data = [float(total_spend)]
+            category_data = [total_spend]
             category_colors = ["#9ca3af"]
-            category_rows = [(None, "Uncategorized", "#9ca3af", float(total_spend))]
+            category_rows = [(None, "Uncategorized", "#9ca3af", total_spend)]
 
         # Monthly trend grouped by account
-        month_rows = (
-            db.session.query(
-                extract("year", Expense.expense_date).label("y"),
-                extract("month", Expense.expense_date).label("m"),
-                Account.name.label("account"),
-                func.sum(Expense.amount).label("total"),
-            )
-            .join(Account, Account.id == Expense.account_id)
-            .filter(
-                Expense.tenant_id == tenant_id,
-                Expense.project_id == project.id,
-                Expense.is_deleted == False,
+        if total_spend:
+            month_rows = (
+                db.session.query(
+                    extract("year", Expense.expense_date).label("y"),
+                    extract("month", Expense.expense_date).label("m"),
+                    Account.name.label("account"),
+                    func.sum(Expense.amount).label("total"),
+                )
+                .join(Account, Account.id == Expense.account_id)
+                .filter(
+                    Expense.tenant_id == tenant_id,
+                    Expense.project_id == project.id,
+                    Expense.is_deleted == False,
+                )
+                .group_by("y", "m", "account")
+                .order_by("account", "y", "m")
+                .all()
             )
-            .group_by("y", "m", "account")
-            .order_by("y", "m")
-            .all()
-        )
 
-        month_totals = defaultdict(dict)
-        for row in month_rows:
-            ym = f"{int(row.y):04d}-{int(row.m):02d}"
-            month_totals[ym][row.account] = float(row.total)
-
-        sorted_months = sorted(month_totals.keys())
+        # Rows arrive grouped by account, so each dataset is built in one pass
+        sorted_months = sorted({f"{int(row.y):04d}-{int(row.m):02d}" for row in month_rows})
+        month_sums = dict.fromkeys(sorted_months, 0.0)
         datasets = []
-        if sorted_months:
-            accounts_seen = set()
-            for _, account_totals in month_totals.items():
-                accounts_seen.update(account_totals.keys())
-            for account_name in sorted(accounts_seen):
-                datasets.append(
-                    {
-                        "label": account_name,
-                        "data": [month_totals[month].get(account_name, 0.0) for month in sorted_months],
-                    }
-                )
+        for account_name, rows in groupby(month_rows, key=attrgetter("account")):
+            account_totals = {}
+            for row in rows:
+                ym = f"{int(row.y):04d}-{int(row.m):02d}"
+                account_totals[ym] = float(row.total)
+                month_sums[ym] += account_totals[ym]
+            datasets.append(
+                {
+                    "label": account_name,
+                    "data": [account_totals.get(month, 0.0) for month in sorted_months],
+                }
+            )
 
         # Forecast vs actual (simple projection using projected_estimate or starting_budget)
         forecast_labels = sorted_months
-        cumulative_actual = []
-        running = 0.0
-        for month in forecast_labels:
-            running += sum(month_totals[month].values())
-            cumulative_actual.append(running)
-        forecast_total = float(project.projected_estimate or project.starting_budget or 0)
+        cumulative_actual = list(accumulate(month_sums.values()))
+        forecast_total = projected_estimate or starting_budget
         forecast_line = [forecast_total for _ in forecast_labels] if forecast_labels else []
 
         # Fallback for empty monthly trend: collapse totals by account into a single bar
-        if not forecast_labels:
+        if not forecast_labels and total_spend:
             acct_totals = (
                 db.session.query(Account.name, func.sum(Expense.amount))
                 .join(Expense, Expense.account_id == Account.id)
@@ -175,13 +290,13 @@ class ProjectDashboard(MethodView):
                 datasets = [
                     {"label": name, "data": [float(total)]} for name, total in acct_totals
                 ]
-                cumulative_actual = [float(total_spend)]
-                forecast_line = [forecast_total] if forecast_total else [float(total_spend)]
+                cumulative_actual = [total_spend]
+                forecast_line = [forecast_total] if forecast_total else [total_spend]
             elif total_spend:
                 forecast_labels = ["Total"]
-                datasets = [{"label": "All Accounts", "data": [float(total_spend)]}]
-                cumulative_actual = [float(total_spend)]
-                forecast_line = [forecast_total] if forecast_total else [float(total_spend)]
+                datasets = [{"label": "All Accounts", "data": [total_spend]}]
+                cumulative_actual = [total_spend]
+                forecast_line = [forecast_total] if forecast_total else [total_spend]
 
         # ------------------------------------------------------------------
         # Additional insights (spend velocity, runway, vendors, recents)
@@ -196,31 +311,35 @@ class ProjectDashboard(MethodView):
                 Expense.project_id == project.id,
                 Expense.is_deleted == False,
                 Expense.expense_date >= start_30d,
-                Expense.expense_date <= today,
+                Expense.expense_date < today + timedelta(days=1),
             )
             .group_by(Expense.expense_date)
             .order_by(Expense.expense_date)
             .all()
         )
-        daily_map = {r[0].isoformat(): float(r[1] or 0) for r in daily_rows}
+        # Single pass into per-day buckets (expense_date carries a time of day,
+        # so rows are bucketed by calendar date rather than matched by key)
         daily_labels = [(start_30d + timedelta(days=i)).isoformat() for i in range(30)]
-        daily_data = [daily_map.get(d, 0.0) for d in daily_labels]
+        daily_data = [0.0] * 30
+        for expense_date, amount in daily_rows:
+            idx = (expense_date.date() - start_30d).days
+            if 0 <= idx < 30:
+                daily_data[idx] += float(amount or 0)
 
         spend_7d = float(sum(daily_data[-7:])) if daily_data else 0.0
         spend_30d = float(sum(daily_data)) if daily_data else 0.0
         avg_daily_7d = (spend_7d / 7.0) if spend_7d else 0.0
         avg_daily_30d = (spend_30d / 30.0) if spend_30d else 0.0
 
-        remaining_budget_float = float(remaining_budget)
         runway_days = None
-        if avg_daily_30d > 0 and remaining_budget_float > 0:
-            runway_days = remaining_budget_float / avg_daily_30d
+        if avg_daily_30d > 0 and remaining_budget > 0:
+            runway_days = remaining_budget / avg_daily_30d
 
         month_start = today.replace(day=1)
         prev_month_end = month_start - timedelta(days=1)
         prev_month_start = prev_month_end.replace(day=1)
 
-        spend_mtd = (
+        spend_mtd = float(
             db.session.query(func.sum(Expense.amount))
             .filter(
                 Expense.tenant_id == tenant_id,
@@ -230,9 +349,9 @@ class ProjectDashboard(MethodView):
                 Expense.expense_date <= today,
             )
             .scalar()
-            or Decimal("0.00")
+            or 0
         )
-        spend_prev_month = (
+        spend_prev_month = float(
             db.session.query(func.sum(Expense.amount))
             .filter(
                 Expense.tenant_id == tenant_id,
@@ -242,11 +361,11 @@ class ProjectDashboard(MethodView):
                 Expense.expense_date <= prev_month_end,
             )
             .scalar()
-            or Decimal("0.00")
+            or 0
         )
         mtd_change_pct = None
-        if spend_prev_month and float(spend_prev_month) > 0:
-            mtd_change_pct = ((float(spend_mtd) - float(spend_prev_month)) / float(spend_prev_month)) * 100.0
+        if spend_prev_month > 0:
+            mtd_change_pct = ((spend_mtd - spend_prev_month) / spend_prev_month) * 100.0
 
         vendor_rows = (
             db.session.query(Expense.vendor, func.sum(Expense.amount))
@@ -315,28 +434,27 @@ class ProjectDashboard(MethodView):
             for r in recent_rows
         ]
 
-        total_spend_float = float(total_spend or 0)
         top_category_name = None
         top_category_share = None
-        if category_rows and total_spend_float > 0:
+        if category_rows and total_spend > 0:
             _, top_category_name, _, top_category_total = max(category_rows, key=lambda x: float(x[3] or 0))
-            top_category_share = (float(top_category_total or 0) / total_spend_float) * 100.0
+            top_category_share = (float(top_category_total or 0) / total_spend) * 100.0
 
         projected_end_total = None
         projected_end_variance = None
         project_total_days = (project.days_elapsed or 0) + (project.days_remaining or 0)
         if project_total_days > 0:
-            projected_end_total = float(burn_rate) * float(project_total_days)
-            projected_end_variance = projected_end_total - float(project.starting_budget or 0)
+            projected_end_total = burn_rate * project_total_days
+            projected_end_variance = projected_end_total - starting_budget
 
         data = {
             "project": {
                 "id": project.id,
                 "name": project.name,
-                "starting_budget": float(project.starting_budget),
-                "projected_estimate": float(project.projected_estimate),
-                "total_spend": float(total_spend),
-                "remaining_budget": float(remaining_budget),
+                "starting_budget": starting_budget,
+                "projected_estimate": projected_estimate,
+                "total_spend": total_spend,
+                "remaining_budget": remaining_budget,
                 "budget_utilization": budget_utilization,
                 "is_over_budget": remaining_budget < 0,
                 "days_remaining": days_remaining if days_remaining is not None else 0,
@@ -344,15 +462,15 @@ class ProjectDashboard(MethodView):
                 "forecast": {
                     "projected_total": forecast_total,
                     "confidence": 75,
-                    "variance": float(forecast_total - float(total_spend)),
+                    "variance": forecast_total - total_spend,
                     "will_exceed": remaining_budget < 0,
                 },
             },
             # Flat aliases for the dashboard JS/template (server-rendered data is flat)
-            "starting_budget": float(project.starting_budget),
-            "projected_estimate": float(project.projected_estimate),
-            "total_spend": float(total_spend),
-            "remaining_budget": float(remaining_budget),
+            "starting_budget": starting_budget,
+            "projected_estimate": projected_estimate,
+            "total_spend": total_spend,
+            "remaining_budget": remaining_budget,
             "budget_utilization": budget_utilization,
             "is_over_budget": remaining_budget < 0,
             "days_remaining": days_remaining if days_remaining is not None else 0,
@@ -360,7 +478,7 @@ class ProjectDashboard(MethodView):
             "forecast": {
                 "projected_total": forecast_total,
                 "confidence": 75,
-                "variance": float(forecast_total - float(total_spend)),
+                "variance": forecast_total - total_spend,
             },
             "insights": {
                 "spend_7d": spend_7d,
@@ -368,8 +486,8 @@ class ProjectDashboard(MethodView):
                 "avg_daily_7d": avg_daily_7d,
                 "avg_daily_30d": avg_daily_30d,
                 "runway_days": runway_days,
-                "spend_mtd": float(spend_mtd or 0),
-                "spend_prev_month": float(spend_prev_month or 0),
+                "spend_mtd": spend_mtd,
+                "spend_prev_month": spend_prev_month,
                 "mtd_change_pct": mtd_change_pct,
                 "top_category_name": top_category_name,
                 "top_category_share": top_category_share,
@@ -432,92 +550,58 @@ class TenantDashboard(MethodView):
         if not tenant_id:
             return jsonify({"error": "Tenant context required"}), 400
 
-        total_spend = (
-            db.session.query(func.sum(Expense.amount))
-            .filter(Expense.tenant_id == tenant_id, Expense.is_deleted == False)
-            .scalar()
-            or 0
-        )
-
-        top_vendors = (
-            db.session.query(Expense.vendor, func.sum(Expense.amount))
-            .filter(Expense.tenant_id == tenant_id, Expense.is_deleted == False, Expense.vendor != None)
-            .group_by(Expense.vendor)
-            .order_by(func.sum(Expense.amount).desc())
-            .limit(5)
-            .all()
-        )
-
-        low_balance_accounts = (
-            db.session.query(Account)
-            .filter(
-                Account.tenant_id == tenant_id,
-                Account.is_deleted == False,
-                Account.current_balance <= Account.low_balance_threshold,
-            )
-            .all()
-        )
-
-        # Projects ending soon (next 14 days)
-        today = date.today()
-        soon = today + timedelta(days=14)
-        projects_ending_soon = (
-            db.session.query(Project)
-            .filter(
-                Project.tenant_id == tenant_id,
-                Project.is_deleted == False,
-                Project.end_date != None,
-                Project.end_date >= today,
-                Project.end_date <= soon,
-            )
-            .all()
+        # The aggregates below are read-only and independent of each other,
+        # so they are dispatched concurrently on separate pooled connections.
+        results = _execute_concurrently(
+            {
+                "total_spend": select(func.sum(Expense.amount)).where(
+                    Expense.tenant_id == tenant_id, Expense.is_deleted == False
+                ),
+                "top_vendors": select(Expense.vendor, func.sum(Expense.amount))
+                .where(Expense.tenant_id == tenant_id, Expense.is_deleted == False, Expense.vendor != None)
+                .group_by(Expense.vendor)
+                .order_by(func.sum(Expense.amount).desc())
+                .limit(5),
+                "alert_counts": _alert_counts_statement(tenant_id),
+            }
         )
 
-        # Over-budget projects (total spend exceeds starting budget)
-        spend_by_project = dict(
-            db.session.query(Project.id, func.coalesce(func.sum(Expense.amount), 0))
-            .join(Expense, Expense.project_id == Project.id)
-            .filter(
-                Expense.tenant_id == tenant_id,
-                Expense.is_deleted == False,
-            )
-            .group_by(Project.id)
-            .all()
-        )
-        project_budgets = dict(
-            db.session.query(Project.id, Project.starting_budget)
-            .filter(Project.tenant_id == tenant_id, Project.is_deleted == False)
-            .all()
-        )
-        over_budget_projects = [
-            pid
-            for pid, total in spend_by_project.items()
-            if pid in project_budgets and float(total or 0) > float(project_budgets[pid] or 0)
-        ]
+        total_spend = results["total_spend"][0][0] or 0
+        top_vendors = results["top_vendors"]
+        breakdown = {key: 0 for key in ALERT_CATEGORIES}
+        breakdown.update({key: count for key, count in results["alert_counts"]})
+
+        # Drilldown rows are only fetched when there is something to show
+        low_balance_accounts = []
+        if breakdown["low_balance_accounts"]:
+            low_balance_accounts = db.session.execute(
+                select(
+                    Account.id, Account.name, Account.current_balance, Account.low_balance_threshold
+                )
+                .where(*_low_balance_criteria(tenant_id))
+                .order_by(Account.current_balance)
+                .limit(ALERT_DRILLDOWN_LIMIT)
+            ).all()
 
-        alert_total = len(low_balance_accounts) + len(projects_ending_soon) + len(over_budget_projects)
+        alert_total = sum(breakdown.values())
 
         return jsonify(
             {
                 "total_spend": float(total_spend),
                 "top_vendors": [{"vendor": v[0], "total": float(v[1])} for v in top_vendors],
                 "low_balance_accounts": [
-                {
-                    "id": a.id,
-                    "name": a.name,
-                    "current_balance": float(a.current_balance or 0),
-                    "threshold": float(a.low_balance_threshold or 0),
+                    {
+                        "id": a.id,
+                        "name": a.name,
+                        "current_balance": float(a.current_balance or 0),
+                        "threshold": float(a.low_balance_threshold or 0),
                     }
                     for a in low_balance_accounts
                 ],
                 "alerts": {
                     "total": alert_total,
                     "unread": alert_total,  # mirror total for now
-                    "breakdown": {
-                        "low_balance_accounts": len(low_balance_accounts),
-                        "projects_ending_soon": len(projects_ending_soon),
-                        "over_budget_projects": len(over_budget_projects),
-                    },
+                    "breakdown": breakdown,
                 },
             }
         ), 200
@@ -1,25 +1,33 @@
 """Expense API endpoints."""
+import uuid
+
 from flask import g, jsonify, request
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_smorest import Blueprint
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, time
 
 from app.core.extensions import db
-from app.models.expense import Expense
+from app.models.account import Account
+from app.models.budget import mark_expense_dates_changed
+from app.models.expense import Expense, ExpenseTag
 from app.models.category import Category
-from app.models.audit import AuditLog, AuditAction
+from app.models.audit import AuditAction
 from app.models.user import User
 from app.models.project import Project
+from app.services.audit import audit_queue
+from app.services.report_cache import mark_projects_changed
 from app.schemas.expense import (
     ExpenseSchema,
+    ExpenseBulkCreateSchema,
     ExpenseCreateSchema,
     ExpenseUpdateSchema,
     ExpenseFilterSchema,
     CategorySchema,
 )
 from app.utils.decorators import jwt_required_with_tenant, require_role
+from app.utils.pagination import keyset_paginate
 from app.models.user import UserRole
 
 blp = Blueprint("expenses", __name__, url_prefix="/expenses", description="Expense operations")
@@ -33,7 +41,12 @@ class ExpenseList(MethodView):
     @blp.arguments(ExpenseFilterSchema, location="query")
     @blp.response(200)
     def get(self, filter_args):
-        """Get list of expenses with filtering and pagination."""
+        """
+        Get list of expenses with filtering and pagination.
+        
+        Passing ``cursor`` (empty for the first page) switches to keyset
+        pagination; follow ``pagination.next_cursor`` for subsequent pages.
+        """
         user_id = get_jwt_identity()
         tenant_id = g.get("tenant_id")
 
@@ -56,6 +69,16 @@ class ExpenseList(MethodView):
             query = query.filter(Expense.expense_date >= filter_args["start_date"])
         if filter_args.get("end_date"):
             query = query.filter(Expense.expense_date <= filter_args["end_date"])
+        if filter_args.get("tags"):
+            # Expenses carrying any of the tags, via the (tenant_id, tag) index
+            query = query.filter(
+                Expense.id.in_(
+                    db.select(ExpenseTag.expense_id).filter(
+                        ExpenseTag.tenant_id == tenant_id,
+                        ExpenseTag.tag.in_(filter_args["tags"]),
+                    )
+                )
+            )
 
         # Pagination
         page = filter_args.get("page", 1)
@@ -64,6 +87,30 @@ class ExpenseList(MethodView):
         # Sorting
         sort_by = filter_args.get("sort_by", "expense_date")
         sort_order = filter_args.get("sort_order", "desc")
+
+        # Keyset pagination: seek past (sort value, id) instead of OFFSET
+        if "cursor" in filter_args:
+            try:
+                items, next_cursor = keyset_paginate(
+                    query,
+                    [getattr(Expense, sort_by), Expense.id],
+                    per_page,
+                    cursor=filter_args["cursor"],
+                    descending=sort_order == "desc",
+                )
+            except ValueError:
+                return jsonify({"error": "Invalid cursor"}), 400
+
+            return jsonify(
+                {
+                    "expenses": ExpenseSchema(many=True).dump(items),
+                    "pagination": {
+                        "per_page": per_page,
+                        "next_cursor": next_cursor,
+                        "has_next": next_cursor is not None,
+                    },
+                }
+            )
         
         sort_column = getattr(Expense, sort_by)
         if sort_order == "desc":
@@ -98,12 +145,12 @@ class ExpenseList(MethodView):
         db.session.add(expense)
         db.session.commit()
 
-        # Log audit trail
+        # Log audit trail (written in the background)
         g.user_id = user_id
-        AuditLog.log_action(
+        audit_queue.log_action(
             action=AuditAction.CREATE,
-            resource_type="expense",
-            resource_id=expense.id,
+            entity_type="expense",
+            entity_id=expense.id,
             new_values=data,
         )
 
@@ -112,6 +159,116 @@ class ExpenseList(MethodView):
         return jsonify(ExpenseSchema().dump(expense)), 201
 
 
+@blp.route("/bulk")
+class ExpenseBulk(MethodView):
+    """Bulk expense import endpoint (CSV upload, OCR receipts)."""
+
+    @jwt_required()
+    @blp.arguments(ExpenseBulkCreateSchema(many=True))
+    @blp.response(201)
+    def post(self, data):
+        """
+        Create many expenses with a single INSERT and commit.
+        
+        Rows skip the unit of work, so what flush listeners normally do
+        for a new expense happens here: references are checked against
+        the tenant, each account is debited once for its rows, and the
+        affected budget snapshots and report caches are queued for refresh.
+        """
+        user_id = get_jwt_identity()
+        tenant_id = g.get("tenant_id")
+
+        if not data:
+            return jsonify({"error": "At least one expense is required"}), 400
+
+        account_ids = {item["account_id"] for item in data}
+        project_ids = {item["project_id"] for item in data}
+        category_ids = {item["category_id"] for item in data if item.get("category_id")}
+
+        accounts = {
+            account.id: account
+            for account in db.session.query(Account)
+            .filter(
+                Account.id.in_(account_ids),
+                Account.tenant_id == tenant_id,
+                Account.is_active == True,
+                Account.is_deleted == False,
+            )
+            .with_for_update()
+        }
+        found_projects = set(
+            db.session.scalars(
+                db.select(Project.id).filter(
+                    Project.id.in_(project_ids),
+                    Project.tenant_id == tenant_id,
+                    Project.is_deleted == False,
+                )
+            )
+        )
+        category_projects = dict(
+            db.session.execute(
+                db.select(Category.id, Category.project_id).filter(
+                    Category.id.in_(category_ids),
+                    Category.tenant_id == tenant_id,
+                    Category.is_deleted == False,
+                )
+            ).all()
+        )
+
+        errors = {}
+        for index, item in enumerate(data):
+            if item["account_id"] not in accounts:
+                errors.setdefault(index, []).append("Account not found or inactive")
+            if item["project_id"] not in found_projects:
+                errors.setdefault(index, []).append("Project not found")
+            category_id = item.get("category_id")
+            if category_id and category_projects.get(category_id) != item["project_id"]:
+                errors.setdefault(index, []).append("Category must belong to the project")
+        if errors:
+            return jsonify({"error": "Invalid expenses", "details": errors}), 400
+
+        rows = []
+        tag_rows = []
+        debits = {}
+        for item in data:
+            row = {
+                **item,
+                "id": str(uuid.uuid4()),
+                "tenant_id": tenant_id,
+                "created_by": user_id,
+                "is_project_related": True,
+                "expense_date": datetime.combine(item["expense_date"], time.min),
+            }
+            tag_rows.extend(
+                {"expense_id": row["id"], "tenant_id": tenant_id, "tag": tag}
+                for tag in set(row.pop("tags"))
+            )
+            debits[row["account_id"]] = debits.get(row["account_id"], 0) + row["amount"]
+            rows.append(row)
+
+        db.session.bulk_insert_mappings(Expense, rows)
+        if tag_rows:
+            db.session.bulk_insert_mappings(ExpenseTag, tag_rows)
+        for account_id, amount in debits.items():
+            accounts[account_id].debit(amount, commit=False)
+
+        mark_projects_changed(db.session, tenant_id, project_ids)
+        mark_expense_dates_changed(db.session, tenant_id, [row["expense_date"] for row in rows])
+        db.session.commit()
+
+        # One batched audit write for the whole import
+        g.user_id = user_id
+        audit_queue.log_actions(
+            AuditAction.CREATE,
+            "expense",
+            {row["id"]: item for row, item in zip(rows, data)},
+        )
+
+        logger.info("Bulk expenses created", count=len(rows), user_id=user_id)
+
+        return jsonify({"ids": [row["id"] for row in rows], "count": len(rows)}), 201
+
+
 @blp.route("/<expense_id>")
 class ExpenseDetail(MethodView):
     """Individual expense endpoint."""
@@ -150,7 +307,8 @@ class ExpenseDetail(MethodView):
 
         changed = False
         for key, value in data.items():
-            if getattr(expense, key) != value:
+            # Tags are a set on the model; compare as one
+            if getattr(expense, key) != (set(value) if key == "tags" else value):
                 setattr(expense, key, value)
                 changed = True
 
@@ -175,12 +333,12 @@ class ExpenseDetail(MethodView):
         expense.updated_by = user_id
         db.session.commit()
 
-        # Log audit trail
+        # Log audit trail (written in the background)
         g.user_id = user_id
-        AuditLog.log_action(
+        audit_queue.log_action(
             action=AuditAction.UPDATE,
-            resource_type="expense",
-            resource_id=expense.id,
+            entity_type="expense",
+            entity_id=expense.id,
             old_values=old_values,
             new_values=data,
         )
@@ -203,10 +361,10 @@ class ExpenseDetail(MethodView):
 
         expense.delete(soft=True)
 
-        # Log audit trail
+        # Log audit trail (written in the background)
         g.user_id = user_id
-        AuditLog.log_action(
-            action=AuditAction.DELETE, resource_type="expense", resource_id=expense.id
+        audit_queue.log_action(
+            action=AuditAction.DELETE, entity_type="expense", entity_id=expense.id
         )
 
         logger.info(f"Expense deleted", expense_id=expense.id)
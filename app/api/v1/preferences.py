@@ -87,8 +87,8 @@ class UserPreferencesResource(MethodView):
             abort(403, message="You can only update your own preferences")
         
         try:
-            # Get or create preferences
-            prefs = UserPreferences.get_or_create_for_user(user_id)
+            # Get or create preferences (committed together with the update)
+            prefs = UserPreferences.get_or_create_for_user(user_id, commit=False)
             
             # Update fields
             for key, value in update_data.items():
@@ -127,7 +127,7 @@ class CurrentUserPreferences(MethodView):
         user_id = g.user_id
         
         try:
-            prefs = UserPreferences.get_or_create_for_user(user_id)
+            prefs = UserPreferences.get_or_create_for_user(user_id, commit=False)
             
             # Update fields
             for key, value in update_data.items():
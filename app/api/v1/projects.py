@@ -1,23 +1,58 @@
 """Projects API endpoints."""
 from datetime import datetime
+from functools import lru_cache
 
 from flask import g, jsonify, request
 from flask.views import MethodView
 from flask_smorest import Blueprint
 from loguru import logger
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, or_
 
 from app.core.extensions import db
-from app.models.audit import AuditAction, AuditLog
 from app.models.expense import Expense
 from app.models.project import Project
 from app.schemas.project import ProjectCreateSchema, ProjectSchema, ProjectUpdateSchema
 from app.utils.decorators import roles_required
-from app.utils.pagination import paginate
+from app.utils.pagination import keyset_paginate, paginate
 
 blp = Blueprint("projects", __name__, url_prefix="/projects", description="Project management")
 
 
+def _iso(value):
+    """Parse an ISO 8601 query parameter (None when absent)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+@lru_cache(maxsize=16)
+def _project_list_criteria(has_status, has_from_date, has_to_date, has_search):
+    """
+    Build ProjectList WHERE criteria with bound parameters.
+    
+    Cached per combination of active filters so repeated requests reuse the
+    same expression objects (and SQLAlchemy's compiled-statement cache);
+    values are supplied through Query.params().
+    """
+    criteria = [
+        Project.tenant_id == bindparam("tenant_id"),
+        Project.is_deleted == False,
+    ]
+    if has_status:
+        criteria.append(Project.status == bindparam("status"))
+    if has_from_date:
+        criteria.append(Project.start_date >= bindparam("from_date"))
+    if has_to_date:
+        criteria.append(Project.end_date <= bindparam("to_date"))
+    if has_search:
+        # Served by the pg_trgm GIN indexes on name/description
+        criteria.append(
+            or_(
+                Project.name.ilike(bindparam("search")),
+                Project.description.ilike(bindparam("search")),
+            )
+        )
+    return tuple(criteria)
+
+
 @blp.route("")
 class ProjectList(MethodView):
     """Project collection endpoint."""
@@ -35,44 +70,77 @@ class ProjectList(MethodView):
         - search: Search in name/description
         - page: Page number
         - per_page: Items per page
+        - cursor: Use keyset pagination (empty for the first page, then
+          pagination.next_cursor)
         """
         tenant_id = g.get("tenant_id")
         
-        # Build query
-        query = Project.query.filter_by(tenant_id=tenant_id, is_deleted=False)
-        
-        # Apply filters
-        status = request.args.get("status")
-        if status:
-            query = query.filter_by(status=status)
+        # Parse all filter args up front; the WHERE clause is cached per
+        # filter shape and values are bound as parameters
+        args = request.args
+        try:
+            from_date, to_date = _iso(args.get("from_date")), _iso(args.get("to_date"))
+        except ValueError:
+            return jsonify({"error": "Invalid date format", "code": "VALIDATION_ERROR"}), 400
         
-        from_date = request.args.get("from_date")
+        params = {"tenant_id": tenant_id}
+        if args.get("status"):
+            params["status"] = args["status"]
         if from_date:
-            query = query.filter(Project.start_date >= datetime.fromisoformat(from_date))
-        
-        to_date = request.args.get("to_date")
+            params["from_date"] = from_date
         if to_date:
-            query = query.filter(Project.end_date <= datetime.fromisoformat(to_date))
-        
-        search = request.args.get("search")
-        if search:
-            query = query.filter(
-                db.or_(
-                    Project.name.ilike(f"%{search}%"),
-                    Project.description.ilike(f"%{search}%"),
-                )
-            )
+            params["to_date"] = to_date
+        if args.get("search"):
+            params["search"] = f"%{args['search']}%"
         
-        # Order by created_at desc
-        query = query.order_by(Project.created_at.desc())
+        criteria = _project_list_criteria(
+            "status" in params, "from_date" in params, "to_date" in params, "search" in params
+        )
+        query = Project.query.filter(*criteria).params(**params)
         
         # Paginate
         page = int(request.args.get("page", 1))
         per_page = min(int(request.args.get("per_page", 20)), 100)
         
-        result = paginate(query, page, per_page, ProjectSchema())
+        # Keyset pagination: seek past (created_at, id) instead of OFFSET
+        if "cursor" in request.args:
+            try:
+                items, next_cursor = keyset_paginate(
+                    query,
+                    [Project.created_at, Project.id],
+                    per_page,
+                    cursor=request.args["cursor"],
+                )
+            except ValueError:
+                return jsonify({"error": "Invalid cursor"}), 400
+            
+            return jsonify(
+                {
+                    "projects": ProjectSchema(many=True).dump(items),
+                    "pagination": {
+                        "per_page": per_page,
+                        "next_cursor": next_cursor,
+                        "has_next": next_cursor is not None,
+                    },
+                }
+            )
         
-        return jsonify(result)
+        # Order by created_at desc
+        query = query.order_by(Project.created_at.desc())
+        
+        paginated = paginate(query, page, per_page)
+        
+        return jsonify(
+            {
+                "projects": ProjectSchema(many=True).dump(paginated.items),
+                "pagination": {
+                    "page": paginated.page,
+                    "per_page": paginated.per_page,
+                    "total": paginated.total,
+                    "pages": paginated.pages,
+                },
+            }
+        )
 
     @blp.arguments(ProjectCreateSchema)
     @blp.response(201, ProjectSchema)
@@ -94,15 +162,10 @@ class ProjectList(MethodView):
                 status=data.get("status", "active"),
             )
             
+            # Audited automatically (AuditableMixin) in the same transaction
             db.session.add(project)
             db.session.commit()
             
-            AuditLog.log_action(
-                action=AuditAction.CREATE,
-                entity_type="project",
-                entity_id=project.id,
-            )
-            
             logger.info(f"Project created", project_id=project.id, created_by=user_id)
             
             return ProjectSchema().dump(project), 201
@@ -161,26 +224,13 @@ class ProjectDetail(MethodView):
             return jsonify({"error": "Project not found", "code": "NOT_FOUND"}), 404
         
         try:
-            changes = {}
-            
             for field in ["name", "description", "start_date", "end_date", "starting_budget", "projected_estimate", "status"]:
-                if field in data:
-                    old_value = getattr(project, field)
-                    new_value = data[field]
-                    if old_value != new_value:
-                        changes[field] = {"old": str(old_value), "new": str(new_value)}
-                        setattr(project, field, new_value)
+                if field in data and getattr(project, field) != data[field]:
+                    setattr(project, field, data[field])
             
+            # Changed fields are audited on flush (AuditableMixin)
             db.session.commit()
             
-            if changes:
-                AuditLog.log_action(
-                    action=AuditAction.UPDATE,
-                    entity_type="project",
-                    entity_id=project.id,
-                    details={"changes": changes},
-                )
-            
             logger.info(f"Project updated", project_id=project.id)
             
             return ProjectSchema().dump(project)
@@ -208,12 +258,6 @@ class ProjectDetail(MethodView):
             project.deleted_at = datetime.utcnow()
             db.session.commit()
             
-            AuditLog.log_action(
-                action=AuditAction.DELETE,
-                entity_type="project",
-                entity_id=project.id,
-            )
-            
             logger.info(f"Project soft deleted", project_id=project.id)
             
             return "", 204
@@ -1,20 +1,23 @@
 """Reports and analytics API endpoints."""
-import csv
-import io
+import tempfile
+import zlib
 from datetime import datetime, timedelta
 from typing import Optional
 
-from flask import Response, g, jsonify, make_response, request, stream_with_context
+import numpy as np
+from flask import Response, g, jsonify, request, stream_with_context
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from loguru import logger
-from sqlalchemy import and_, extract, func
+from sqlalchemy import Date, and_, cast, extract, func, select
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.extensions import db
 from app.models.account import Account
 from app.models.category import Category
 from app.models.expense import Expense
 from app.models.project import Project
+from app.services.report_cache import cached_report
 from app.utils.decorators import roles_required
 
 blp = Blueprint(
@@ -25,12 +28,65 @@ blp = Blueprint(
 )
 
 
+def _date_series(from_date, to_date):
+    """
+    Build a CTE with one row (column ``day``) per calendar day in the range.
+    
+    Uses generate_series on PostgreSQL and a recursive CTE elsewhere.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        return select(
+            cast(
+                func.generate_series(
+                    cast(from_date, Date), cast(to_date, Date), timedelta(days=1)
+                ),
+                Date,
+            ).label("day")
+        ).cte("days")
+    
+    days = (
+        select(func.date(from_date).label("day"))
+        .where(func.date(from_date) <= func.date(to_date))
+        .cte("days", recursive=True)
+    )
+    return days.union_all(
+        select(func.date(days.c.day, "+1 day")).where(days.c.day < func.date(to_date))
+    )
+
+
+def _cashflow_statement(tenant_id, from_date, to_date):
+    """Build the daily outflow and cumulative net cashflow query."""
+    expense_day = func.date(Expense.expense_date)
+    daily = (
+        select(expense_day.label("day"), func.sum(Expense.amount).label("outflow"))
+        .where(
+            Expense.tenant_id == tenant_id,
+            Expense.expense_date >= from_date,
+            Expense.expense_date <= to_date,
+        )
+        .group_by(expense_day)
+        .subquery()
+    )
+    days = _date_series(from_date, to_date)
+    outflow = func.coalesce(daily.c.outflow, 0)
+    return (
+        select(
+            days.c.day,
+            outflow.label("outflow"),
+            func.sum(-outflow).over(order_by=days.c.day).label("cumulative"),
+        )
+        .select_from(days.outerjoin(daily, daily.c.day == days.c.day))
+        .order_by(days.c.day)
+    )
+
+
 @blp.route("/project/<int:project_id>/summary")
 class ProjectSummaryReport(MethodView):
     """Project summary with burn rate analysis."""
     
     @blp.response(200)
     @roles_required(["admin", "manager", "user"])
+    @cached_report("summary")
     def get(self, project_id):
         """Get project summary report with burn rate calculations."""
         tenant_id = g.current_tenant_id
@@ -43,25 +99,24 @@ class ProjectSummaryReport(MethodView):
         if not project:
             abort(404, message="Project not found")
         
-        # Get all expenses for the project
-        expenses = Expense.query.filter_by(
-            project_id=project_id,
-            tenant_id=tenant_id
-        ).all()
+        # Totals aggregated in the database; COUNT(*) rather than COUNT(id)
+        # keeps this answerable from ix_expenses_proj_amount_covering alone
+        total_spend, expense_count = db.session.query(
+            func.coalesce(func.sum(Expense.amount), 0), func.count()
+        ).select_from(Expense).filter(
+            Expense.project_id == project_id,
+            Expense.tenant_id == tenant_id,
+        ).one()
         
         # Calculate totals
-        total_spend = sum(e.amount for e in expenses)
         starting_budget = project.starting_budget or 0
         projected_estimate = project.projected_estimate or starting_budget
         remaining_budget = starting_budget - total_spend
-        expense_count = len(expenses)
         budget_utilization = (total_spend / starting_budget * 100) if starting_budget > 0 else 0
         
         # Calculate burn rate (last 30 days)
         now = datetime.utcnow()
         start_date = now - timedelta(days=30)
-        
-        recent_expenses = [e for e in expenses if e.expense_date >= start_date]
         days_elapsed = (now - start_date).days or 1
         
         daily_burn_rate = total_spend / days_elapsed if days_elapsed > 0 else 0
@@ -75,23 +130,26 @@ class ProjectSummaryReport(MethodView):
             days_remaining = int(remaining_budget / daily_burn_rate)
             projected_completion_date = (now + timedelta(days=days_remaining)).isoformat()
         
-        # Build burn rate chart data (daily spend over last 30 days)
-        chart_data = []
-        cumulative = 0
+        # Daily spend over the last 30 days, one row per day with spend
+        expense_day = func.date(Expense.expense_date)
+        daily_rows = (
+            db.session.query(expense_day, func.sum(Expense.amount))
+            .filter(
+                Expense.project_id == project_id,
+                Expense.tenant_id == tenant_id,
+                Expense.expense_date >= start_date,
+            )
+            .group_by(expense_day)
+            .all()
+        )
+        # func.date() yields a date on PostgreSQL and a string on SQLite
+        daily_map = {str(day): amount for day, amount in daily_rows}
         
-        for i in range(30):
-            date = start_date + timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            
-            daily_expenses = [e for e in recent_expenses if e.expense_date.date() == date.date()]
-            daily_total = sum(e.amount for e in daily_expenses)
-            cumulative += daily_total
-            
-            chart_data.append({
-                "date": date_str,
-                "daily": round(daily_total, 2),
-                "cumulative": round(cumulative, 2)
-            })
+        # Build burn rate chart data, filling days without spend with zero
+        chart_labels = [
+            (start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30)
+        ]
+        daily_totals = np.array([float(daily_map.get(d, 0)) for d in chart_labels])
         
         return {
             "project": {
@@ -116,9 +174,9 @@ class ProjectSummaryReport(MethodView):
                 "days_remaining": days_remaining
             },
             "burn_rate_chart": {
-                "labels": [d["date"] for d in chart_data],
-                "daily": [d["daily"] for d in chart_data],
-                "cumulative": [d["cumulative"] for d in chart_data]
+                "labels": chart_labels,
+                "daily": np.round(daily_totals, 2).tolist(),
+                "cumulative": np.round(np.cumsum(daily_totals), 2).tolist()
             }
         }
 
@@ -129,6 +187,7 @@ class ProjectCategoryBreakdownReport(MethodView):
     
     @blp.response(200)
     @roles_required(["admin", "manager", "user"])
+    @cached_report("category-breakdown")
     def get(self, project_id):
         """Get category breakdown with donut chart data."""
         tenant_id = g.current_tenant_id
@@ -141,9 +200,9 @@ class ProjectCategoryBreakdownReport(MethodView):
         if not project:
             abort(404, message="Project not found")
         
-        # Get category breakdown
-        breakdown_query = (
-            db.session.query(
+        # Get category breakdown (Core select: plain Row tuples, no ORM hydration)
+        breakdown_stmt = (
+            select(
                 Category.id.label("category_id"),
                 Category.name.label("category_name"),
                 Category.color.label("category_color"),
@@ -152,14 +211,14 @@ class ProjectCategoryBreakdownReport(MethodView):
             )
             .select_from(Expense)
             .outerjoin(Category, Expense.category_id == Category.id)
-            .filter(
+            .where(
                 Expense.project_id == project_id,
                 Expense.tenant_id == tenant_id
             )
             .group_by(Category.id, Category.name, Category.color)
         )
         
-        results = breakdown_query.all()
+        results = db.session.execute(breakdown_stmt).all()
         
         # Calculate total spend
         total_spend = sum(r.total for r in results)
@@ -202,6 +261,7 @@ class ProjectMonthlyTrendReport(MethodView):
     
     @blp.response(200)
     @roles_required(["admin", "manager", "user"])
+    @cached_report("monthly-trend")
     def get(self, project_id):
         """Get monthly trend report grouped by category or account."""
         tenant_id = g.current_tenant_id
@@ -218,82 +278,78 @@ class ProjectMonthlyTrendReport(MethodView):
         if not project:
             abort(404, message="Project not found")
         
-        # Build query based on group_by
+        # Monthly totals per group in one aggregate over the expenses alone;
+        # the year filter is a plain range so it can use the
+        # (tenant_id, project_id, expense_date) index
         if group_by == "category":
-            trend_query = (
-                db.session.query(
-                    extract("month", Expense.expense_date).label("month"),
-                    Category.id.label("group_id"),
-                    Category.name.label("group_name"),
-                    Category.color.label("group_color"),
-                    func.sum(Expense.amount).label("total")
-                )
-                .select_from(Expense)
-                .outerjoin(Category, Expense.category_id == Category.id)
-                .filter(
-                    Expense.project_id == project_id,
-                    Expense.tenant_id == tenant_id,
-                    extract("year", Expense.expense_date) == year
-                )
-                .group_by("month", Category.id, Category.name, Category.color)
-                .order_by("month")
-            )
+            group_column, group_model = Expense.category_id, Category
         else:  # account
-            trend_query = (
-                db.session.query(
-                    extract("month", Expense.expense_date).label("month"),
-                    Account.id.label("group_id"),
-                    Account.name.label("group_name"),
-                    func.sum(Expense.amount).label("total")
-                )
-                .select_from(Expense)
-                .join(Account, Expense.account_id == Account.id)
-                .filter(
-                    Expense.project_id == project_id,
-                    Expense.tenant_id == tenant_id,
-                    extract("year", Expense.expense_date) == year
-                )
-                .group_by("month", Account.id, Account.name)
-                .order_by("month")
+            group_column, group_model = Expense.account_id, Account
+        
+        month = extract("month", Expense.expense_date)
+        trend_stmt = (
+            select(
+                month.label("month"),
+                group_column.label("group_id"),
+                func.sum(Expense.amount).label("total")
             )
-        
-        results = trend_query.all()
+            .where(
+                Expense.project_id == project_id,
+                Expense.tenant_id == tenant_id,
+                Expense.expense_date >= datetime(year, 1, 1),
+                Expense.expense_date < datetime(year + 1, 1, 1)
+            )
+            .group_by(month, group_column)
+            .order_by(month)
+        )
+        results = db.session.execute(trend_stmt).all()
+        
+        # Resolve group names/colors with a single lookup (accounts have no color)
+        group_ids = {r.group_id for r in results if r.group_id}
+        lookup = {}
+        if group_ids:
+            color = getattr(group_model, "color", None)
+            lookup_stmt = select(
+                group_model.id, group_model.name, *([color.label("color")] if color is not None else [])
+            ).where(group_model.id.in_(group_ids))
+            lookup = {row.id: row for row in db.session.execute(lookup_stmt)}
         
         # Initialize 12 months
         months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        monthly_totals = [0] * 12
+        monthly_totals = np.zeros(12)
         
         # Group data by group_id
         groups = {}
         for r in results:
             month_idx = int(r.month) - 1
-            group_id = r.group_id or 0
-            group_name = r.group_name or "Uncategorized"
+            group = lookup.get(r.group_id)
+            group_id = group.id if group else 0
             
             if group_id not in groups:
                 groups[group_id] = {
-                    "name": group_name,
-                    "color": getattr(r, "group_color", None) or "#6b7280",
-                    "data": [0] * 12
+                    "name": group.name if group and group.name else "Uncategorized",
+                    "color": getattr(group, "color", None) or "#6b7280",
+                    "data": np.zeros(12)
                 }
             
-            groups[group_id]["data"][month_idx] += r.total
-            monthly_totals[month_idx] += r.total
+            groups[group_id]["data"][month_idx] += float(r.total)
+            monthly_totals[month_idx] += float(r.total)
         
         # Build datasets for stacked bar chart
         datasets = []
         for group_id, group_data in groups.items():
             datasets.append({
                 "label": group_data["name"],
-                "data": [round(v, 2) for v in group_data["data"]],
+                "data": np.round(group_data["data"], 2).tolist(),
                 "backgroundColor": group_data["color"]
             })
         
         # Calculate summary
-        total_spend = sum(monthly_totals)
+        total_spend = float(monthly_totals.sum())
         average_monthly = total_spend / 12
-        highest_month = max(monthly_totals)
-        lowest_month = min([m for m in monthly_totals if m > 0], default=0)
+        highest_month = float(monthly_totals.max())
+        spent_months = monthly_totals[monthly_totals > 0]
+        lowest_month = float(spent_months.min()) if spent_months.size else 0
         
         return {
             "project_id": project_id,
@@ -302,7 +358,7 @@ class ProjectMonthlyTrendReport(MethodView):
             "chart": {
                 "labels": months,
                 "datasets": datasets,
-                "monthly_totals": [round(v, 2) for v in monthly_totals]
+                "monthly_totals": np.round(monthly_totals, 2).tolist()
             },
             "summary": {
                 "total_spend": round(total_spend, 2),
@@ -323,82 +379,35 @@ class TenantCashflowReport(MethodView):
         """Get tenant cashflow with inflow/outflow analysis."""
         tenant_id = g.current_tenant_id
         
-        # Query params for date range
-        from_date_str = request.args.get("from")
-        to_date_str = request.args.get("to")
+        # Query params for date range, parsed once
+        try:
+            from_arg = _iso(request.args.get("from"))
+            to_arg = _iso(request.args.get("to"))
+        except ValueError:
+            abort(400, message="Invalid date format")
         
         # Default to last 90 days
-        to_date = datetime.utcnow()
-        from_date = to_date - timedelta(days=90)
-        
-        if from_date_str:
-            try:
-                from_date = datetime.fromisoformat(from_date_str)
-            except ValueError:
-                abort(400, message="Invalid from date format")
-        
-        if to_date_str:
-            try:
-                to_date = datetime.fromisoformat(to_date_str)
-            except ValueError:
-                abort(400, message="Invalid to date format")
-        
-        # Get daily outflow (expenses)
-        daily_query = (
-            db.session.query(
-                func.date(Expense.expense_date).label("date"),
-                func.sum(Expense.amount).label("outflow")
-            )
-            .filter(
-                Expense.tenant_id == tenant_id,
-                Expense.expense_date >= from_date,
-                Expense.expense_date <= to_date
-            )
-            .group_by(func.date(Expense.expense_date))
-            .order_by("date")
-        )
-        
-        results = daily_query.all()
-        
-        # Build daily data
-        daily_data = {}
-        for r in results:
-            daily_data[r.date.isoformat()] = {
-                "inflow": 0,  # Future feature
-                "outflow": r.outflow
-            }
+        now = datetime.utcnow()
+        to_date = to_arg or now
+        from_date = from_arg or now - timedelta(days=90)
         
-        # Fill in missing dates
-        current_date = from_date.date()
-        end_date = to_date.date()
+        # Every day in the range with its outflow and running net, built in
+        # one statement (date series LEFT JOIN daily totals + window SUM)
+        rows = db.session.execute(_cashflow_statement(tenant_id, from_date, to_date)).all()
         
-        chart_labels = []
-        inflow_data = []
-        outflow_data = []
-        net_data = []
-        cumulative_data = []
-        cumulative = 0
+        chart_labels = [str(r.day) for r in rows]
+        inflow = np.zeros(len(rows))  # Future feature
+        outflow = np.array([float(r.outflow) for r in rows])
+        cumulative = np.array([float(r.cumulative) for r in rows])
         
-        while current_date <= end_date:
-            date_str = current_date.isoformat()
-            chart_labels.append(date_str)
-            
-            day_data = daily_data.get(date_str, {"inflow": 0, "outflow": 0})
-            inflow = day_data["inflow"]
-            outflow = day_data["outflow"]
-            net = inflow - outflow
-            cumulative += net
-            
-            inflow_data.append(round(inflow, 2))
-            outflow_data.append(round(outflow, 2))
-            net_data.append(round(net, 2))
-            cumulative_data.append(round(cumulative, 2))
-            
-            current_date += timedelta(days=1)
+        inflow_data = np.round(inflow, 2).tolist()
+        outflow_data = np.round(outflow, 2).tolist()
+        net_data = np.round(inflow - outflow, 2).tolist()
+        cumulative_data = np.round(cumulative, 2).tolist()
         
         # Calculate summary
-        total_inflow = sum(inflow_data)
-        total_outflow = sum(outflow_data)
+        total_inflow = float(inflow.sum())
+        total_outflow = float(outflow.sum())
         net_cashflow = total_inflow - total_outflow
         days = len(chart_labels)
         average_daily_outflow = total_outflow / days if days > 0 else 0
@@ -425,72 +434,118 @@ class TenantCashflowReport(MethodView):
         }
 
 
-@blp.route("/export/csv")
-@roles_required(["admin", "manager", "user"])
-def export_csv():
-    """Export expenses to CSV."""
-    tenant_id = g.current_tenant_id
+def _csv_field(value: Optional[str]) -> bytes:
+    """Encode a CSV field, quoting only when needed (as csv.QUOTE_MINIMAL does)."""
+    if not value:
+        return b""
+    if any(ch in value for ch in ',"\r\n'):
+        value = '"%s"' % value.replace('"', '""')
+    return value.encode("utf-8")
+
+
+def _iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 query parameter (None when absent)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _export_query(tenant_id):
+    """
+    Build the streamed expense export query from request args.
     
-    # Query params for filtering
+    Query params: project_id, from, to (unparseable dates are ignored).
+    """
     project_id = request.args.get("project_id", type=int)
-    from_date_str = request.args.get("from")
-    to_date_str = request.args.get("to")
+    dates = []
+    for arg in ("from", "to"):
+        try:
+            dates.append(_iso(request.args.get(arg)))
+        except ValueError:
+            dates.append(None)
+    from_date, to_date = dates
     
-    # Build query
-    query = Expense.query.filter_by(tenant_id=tenant_id)
+    # Related names loaded in bulk; any other lazy load raises
+    query = Expense.query.options(
+        selectinload(Expense.category),
+        selectinload(Expense.project),
+        selectinload(Expense.account),
+        raiseload("*"),
+    ).filter_by(tenant_id=tenant_id)
     
     if project_id:
         query = query.filter_by(project_id=project_id)
+    if from_date:
+        query = query.filter(Expense.expense_date >= from_date)
+    if to_date:
+        query = query.filter(Expense.expense_date <= to_date)
     
-    if from_date_str:
-        try:
-            from_date = datetime.fromisoformat(from_date_str)
-            query = query.filter(Expense.expense_date >= from_date)
-        except ValueError:
-            pass
+    return query.order_by(Expense.expense_date.desc()).yield_per(1000)
+
+
+def _iter_file(fileobj, chunk_size: int = 64 * 1024):
+    """Yield a file's contents in chunks, closing it when done."""
+    try:
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+def _gzip_stream(chunks, compresslevel: int = 1):
+    """
+    Gzip-compress a byte stream chunk by chunk.
     
-    if to_date_str:
-        try:
-            to_date = datetime.fromisoformat(to_date_str)
-            query = query.filter(Expense.expense_date <= to_date)
-        except ValueError:
-            pass
+    Level 1 keeps compression cheap enough to run inline while still
+    shrinking CSV text several times over.
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@blp.route("/export/csv")
+@roles_required(["admin", "manager", "user"])
+def export_csv():
+    """Export expenses to CSV."""
+    tenant_id = g.current_tenant_id
     
-    expenses = query.order_by(Expense.expense_date.desc()).all()
+    # Stream rows from a server-side cursor in batches instead of
+    # materializing the whole result set
+    expenses = _export_query(tenant_id)
     
-    # Generate CSV
+    # Generate CSV, one pre-encoded line per row
     def generate():
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            "Date", "Vendor", "Amount", "Currency", "Category", 
-            "Project", "Account", "Note", "Created At"
-        ])
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
+        yield b"Date,Vendor,Amount,Currency,Category,Project,Account,Note,Created At\r\n"
         
         # Data rows
         for expense in expenses:
-            writer.writerow([
-                expense.expense_date.strftime("%Y-%m-%d"),
-                expense.vendor or "",
-                expense.amount,
-                expense.currency or "USD",
-                expense.category.name if expense.category else "",
-                expense.project.name if expense.project else "",
-                expense.account.name if expense.account else "",
-                expense.note or "",
-                expense.created_at.strftime("%Y-%m-%d %H:%M:%S")
-            ])
-            yield output.getvalue()
-            output.seek(0)
-            output.truncate(0)
+            yield b"%s,%s,%s,%s,%s,%s,%s,%s,%s\r\n" % (
+                expense.expense_date.strftime("%Y-%m-%d").encode(),
+                _csv_field(expense.vendor),
+                str(expense.amount).encode(),
+                _csv_field(expense.currency or "USD"),
+                _csv_field(expense.category.name if expense.category else None),
+                _csv_field(expense.project.name if expense.project else None),
+                _csv_field(expense.account.name if expense.account else None),
+                _csv_field(expense.note),
+                expense.created_at.strftime("%Y-%m-%d %H:%M:%S").encode(),
+            )
     
-    response = Response(stream_with_context(generate()), mimetype="text/csv")
+    body = generate()
+    gzipped = request.accept_encodings["gzip"] > 0
+    if gzipped:
+        body = _gzip_stream(body)
+    
+    response = Response(stream_with_context(body), mimetype="text/csv")
     response.headers["Content-Disposition"] = "attachment; filename=expenses_export.csv"
+    response.vary.add("Accept-Encoding")
+    if gzipped:
+        response.headers["Content-Encoding"] = "gzip"
     
     return response
 
@@ -500,81 +555,56 @@ def export_csv():
 def export_xlsx():
     """Export expenses to Excel."""
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill
+        import xlsxwriter
     except ImportError:
-        abort(501, message="openpyxl not installed. Run: pip install openpyxl")
+        abort(501, message="xlsxwriter not installed. Run: pip install xlsxwriter")
     
     tenant_id = g.current_tenant_id
     
-    # Query params for filtering
-    project_id = request.args.get("project_id", type=int)
-    from_date_str = request.args.get("from")
-    to_date_str = request.args.get("to")
-    
-    # Build query
-    query = Expense.query.filter_by(tenant_id=tenant_id)
+    expenses = _export_query(tenant_id)
     
-    if project_id:
-        query = query.filter_by(project_id=project_id)
-    
-    if from_date_str:
-        try:
-            from_date = datetime.fromisoformat(from_date_str)
-            query = query.filter(Expense.expense_date >= from_date)
-        except ValueError:
-            pass
-    
-    if to_date_str:
-        try:
-            to_date = datetime.fromisoformat(to_date_str)
-            query = query.filter(Expense.expense_date <= to_date)
-        except ValueError:
-            pass
-    
-    expenses = query.order_by(Expense.expense_date.desc()).all()
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Expenses"
+    # constant_memory flushes each row to a temp file as soon as the next
+    # row starts, so memory stays flat regardless of row count. Cell text
+    # is user input: never turn it into formulas or hyperlinks. The finished
+    # file stays in memory up to 16MB and spills to disk beyond that.
+    output = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+    wb = xlsxwriter.Workbook(
+        output,
+        {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False},
+    )
+    ws = wb.add_worksheet("Expenses")
     
     # Header styling
-    header_fill = PatternFill(start_color="3b82f6", end_color="3b82f6", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
+    header_format = wb.add_format({"bold": True, "bg_color": "#3b82f6", "font_color": "#FFFFFF"})
     
     # Headers
     headers = ["Date", "Vendor", "Amount", "Currency", "Category", 
                "Project", "Account", "Note", "Created At"]
     
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
+    ws.set_column(0, len(headers) - 1, 15)
+    ws.write_row(0, 0, headers, header_format)
     
     # Data rows
-    for row_idx, expense in enumerate(expenses, 2):
-        ws.cell(row=row_idx, column=1, value=expense.expense_date.strftime("%Y-%m-%d"))
-        ws.cell(row=row_idx, column=2, value=expense.vendor or "")
-        ws.cell(row=row_idx, column=3, value=expense.amount)
-        ws.cell(row=row_idx, column=4, value=expense.currency or "USD")
-        ws.cell(row=row_idx, column=5, value=expense.category.name if expense.category else "")
-        ws.cell(row=row_idx, column=6, value=expense.project.name if expense.project else "")
-        ws.cell(row=row_idx, column=7, value=expense.account.name if expense.account else "")
-        ws.cell(row=row_idx, column=8, value=expense.note or "")
-        ws.cell(row=row_idx, column=9, value=expense.created_at.strftime("%Y-%m-%d %H:%M:%S"))
-    
-    # Adjust column widths
-    for col_idx in range(1, len(headers) + 1):
-        ws.column_dimensions[chr(64 + col_idx)].width = 15
+    for row_idx, expense in enumerate(expenses, 1):
+        ws.write_row(row_idx, 0, [
+            expense.expense_date.strftime("%Y-%m-%d"),
+            expense.vendor or "",
+            expense.amount,
+            expense.currency or "USD",
+            expense.category.name if expense.category else "",
+            expense.project.name if expense.project else "",
+            expense.account.name if expense.account else "",
+            expense.note or "",
+            expense.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        ])
     
-    # Save to BytesIO
-    output = io.BytesIO()
-    wb.save(output)
+    wb.close()
     output.seek(0)
     
-    response = make_response(output.getvalue())
-    response.headers["Content-Type"] = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    response = Response(
+        _iter_file(output),
+        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
     response.headers["Content-Disposition"] = "attachment; filename=expenses_export.xlsx"
     
     return response
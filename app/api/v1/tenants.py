@@ -3,15 +3,21 @@ from flask import g, jsonify
 from flask.views import MethodView
 from flask_smorest import Blueprint
 from loguru import logger
+from sqlalchemy.exc import IntegrityError
 
 from app.core.extensions import db
 from app.models.tenant import Tenant, TenantDomain
 from app.schemas.tenant import TenantSchema, TenantUpdateSchema
+from app.services.tenant_cache import get_cached_tenant
 from app.utils.decorators import roles_required
+from app.utils.etag import conditional_json
 
 blp = Blueprint("tenants", __name__, url_prefix="/tenants", description="Tenant management")
 
 
+_tenant_schema = TenantSchema()  # reused across requests
+
+
 @blp.route("")
 class TenantList(MethodView):
     """Tenant creation endpoint."""
@@ -25,19 +31,6 @@ class TenantList(MethodView):
         
         Note: Most users should use /api/v1/auth/register instead.
         """
-        # Check if subdomain already exists
-        existing = Tenant.query.filter_by(subdomain=data["subdomain"]).first()
-        if existing:
-            return (
-                jsonify(
-                    {
-                        "error": "Subdomain already taken",
-                        "code": "SUBDOMAIN_EXISTS",
-                    }
-                ),
-                409,
-            )
-
         try:
             tenant = Tenant(
                 name=data["name"],
@@ -49,8 +42,20 @@ class TenantList(MethodView):
 
             logger.info(f"Tenant created", tenant_id=tenant.id, subdomain=tenant.subdomain)
 
-            return TenantSchema().dump(tenant), 201
+            return _tenant_schema.dump(tenant), 201
 
+        except IntegrityError:
+            # The unique index on subdomain rejects duplicates, race-free
+            db.session.rollback()
+            return (
+                jsonify(
+                    {
+                        "error": "Subdomain already taken",
+                        "code": "SUBDOMAIN_EXISTS",
+                    }
+                ),
+                409,
+            )
         except Exception as e:
             db.session.rollback()
             logger.error(f"Tenant creation error: {e}")
@@ -81,11 +86,17 @@ class TenantDetail(MethodView):
                 403,
             )
 
-        tenant = Tenant.query.filter_by(id=tenant_id).first()
-        if not tenant:
+        def load_tenant():
+            tenant = Tenant.query.filter_by(id=tenant_id).first()
+            return _tenant_schema.dump(tenant) if tenant else None
+
+        # Cached briefly; dropped when the tenant row is committed
+        result = get_cached_tenant(tenant_id, load_tenant)
+        if result is None:
             return jsonify({"error": "Tenant not found", "code": "NOT_FOUND"}), 404
 
-        return TenantSchema().dump(tenant)
+        # 304 when the client's copy is current
+        return conditional_json(result["updated_at"], lambda: result)
 
     @blp.arguments(TenantUpdateSchema)
     @blp.response(200, TenantSchema)
@@ -119,7 +130,7 @@ class TenantDetail(MethodView):
 
             logger.info(f"Tenant updated", tenant_id=tenant.id)
 
-            return TenantSchema().dump(tenant)
+            return _tenant_schema.dump(tenant)
 
         except Exception as e:
             db.session.rollback()
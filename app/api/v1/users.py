@@ -3,17 +3,101 @@ from flask import g, jsonify, request
 from flask.views import MethodView
 from flask_smorest import Blueprint
 from loguru import logger
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import load_only, raiseload
 
 from app.core.extensions import db
 from app.models.audit import AuditAction, AuditLog
 from app.models.user import User
 from app.schemas.user import UserRoleUpdateSchema, UserSchema, UserUpdateSchema
 from app.utils.decorators import roles_required
-from app.utils.pagination import paginate
+from app.utils.etag import conditional_json
+from app.utils.pagination import keyset_paginate, paginate
 
 blp = Blueprint("users", __name__, url_prefix="/users", description="User management")
 
 
+# Schemas are stateless for dump(); build them once per process
+_user_schema = UserSchema()
+_users_schema = UserSchema(many=True)
+
+# Columns UserSchema reads; the list skips password hashes and bookkeeping
+_USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.avatar_url,
+    User.role,
+    User.is_active,
+    User.is_verified,
+    User.last_login_at,
+    User.preferences,
+    User.created_at,
+    User.updated_at,
+)
+
+
+# Built once so detail lookups always hit SQLAlchemy's compiled-statement cache
+_USER_BY_ID = select(User).where(
+    User.id == bindparam("user_id"),
+    User.tenant_id == bindparam("tenant_id"),
+    User.is_deleted == False,
+)
+
+
+def _get_user(user_id, tenant_id):
+    """Load a non-deleted user in the tenant (None if not found)."""
+    return db.session.execute(
+        _USER_BY_ID, {"user_id": user_id, "tenant_id": tenant_id}
+    ).scalar_one_or_none()
+
+
+def _update_user(user_id, tenant_id, **values):
+    """Update a user with a single UPDATE ... RETURNING (None if not found)."""
+    stmt = (
+        update(User)
+        .where(User.id == user_id, User.tenant_id == tenant_id)
+        .values(**values)
+        .returning(User)
+    )
+    return db.session.execute(stmt).scalar_one_or_none()
+
+
+def _change_user_role(user_id, tenant_id, new_role):
+    """
+    Set a user's role and return (user, old_role), or (None, None) if not found.
+    
+    On PostgreSQL the previous role comes back from the same UPDATE through a
+    locked FROM subquery; other backends cannot RETURN columns of a joined
+    table, so they read the row first.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        old = (
+            select(User.id, User.role.label("old_role"))
+            .where(User.id == user_id, User.tenant_id == tenant_id)
+            .with_for_update()
+            .subquery()
+        )
+        stmt = (
+            update(User)
+            .where(User.id == old.c.id)
+            .values(role=new_role)
+            .returning(User, old.c.old_role)
+        )
+        row = db.session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        ).one_or_none()
+        return (row[0], row[1]) if row else (None, None)
+    
+    user = User.query.filter_by(id=user_id, tenant_id=tenant_id).first()
+    if not user:
+        return None, None
+    old_role = user.role
+    user.role = new_role
+    return user, old_role
+
+
 @blp.route("")
 class UserList(MethodView):
     """User listing endpoint."""
@@ -29,11 +113,17 @@ class UserList(MethodView):
         - is_active: Filter by active status
         - page: Page number (default 1)
         - per_page: Items per page (default 20, max 100)
+        - cursor: Use keyset pagination (empty for the first page, then
+          pagination.next_cursor)
         """
         tenant_id = g.get("tenant_id")
         
-        # Build query
-        query = User.query.filter_by(tenant_id=tenant_id, is_deleted=False)
+        # Build query. Load only what UserSchema dumps and block lazy loads:
+        # a column or relationship added to the schema later fails loudly
+        # here instead of silently issuing one SELECT per row.
+        query = User.query.options(
+            load_only(*_USER_LIST_COLUMNS, raiseload=True), raiseload("*")
+        ).filter_by(tenant_id=tenant_id, is_deleted=False)
         
         # Apply filters
         role_filter = request.args.get("role")
@@ -44,16 +134,49 @@ class UserList(MethodView):
         if is_active is not None:
             query = query.filter_by(is_active=is_active.lower() == 'true')
         
-        # Order by created_at desc
-        query = query.order_by(User.created_at.desc())
-        
         # Paginate
         page = int(request.args.get("page", 1))
         per_page = min(int(request.args.get("per_page", 20)), 100)
         
-        result = paginate(query, page, per_page, UserSchema())
+        # Keyset pagination: seek past (created_at, id) instead of OFFSET
+        if "cursor" in request.args:
+            try:
+                items, next_cursor = keyset_paginate(
+                    query,
+                    [User.created_at, User.id],
+                    per_page,
+                    cursor=request.args["cursor"],
+                )
+            except ValueError:
+                return jsonify({"error": "Invalid cursor", "code": "VALIDATION_ERROR"}), 400
+            
+            return jsonify(
+                {
+                    "users": _users_schema.dump(items),
+                    "pagination": {
+                        "per_page": per_page,
+                        "next_cursor": next_cursor,
+                        "has_next": next_cursor is not None,
+                    },
+                }
+            )
+        
+        # Order by created_at desc
+        query = query.order_by(User.created_at.desc())
+        
+        paginated = paginate(query, page, per_page)
         
-        return jsonify(result)
+        return jsonify(
+            {
+                "users": _users_schema.dump(paginated.items),
+                "pagination": {
+                    "page": paginated.page,
+                    "per_page": paginated.per_page,
+                    "total": paginated.total,
+                    "pages": paginated.pages,
+                },
+            }
+        )
 
 
 @blp.route("/<string:user_id>")
@@ -66,11 +189,12 @@ class UserDetail(MethodView):
         """Get user details (Owner/Admin only)."""
         tenant_id = g.get("tenant_id")
         
-        user = User.query.filter_by(id=user_id, tenant_id=tenant_id, is_deleted=False).first()
+        user = _get_user(user_id, tenant_id)
         if not user:
             return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
         
-        return UserSchema().dump(user)
+        # 304 when the client's copy is current
+        return conditional_json(user.updated_at, lambda: _user_schema.dump(user))
 
     @blp.arguments(UserUpdateSchema)
     @blp.response(200, UserSchema)
@@ -84,7 +208,7 @@ class UserDetail(MethodView):
         tenant_id = g.get("tenant_id")
         current_user_id = g.get("user_id")
         
-        user = User.query.filter_by(id=user_id, tenant_id=tenant_id, is_deleted=False).first()
+        user = _get_user(user_id, tenant_id)
         if not user:
             return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
         
@@ -119,20 +243,22 @@ class UserDetail(MethodView):
             if "preferences" in data:
                 user.preferences = {**user.preferences, **data["preferences"]}
             
-            db.session.commit()
-            
             # Log audit
             if changes:
                 AuditLog.log_action(
                     action=AuditAction.UPDATE,
                     entity_type="user",
                     entity_id=user.id,
-                    details={"changes": changes},
+                    old_values={field: change["old"] for field, change in changes.items()},
+                    new_values={field: change["new"] for field, change in changes.items()},
+                    commit=False,
                 )
             
+            db.session.commit()
+            
             logger.info(f"User updated", user_id=user.id, updated_by=current_user_id)
             
-            return UserSchema().dump(user)
+            return _user_schema.dump(user)
             
         except Exception as e:
             db.session.rollback()
@@ -162,23 +288,22 @@ class UserActivation(MethodView):
                 400,
             )
         
-        user = User.query.filter_by(id=user_id, tenant_id=tenant_id).first()
+        user = _update_user(user_id, tenant_id, is_active=True)
         if not user:
             return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
         
-        user.is_active = True
-        db.session.commit()
-        
         AuditLog.log_action(
             action=AuditAction.UPDATE,
             entity_type="user",
             entity_id=user.id,
-            details={"action": "activated"},
+            metadata={"action": "activated"},
+            commit=False,
         )
+        db.session.commit()
         
         logger.info(f"User activated", user_id=user.id, by=current_user_id)
         
-        return jsonify({"message": "User activated successfully", "user": UserSchema().dump(user)})
+        return jsonify({"message": "User activated successfully", "user": _user_schema.dump(user)})
 
 
 @blp.route("/<string:user_id>/deactivate")
@@ -203,23 +328,22 @@ class UserDeactivation(MethodView):
                 400,
             )
         
-        user = User.query.filter_by(id=user_id, tenant_id=tenant_id).first()
+        user = _update_user(user_id, tenant_id, is_active=False)
         if not user:
             return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
         
-        user.is_active = False
-        db.session.commit()
-        
         AuditLog.log_action(
             action=AuditAction.UPDATE,
             entity_type="user",
             entity_id=user.id,
-            details={"action": "deactivated"},
+            metadata={"action": "deactivated"},
+            commit=False,
         )
+        db.session.commit()
         
         logger.info(f"User deactivated", user_id=user.id, by=current_user_id)
         
-        return jsonify({"message": "User deactivated successfully", "user": UserSchema().dump(user)})
+        return jsonify({"message": "User deactivated successfully", "user": _user_schema.dump(user)})
 
 
 @blp.route("/<string:user_id>/role")
@@ -245,29 +369,28 @@ class UserRoleChange(MethodView):
                 400,
             )
         
-        user = User.query.filter_by(id=user_id, tenant_id=tenant_id).first()
-        if not user:
-            return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
-        
-        old_role = user.role
         new_role = data["role"]
         
-        user.role = new_role
-        db.session.commit()
+        user, old_role = _change_user_role(user_id, tenant_id, new_role)
+        if not user:
+            return jsonify({"error": "User not found", "code": "NOT_FOUND"}), 404
         
         AuditLog.log_action(
             action=AuditAction.ROLE_CHANGE,
             entity_type="user",
             entity_id=user.id,
-            details={"old_role": old_role, "new_role": new_role},
+            old_values={"role": old_role},
+            new_values={"role": new_role},
+            commit=False,
         )
+        db.session.commit()
         
         logger.info(f"User role changed", user_id=user.id, old_role=old_role, new_role=new_role)
         
         return jsonify(
             {
                 "message": "Role updated successfully",
-                "user": UserSchema().dump(user),
+                "user": _user_schema.dump(user),
                 "old_role": old_role,
                 "new_role": new_role,
             }
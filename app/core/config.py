@@ -22,15 +22,27 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.getenv("SQLALCHEMY_ECHO", "False").lower() == "true"
+    # Pools are per worker process: keep WEB_CONCURRENCY * (pool_size +
+    # max_overflow) below the server's max_connections (or PgBouncer's
+    # default_pool_size). With gevent workers, greenlets beyond the pool wait
+    # up to pool_timeout for a connection, so keep that short to fail fast.
+    # Behind PgBouncer (transaction mode) set DB_POOL_PRE_PING=false.
     SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": True,
-        "pool_recycle": 300,
-        "pool_size": 10,
-        "max_overflow": 20,
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "True").lower() == "true",
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "5")),
+        "pool_use_lifo": True,  # reuse hot connections, let idle ones expire
+        "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
     }
 
     # Redis
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    # Per worker process; greenlets wait up to REDIS_POOL_TIMEOUT seconds for a
+    # free connection instead of failing when the pool is exhausted
+    REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "50"))
+    REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "2"))
 
     # Celery
     CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
@@ -53,20 +65,30 @@ class Config:
     JWT_HEADER_NAME = "Authorization"
     JWT_HEADER_TYPE = "Bearer"
 
+    # Password hashing: bcrypt work factor (each +1 doubles hashing time)
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
     # Multi-tenancy
     TENANT_RESOLUTION = os.getenv("TENANT_RESOLUTION", "subdomain")  # subdomain or header
     TENANT_HEADER = os.getenv("TENANT_HEADER", "X-Tenant-Id")
     BASE_DOMAIN = os.getenv("BASE_DOMAIN", "localhost:5000")
     ENABLE_CUSTOM_DOMAINS = os.getenv("ENABLE_CUSTOM_DOMAINS", "True").lower() == "true"
+    # Check loaded relationships for cross-tenant references on every flush
+    ENFORCE_TENANT_FK_VALIDATION = (
+        os.getenv("ENFORCE_TENANT_FK_VALIDATION", "True").lower() == "true"
+    )
 
     # CORS
-    CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    CORS_ORIGINS = tuple(os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","))
     CORS_ALLOW_HEADERS = ["Content-Type", "Authorization", "X-Tenant-Id"]
     CORS_EXPOSE_HEADERS = ["X-Total-Count", "X-Request-Id"]
 
     # Rate Limiting
-    RATELIMIT_STORAGE_URL = os.getenv("RATELIMIT_STORAGE_URL", "redis://localhost:6379/1")
+    # Shares the app's Redis connection pool when it points at REDIS_URL
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URL", REDIS_URL)
     RATELIMIT_DEFAULT = os.getenv("RATELIMIT_DEFAULT", "100 per hour")
+    # Moving window: hit and window stats are each a single EVALSHA on Redis
+    RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "moving-window")
     RATELIMIT_HEADERS_ENABLED = True
 
     # Pagination
@@ -76,7 +98,7 @@ class Config:
     # File Upload
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", "16777216"))  # 16MB
     UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "uploads")
-    ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "pdf", "csv"}
+    ALLOWED_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "pdf", "csv"})
 
     # Email
     MAIL_SERVER = os.getenv("MAIL_SERVER", "smtp.gmail.com")
@@ -86,9 +108,24 @@ class Config:
     MAIL_PASSWORD = os.getenv("MAIL_PASSWORD")
     MAIL_DEFAULT_SENDER = os.getenv("MAIL_DEFAULT_SENDER", "noreply@tracktok.com")
 
+    # Audit logging (background writer)
+    AUDIT_ASYNC = os.getenv("AUDIT_ASYNC", "True").lower() == "true"
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "0.1"))  # seconds
+
+    # Report result cache (seconds, 0 disables)
+    REPORT_CACHE_TTL = int(os.getenv("REPORT_CACHE_TTL", "60"))
+
+    # Tenant lookup cache (seconds, 0 disables)
+    TENANT_CACHE_TTL = int(os.getenv("TENANT_CACHE_TTL", "60"))
+    # In-process layer for host -> tenant lookups (seconds, 0 disables)
+    TENANT_LOCAL_CACHE_TTL = int(os.getenv("TENANT_LOCAL_CACHE_TTL", "5"))
+
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # json or text
+    LOG_ENQUEUE = os.getenv("LOG_ENQUEUE", "True").lower() == "true"
 
     # Observability
     SENTRY_DSN = os.getenv("SENTRY_DSN")
@@ -126,8 +163,16 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # SQLite in-memory does not use a QueuePool
     WTF_CSRF_ENABLED = False
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
+    BCRYPT_ROUNDS = 4  # bcrypt's minimum; keeps fixtures fast
+    AUDIT_ASYNC = False
+    REPORT_CACHE_TTL = 0
+    TENANT_CACHE_TTL = 0
+    TENANT_LOCAL_CACHE_TTL = 0
+    LOG_ENQUEUE = False
+    RATELIMIT_STORAGE_URI = "memory://"
 
 
 class ProductionConfig(Config):
@@ -136,16 +181,13 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
 
-    # Override with stricter production settings
-    @property
-    def SQLALCHEMY_ENGINE_OPTIONS(self) -> Dict[str, Any]:
-        """Production database engine options."""
-        return {
-            "pool_pre_ping": True,
-            "pool_recycle": 3600,
-            "pool_size": 20,
-            "max_overflow": 40,
-        }
+    # Larger default pool; a plain class attribute so from_object() picks up
+    # the dict itself (a property is only evaluated on instances)
+    SQLALCHEMY_ENGINE_OPTIONS: Dict[str, Any] = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "40")),
+    }
 
 
 config_by_name = {
@@ -31,19 +31,8 @@ login_manager = LoginManager()
 redis_client: Redis = None  # Will be initialized in app factory
 
 
-def get_redis_connection():
-    """Get Redis connection from Flask app config."""
-    from flask import current_app
-
-    if not hasattr(current_app, "redis"):
-        current_app.redis = Redis.from_url(
-            current_app.config["REDIS_URL"], decode_responses=True
-        )
-    return current_app.redis
-
-
 # Rate limiter with Redis storage
-# Note: storage_uri will be overridden by RATELIMIT_STORAGE_URL in app config
+# Note: storage comes from RATELIMIT_STORAGE_URI in app config
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["100 per hour"],
@@ -2,6 +2,7 @@
 import sys
 from typing import Dict
 
+import orjson
 from flask import Flask, g, has_request_context, request
 from loguru import logger as loguru_logger
 
@@ -12,55 +13,64 @@ def setup_logging(app: Flask) -> None:
     # Remove default logger
     log.remove()
 
-    def add_timestamp(record: Dict):
-        """Ensure a 'timestamp' field exists for any custom formats."""
-        record["timestamp"] = record["time"].isoformat()
-
-    log = log.patch(add_timestamp)
-
     # Determine log format based on config
     log_format = app.config.get("LOG_FORMAT", "json")
     log_level = app.config.get("LOG_LEVEL", "INFO")
+    # Hand records to a background writer so sink I/O stays off the request path
+    enqueue = app.config.get("LOG_ENQUEUE", True)
+
+    def patch_record(record: Dict):
+        """
+        Add a 'timestamp' field and, for JSON output, the serialized line.
+
+        Runs once per record in the logging thread, so request context is
+        available and every sink reuses the same JSON line.
+        """
+        record["timestamp"] = timestamp = record["time"].isoformat()
+        if log_format != "json":
+            return
+
+        base = {
+            "timestamp": timestamp,
+            "level": record["level"].name,
+            "message": record["message"],
+            "module": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+        }
+
+        # Add request context if available
+        if has_request_context():
+            base["request_id"] = g.get("request_id")
+            base["tenant_id"] = g.get("tenant_id")
+            base["user_id"] = g.get("user_id")
+            base["method"] = request.method
+            base["path"] = request.path
+            base["ip"] = request.remote_addr
+
+        # Add extra fields
+        extra = record["extra"]
+        if extra:
+            base |= extra
+
+        extra["serialized"] = orjson.dumps(base, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # Applies to every `from loguru import logger` in the app
+    log.configure(patcher=patch_record)
 
     if log_format == "json":
-        # Structured JSON logging for production
+        # Structured JSON logging for production. Callable formats are
+        # templates, so emit the pre-serialized line instead of raw JSON.
         def format_record(record: Dict) -> str:
             """Format log record as JSON."""
-            import json
-            
-            base = {
-                "timestamp": record["time"].isoformat(),
-                "level": record["level"].name,
-                "message": record["message"],
-                "module": record["name"],
-                "function": record["function"],
-                "line": record["line"],
-            }
-
-            # Add request context if available
-            if has_request_context():
-                base.update(
-                    {
-                        "request_id": g.get("request_id"),
-                        "tenant_id": g.get("tenant_id"),
-                        "user_id": g.get("user_id"),
-                        "method": request.method,
-                        "path": request.path,
-                        "ip": request.remote_addr,
-                    }
-                )
-
-            # Add extra fields
-            if record["extra"]:
-                base.update(record["extra"])
-
-            return json.dumps(base) + "\n"
+            return "{extra[serialized]}\n"
 
         log.add(
             sys.stdout,
             format=format_record,
             level=log_level,
             serialize=False,
+            enqueue=enqueue,
         )
     else:
         # Human-readable format for development
@@ -70,7 +80,9 @@ def setup_logging(app: Flask) -> None:
             "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
             "<level>{message}</level>"
         )
-        log.add(sys.stdout, format=log_format_str, level=log_level, colorize=True)
+        log.add(
+            sys.stdout, format=log_format_str, level=log_level, colorize=True, enqueue=enqueue
+        )
 
     # Log to file in production (only if not in production, to avoid scope issues)
     if not app.debug and log_format == "json":
@@ -81,6 +93,7 @@ def setup_logging(app: Flask) -> None:
             compression="zip",
             level=log_level,
             format=format_record,
+            enqueue=enqueue,
         )
     elif not app.debug:
         log.add(
@@ -90,6 +103,7 @@ def setup_logging(app: Flask) -> None:
             compression="zip",
             level=log_level,
             format=log_format_str,
+            enqueue=enqueue,
         )
 
     # Intercept standard logging
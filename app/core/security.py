@@ -4,12 +4,40 @@ from functools import wraps
 from typing import Optional
 
 import bcrypt
-from flask import g, jsonify, request
+from flask import current_app, g, has_app_context, jsonify, request
 from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity
 from loguru import logger
+from redis.commands.core import Script
+
+try:
+    from gevent import get_hub, monkey
+except ImportError:  # only the production gunicorn workers run on gevent
+    get_hub = monkey = None
 
 from app.models.user import User, UserRole
 
+# Increment a rate-limit counter, starting its window on the first hit.
+# Bytes source so the SHA is computed without a client; run with client=...
+_RATE_LIMIT_SCRIPT = Script(
+    None,
+    b"local c = redis.call('INCR', KEYS[1]) "
+    b"if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    b"return c",
+)
+
+
+def _run_off_hub(func, *args):
+    """
+    Run a CPU-bound call on a native thread when serving under gevent.
+
+    bcrypt releases the GIL but cannot yield to the gevent hub, so calling it
+    inline would stall every other greenlet in the worker for the whole key
+    schedule. Elsewhere (sync workers, Celery, tests) it is called directly.
+    """
+    if monkey is not None and monkey.is_module_patched("threading"):
+        return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
 
 def hash_password(password: str) -> str:
     """
@@ -21,7 +49,10 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    # Existing hashes keep verifying at the cost they were created with
+    rounds = current_app.config.get("BCRYPT_ROUNDS", 12) if has_app_context() else 12
+    salt = bcrypt.gensalt(rounds=rounds)
+    return _run_off_hub(bcrypt.hashpw, password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -36,7 +67,9 @@ def verify_password(password: str, password_hash: str) -> bool:
         True if password matches, False otherwise
     """
     try:
-        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+        return _run_off_hub(
+            bcrypt.checkpw, password.encode("utf-8"), password_hash.encode("utf-8")
+        )
     except Exception as e:
         logger.error(f"Password verification error: {e}")
         return False
@@ -69,9 +102,14 @@ def get_current_user() -> Optional[User]:
     """
     Get current authenticated user from JWT token.
     
+    The result is memoized on g, so repeated calls in a request reuse it.
+    
     Returns:
         User instance if authenticated, None otherwise
     """
+    if "current_user" in g:
+        return g.current_user
+
     try:
         user_id = get_jwt_identity()
         if not user_id:
@@ -79,13 +117,17 @@ def get_current_user() -> Optional[User]:
 
         from app.core.extensions import db
 
-        user = db.session.query(User).filter_by(id=user_id, is_active=True).first()
+        # Identity-map lookup: no SQL if the session already holds the user
+        user = db.session.get(User, user_id)
+        if user and not user.is_active:
+            user = None
 
         if user:
             # Set user context
             g.user_id = user.id
             g.tenant_id = user.tenant_id
 
+        g.current_user = user
         return user
     except Exception as e:
         logger.error(f"Error getting current user: {e}")
@@ -163,17 +205,9 @@ def check_rate_limit(user_id: str, action: str, limit: int, window: int = 3600)
     key = f"ratelimit:{user_id}:{action}"
 
     try:
-        count = redis_client.get(key)
-        if count and int(count) >= limit:
-            return False
-
-        # Increment counter
-        pipe = redis_client.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, window)
-        pipe.execute()
-
-        return True
+        # One atomic EVALSHA instead of GET then INCR/EXPIRE
+        count = _RATE_LIMIT_SCRIPT(keys=[key], args=[window], client=redis_client)
+        return count <= limit
     except Exception as e:
         logger.error(f"Rate limit check error: {e}")
         return True  # Fail open
@@ -193,13 +227,6 @@ def sanitize_input(data: str, max_length: int = 1000) -> str:
     if not data:
         return ""
 
-    # Truncate to max length
-    data = data[:max_length]
-
-    # Remove null bytes
-    data = data.replace("\x00", "")
-
-    # Strip leading/trailing whitespace
-    data = data.strip()
-
-    return data
+    # Truncate, drop null bytes, strip whitespace. Each step returns the same
+    # string object when it has nothing to do, so clean input is not copied.
+    return data[:max_length].replace("\x00", "").strip()
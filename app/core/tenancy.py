@@ -1,8 +1,10 @@
 """Multi-tenancy core implementation with scoped sessions."""
-from typing import Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Optional, Tuple
 
-from flask import g, has_app_context
-from sqlalchemy import event
+from flask import current_app, g, has_app_context
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Query, Session
 
 from app.core.extensions import db
@@ -13,17 +15,23 @@ class TenantScopedQuery(Query):
     Custom Query class that automatically filters by tenant_id.
     
     All queries will be scoped to the current tenant unless explicitly disabled.
+    The filter is added once when the query is compiled (see
+    scope_query_to_tenant), not on every generative step.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Auto-apply tenant filter if tenant context exists
-        if has_app_context() and hasattr(g, "tenant_id") and g.tenant_id:
-            # Only apply filter to models that have tenant_id attribute
-            if hasattr(self._mapper_zero().class_, "tenant_id"):
-                self._criterion = db.and_(
-                    self._criterion, self._mapper_zero().class_.tenant_id == g.tenant_id
-                )
+
+@event.listens_for(TenantScopedQuery, "before_compile", retval=True)
+def scope_query_to_tenant(query):
+    """Add the tenant filter to a TenantScopedQuery about to be compiled."""
+    tenant_id = get_current_tenant_id()
+    if not tenant_id:
+        return query
+    
+    # Only apply filter to models that have tenant_id attribute
+    entity = query.column_descriptions[0]["entity"]
+    if entity is None or not hasattr(entity, "tenant_id"):
+        return query
+    return query.enable_assertions(False).filter(entity.tenant_id == tenant_id)
 
 
 def get_current_tenant_id() -> Optional[str]:
@@ -45,13 +53,31 @@ def clear_tenant_context() -> None:
         delattr(g, "tenant_id")
 
 
+@lru_cache(maxsize=None)
+def _tenant_props(cls) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Tenant metadata for a mapped class, computed once per class.
+    
+    Returns:
+        (whether the class has tenant_id, keys of its relationships to
+        tenant-scoped classes)
+    """
+    relationship_keys = tuple(
+        prop.key
+        for prop in inspect(cls).relationships
+        if hasattr(prop.mapper.class_, "tenant_id")
+    )
+    return hasattr(cls, "tenant_id"), relationship_keys
+
+
 @event.listens_for(Session, "before_flush")
 def receive_before_flush(session, flush_context, instances):
     """
-    Automatically set tenant_id on INSERT operations.
+    Apply tenant rules to pending changes.
     
-    This ensures all tenant-scoped models get the correct tenant_id
-    before being persisted to the database.
+    Sets tenant_id on new tenant-scoped instances, then checks that no
+    instance references another tenant's rows. The tenant is resolved once
+    per flush for both passes.
     """
     tenant_id = get_current_tenant_id()
     
@@ -59,57 +85,47 @@ def receive_before_flush(session, flush_context, instances):
         return
     
     for instance in session.new:
-        if hasattr(instance, "tenant_id") and instance.tenant_id is None:
+        if _tenant_props(type(instance))[0] and instance.tenant_id is None:
             instance.tenant_id = tenant_id
+    
+    if current_app.config.get("ENFORCE_TENANT_FK_VALIDATION", True):
+        validate_tenant_fk_consistency(session)
 
 
-@event.listens_for(Session, "before_flush")
-def validate_tenant_fk_consistency(session, flush_context, instances):
+def validate_tenant_fk_consistency(session):
     """
     Prevent cross-tenant FK mismatches.
     
     Validates that all foreign key relationships maintain tenant consistency.
     Raises error if trying to link entities from different tenants.
+    Only relationships already loaded on the instance are checked, so the
+    validation never lazy-loads related rows.
     """
-    from sqlalchemy.orm import object_mapper
-    from sqlalchemy.orm.properties import RelationshipProperty
-    
-    current_tenant_id = get_current_tenant_id()
-    
-    if not current_tenant_id:
-        return
-    
-    # Check new and updated instances
-    for instance in session.new | session.dirty:
-        if not hasattr(instance, "tenant_id"):
+    # Check new and updated instances (disjoint sets, so chain instead of a union)
+    for instance in chain(session.new, session.dirty):
+        has_tenant_id, relationship_keys = _tenant_props(type(instance))
+        if not has_tenant_id:
             continue
         
         instance_tenant = instance.tenant_id
         if not instance_tenant:
             continue
         
-        # Get all relationships for this model
-        mapper = object_mapper(instance)
-        for prop in mapper.iterate_properties:
-            if not isinstance(prop, RelationshipProperty):
-                continue
-            
-            # Get related object(s)
-            related = getattr(instance, prop.key)
+        loaded = instance.__dict__
+        for key in relationship_keys:
+            # Unloaded relationships were not changed in this session
+            related = loaded.get(key)
             if related is None:
                 continue
             
-            # Handle collections
-            if isinstance(related, list):
+            # Handle collections (lists and sets)
+            if isinstance(related, (list, set)):
                 related_objects = related
             else:
                 related_objects = [related]
             
             # Validate each related object
             for related_obj in related_objects:
-                if not hasattr(related_obj, "tenant_id"):
-                    continue
-                
                 related_tenant = related_obj.tenant_id
                 if related_tenant and related_tenant != instance_tenant:
                     raise ValueError(
@@ -156,8 +172,10 @@ class TenantMixin:
     @db.declared_attr
     def tenant_id(cls):
         """Tenant foreign key column."""
+        from app.models.base import GUID
+
         return db.Column(
-            db.String(36),
+            GUID,
             db.ForeignKey("tenants.id", ondelete="CASCADE"),
             nullable=False,
             index=True,
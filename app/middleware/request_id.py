@@ -1,5 +1,5 @@
 """Request ID middleware for request tracing."""
-import uuid
+import os
 
 from flask import g, request
 
@@ -8,14 +8,15 @@ class RequestIdMiddleware:
     """
     Middleware to inject unique request IDs for tracing.
     
-    Supports both generated UUIDs and client-provided X-Request-Id headers.
+    Supports both generated IDs and client-provided X-Request-Id headers.
     """
 
     @staticmethod
     def add_request_id():
         """Add request ID to Flask g context."""
-        # Use client-provided request ID if available, otherwise generate
-        g.request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+        # Use client-provided request ID if available, otherwise generate an
+        # opaque 128-bit hex ID (only built when the header is missing)
+        g.request_id = request.headers.get("X-Request-Id") or os.urandom(16).hex()
 
     @staticmethod
     def inject_request_id_header(response):
@@ -1,10 +1,18 @@
 """Tenancy middleware for multi-tenant request resolution."""
+from functools import lru_cache
 from typing import Optional
 
 from flask import current_app, g, request
 from loguru import logger
 
-from app.core.extensions import db
+# Endpoints served without a tenant context
+_SKIP_TENANT_PATHS = frozenset({"/api/v1/health", "/api/v1/auth/login", "/api/v1/auth/register"})
+
+
+@lru_cache(maxsize=8)
+def _host_suffix(base_domain: str) -> str:
+    """Host suffix that marks a subdomain, e.g. '.tracktok.com' for 'TrackTok.com:443'."""
+    return "." + base_domain.split(":", 1)[0].lower()
 
 
 class TenancyMiddleware:
@@ -28,7 +36,8 @@ class TenancyMiddleware:
         3. X-Tenant-Id header (fallback)
         """
         # Skip tenant resolution for health check and auth endpoints
-        if request.path in ["/api/v1/health", "/api/v1/auth/login", "/api/v1/auth/register"]:
+        path = request.path
+        if path in _SKIP_TENANT_PATHS:
             return
 
         tenant_id = None
@@ -59,12 +68,9 @@ class TenancyMiddleware:
             logger.debug(f"Tenant resolved: {tenant_id}", method=resolution_method)
         else:
             # For API endpoints, tenant is required
-            if request.path.startswith("/api/v1/") and request.path not in [
-                "/api/v1/health",
-                "/api/v1/auth/login",
-                "/api/v1/auth/register",
-            ]:
-                logger.warning("Tenant not resolved for API request", path=request.path)
+            # Skip-listed paths returned above
+            if path.startswith("/api/v1/"):
+                logger.warning("Tenant not resolved for API request", path=path)
                 # Allow request to proceed - will be caught by endpoint-level checks
 
     @staticmethod
@@ -74,21 +80,17 @@ class TenancyMiddleware:
         
         Example: acme.tracktok.com -> acme
         """
-        host = request.host.lower()
-        base_domain = current_app.config.get("BASE_DOMAIN", "localhost:5000").lower()
-
-        # Remove port from host if present
-        host_without_port = host.split(":")[0]
-        base_without_port = base_domain.split(":")[0]
+        # Host without port
+        host = request.host.split(":", 1)[0].lower()
+        suffix = _host_suffix(current_app.config.get("BASE_DOMAIN", "localhost:5000"))
 
         # Extract subdomain
-        if host_without_port.endswith(f".{base_without_port}"):
-            subdomain = host_without_port.replace(f".{base_without_port}", "")
-            return TenancyMiddleware._get_tenant_id_by_subdomain(subdomain)
+        if host.endswith(suffix):
+            return TenancyMiddleware._get_tenant_id_by_subdomain(host[: -len(suffix)])
 
         # Handle localhost development (e.g., acme.localhost)
-        if "localhost" in host_without_port and "." in host_without_port:
-            subdomain = host_without_port.split(".")[0]
+        if "localhost" in host and "." in host:
+            subdomain = host.split(".", 1)[0]
             if subdomain != "localhost":
                 return TenancyMiddleware._get_tenant_id_by_subdomain(subdomain)
 
@@ -112,13 +114,11 @@ class TenancyMiddleware:
 
         host = request.host.lower().split(":")[0]
 
-        # Query custom domain mapping
+        # Custom domain mapping (cached)
         try:
-            from app.models.tenant import TenantDomain
+            from app.services.tenant_cache import get_tenant_id_by_domain
 
-            domain = db.session.query(TenantDomain).filter_by(domain=host, is_active=True).first()
-            if domain:
-                return domain.tenant_id
+            return get_tenant_id_by_domain(host)
         except Exception as e:
             logger.error(f"Error resolving custom domain: {e}")
 
@@ -136,10 +136,9 @@ class TenancyMiddleware:
             Tenant ID if found, None otherwise
         """
         try:
-            from app.models.tenant import Tenant
+            from app.services.tenant_cache import get_tenant_id_by_subdomain
 
-            tenant = db.session.query(Tenant).filter_by(subdomain=subdomain, is_active=True).first()
-            return tenant.id if tenant else None
+            return get_tenant_id_by_subdomain(subdomain)
         except Exception as e:
             logger.error(f"Error looking up tenant by subdomain: {e}")
             return None
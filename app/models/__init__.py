@@ -1,11 +1,13 @@
 """Models package."""
+from sqlalchemy.orm import configure_mappers
+
 from app.models.account import Account
 from app.models.alert import Alert
 from app.models.audit import AuditAction, AuditLog
 from app.models.base import AuditMixin, BaseModel, TimestampMixin
-from app.models.budget import Budget, BudgetAlert, BudgetPeriod
+from app.models.budget import Budget, BudgetAlert, BudgetPeriod, BudgetSpendSnapshot
 from app.models.category import Category
-from app.models.expense import Expense, ExpenseStatus, PaymentMethod, RecurringExpense
+from app.models.expense import Expense, ExpenseStatus, ExpenseTag, PaymentMethod, RecurringExpense
 from app.models.project import Project
 from app.models.tenant import Tenant, TenantDomain
 from app.models.user import PasswordResetToken, User, UserRole
@@ -26,12 +28,18 @@ __all__ = [
     "Category",
     "Alert",
     "Expense",
+    "ExpenseTag",
     "ExpenseStatus",
     "PaymentMethod",
     "RecurringExpense",
     "Budget",
     "BudgetPeriod",
     "BudgetAlert",
+    "BudgetSpendSnapshot",
     "AuditLog",
     "AuditAction",
 ]
+
+# Resolve relationships now that every model is defined: mapping errors
+# surface at import, and the first request doesn't pay for configuration
+configure_mappers()
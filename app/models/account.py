@@ -2,11 +2,12 @@
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Numeric
+from sqlalchemy import Numeric, inspect, update
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel
 
 
 class Account(BaseModel):
@@ -20,7 +21,7 @@ class Account(BaseModel):
 
     # Tenant relationship
     tenant_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Basic fields
@@ -45,7 +46,7 @@ class Account(BaseModel):
 
     # Audit fields
     created_by: Mapped[Optional[str]] = mapped_column(
-        db.String(36), db.ForeignKey("users.id"), nullable=True
+        GUID, db.ForeignKey("users.id"), nullable=True
     )
 
     # Relationships
@@ -81,6 +82,35 @@ class Account(BaseModel):
             return 0.0
         return float((self.balance_change / self.opening_balance) * 100)
 
+    def _add_to_balance(self, delta: Decimal) -> None:
+        """
+        Add delta to current_balance in the database.
+        
+        Persisted accounts are changed with a single UPDATE ... SET
+        current_balance = current_balance + :delta RETURNING current_balance,
+        so concurrent changes cannot overwrite each other and no prior read is
+        needed. The returned balance is stored on the instance without
+        marking it dirty. A pending change to current_balance is flushed
+        first so the delta applies on top of it instead of replacing it.
+        """
+        state = inspect(self)
+        if not state.persistent:
+            self.current_balance = (self.current_balance or 0) + delta
+            return
+        if state.attrs.current_balance.history.has_changes():
+            db.session.flush()
+        
+        stmt = (
+            update(Account)
+            .where(Account.id == self.id)
+            .values(current_balance=Account.current_balance + delta)
+            .returning(Account.current_balance)
+        )
+        balance = db.session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        ).scalar_one()
+        set_committed_value(self, "current_balance", balance)
+
     def debit(self, amount: Decimal, commit: bool = True) -> None:
         """
         Debit (subtract) amount from account.
@@ -89,7 +119,7 @@ class Account(BaseModel):
             amount: Amount to debit
             commit: Whether to commit transaction
         """
-        self.current_balance -= amount
+        self._add_to_balance(-amount)
         if commit:
             db.session.commit()
 
@@ -101,7 +131,7 @@ class Account(BaseModel):
             amount: Amount to credit
             commit: Whether to commit transaction
         """
-        self.current_balance += amount
+        self._add_to_balance(amount)
         if commit:
             db.session.commit()
 
@@ -124,17 +154,20 @@ class Account(BaseModel):
         Args:
             include_metrics: Include calculated metrics
         """
+        # Money as exact decimal strings, matching AccountSchema
         data = super().to_dict()
         data.update({
-            "opening_balance": float(self.opening_balance),
-            "current_balance": float(self.current_balance),
-            "low_balance_threshold": float(self.low_balance_threshold) if self.low_balance_threshold else None,
+            "opening_balance": str(self.opening_balance),
+            "current_balance": str(self.current_balance),
+            "low_balance_threshold": (
+                str(self.low_balance_threshold) if self.low_balance_threshold is not None else None
+            ),
         })
         
         if include_metrics:
             data.update({
                 "is_low_balance": self.is_low_balance,
-                "balance_change": float(self.balance_change),
+                "balance_change": str(self.balance_change),
                 "balance_change_percentage": self.balance_change_percentage,
             })
         
@@ -3,11 +3,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import JSON
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped, load_only, mapped_column, relationship
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel, JSONType
 
 
 class AlertType(str, Enum):
@@ -44,7 +44,7 @@ class Alert(BaseModel):
 
     # Tenant relationship
     tenant_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Alert type and severity
@@ -65,12 +65,12 @@ class Alert(BaseModel):
     message: Mapped[str] = mapped_column(db.Text, nullable=False)
     
     # Additional data (renamed from 'metadata' to avoid SQLAlchemy reserved word)
-    alert_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    alert_metadata: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
     
     # Status
     is_read: Mapped[bool] = mapped_column(db.Boolean, nullable=False, default=False, index=True)
     read_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
-    read_by: Mapped[Optional[str]] = mapped_column(db.String(36), db.ForeignKey("users.id"), nullable=True)
+    read_by: Mapped[Optional[str]] = mapped_column(GUID, db.ForeignKey("users.id"), nullable=True)
     
     is_dismissed: Mapped[bool] = mapped_column(db.Boolean, nullable=False, default=False)
     dismissed_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
@@ -86,7 +86,14 @@ class Alert(BaseModel):
     # Indexes
     __table_args__ = (
         db.Index("ix_alerts_tenant_type", "tenant_id", "alert_type"),
-        db.Index("ix_alerts_tenant_unread", "tenant_id", "is_read"),
+        # Only unread, live alerts are indexed, so unread counts stay small
+        db.Index(
+            "ix_alerts_tenant_unread_active",
+            "tenant_id",
+            postgresql_where=db.text(
+                "is_read = false AND is_dismissed = false AND is_deleted = false"
+            ),
+        ),
         db.Index("ix_alerts_entity", "entity_type", "entity_id"),
     )
 
@@ -135,21 +142,43 @@ class Alert(BaseModel):
     @classmethod
     def get_unread_count(cls, tenant_id: str) -> int:
         """Get count of unread alerts for tenant."""
-        return db.session.query(cls).filter_by(
-            tenant_id=tenant_id,
-            is_read=False,
-            is_dismissed=False,
-            is_deleted=False
-        ).count()
+        # Plain COUNT(*) (no subquery) so PostgreSQL can answer it from
+        # ix_alerts_tenant_unread_active
+        return db.session.execute(
+            db.select(func.count())
+            .select_from(cls)
+            .filter_by(tenant_id=tenant_id, is_read=False, is_dismissed=False, is_deleted=False)
+        ).scalar_one()
 
     @classmethod
-    def get_recent_alerts(cls, tenant_id: str, limit: int = 10):
-        """Get recent alerts for tenant."""
-        return db.session.query(cls).filter_by(
+    def get_recent_alerts(cls, tenant_id: str, limit: int = 10, full: bool = False):
+        """
+        Get recent alerts for tenant.
+        
+        Args:
+            tenant_id: Tenant ID
+            limit: Maximum number of alerts
+            full: Load every column; by default only the summary columns a
+                notification list shows are loaded (message and the JSON
+                metadata are fetched only if accessed)
+        """
+        query = db.session.query(cls).filter_by(
             tenant_id=tenant_id,
             is_dismissed=False,
             is_deleted=False
-        ).order_by(cls.created_at.desc()).limit(limit).all()
+        )
+        if not full:
+            query = query.options(
+                load_only(
+                    cls.id,
+                    cls.alert_type,
+                    cls.severity,
+                    cls.title,
+                    cls.is_read,
+                    cls.created_at,
+                )
+            )
+        return query.order_by(cls.created_at.desc()).limit(limit).all()
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -1,13 +1,14 @@
 """Audit log model for immutable audit trail."""
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
+from typing import Iterator, List, Optional, Tuple
 
-from sqlalchemy import JSON
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DDL, event, insert, text
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.core.extensions import db
 from app.core.tenancy import TenantMixin
-from app.models.base import TimestampMixin
+from app.models.base import GUID, JSONType, TimestampMixin
 
 
 class AuditAction(str, Enum):
@@ -36,13 +37,15 @@ class AuditLog(db.Model, TimestampMixin, TenantMixin):
 
     __tablename__ = "audit_logs"
 
-    id: Mapped[str] = mapped_column(db.String(36), primary_key=True)
+    id: Mapped[str] = mapped_column(GUID, nullable=False)
     
     # Actor (actor_user_id as per spec, keeping user_id for compatibility)
     actor_user_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("users.id"), nullable=True, index=True
+        GUID, db.ForeignKey("users.id"), nullable=True
     )
     user_email: Mapped[str] = mapped_column(db.String(255), nullable=True)  # Denormalized
+    # Actor as of the write ({id, email, name, role}), so reads need no user join
+    actor_snapshot: Mapped[dict] = mapped_column(JSONType, nullable=True)
     
     # Action details
     action: Mapped[str] = mapped_column(db.String(50), nullable=False, index=True)
@@ -50,7 +53,7 @@ class AuditLog(db.Model, TimestampMixin, TenantMixin):
     entity_id: Mapped[str] = mapped_column(db.String(36), nullable=True, index=True)  # resource_id alias
     
     # Changes (changes_json as per spec - for UPDATE actions)
-    changes_json: Mapped[dict] = mapped_column(JSON, nullable=True)  # Combined old+new values
+    changes_json: Mapped[dict] = mapped_column(JSONType, nullable=True)  # Combined old+new values
     
     # Request context
     ip_address: Mapped[str] = mapped_column(db.String(45), nullable=True)  # IPv6 support
@@ -58,16 +61,24 @@ class AuditLog(db.Model, TimestampMixin, TenantMixin):
     request_id: Mapped[str] = mapped_column(db.String(36), nullable=True, index=True)
     
     # Additional metadata (renamed from 'metadata' to avoid SQLAlchemy reserved word)
-    audit_metadata: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    audit_metadata: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # Relationships
     tenant = relationship("Tenant")
 
+    # Range-partitioned by month on PostgreSQL (see ensure_audit_partitions);
+    # the partition key has to be part of the primary key, while the ORM
+    # keeps identifying rows by id alone. Indexes are created per partition.
     __table_args__ = (
+        db.PrimaryKeyConstraint("id", "created_at"),
         db.Index("idx_tenant_action", "tenant_id", "action"),
         db.Index("idx_tenant_entity", "tenant_id", "entity_type", "entity_id"),
         db.Index("idx_created_at", "created_at"),
+        # Keyset pages of a user's activity (get_user_activity)
+        db.Index("ix_audit_actor_created", "actor_user_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self):
         return f"<AuditLog {self.action} on {self.entity_type}>"
@@ -89,86 +100,303 @@ class AuditLog(db.Model, TimestampMixin, TenantMixin):
         return self.entity_id
 
     @staticmethod
-    def log_action(
+    def build_entry(
         action: AuditAction,
         entity_type: str,
         entity_id: str = None,
         old_values: dict = None,
         new_values: dict = None,
         metadata: dict = None,
-    ):
+        lookup_actor: bool = True,
+    ) -> dict:
         """
-        Create an audit log entry.
+        Build the column values for an audit log entry from request context.
         
         Args:
             action: Action performed
             entity_type: Type of entity (expense, budget, user, etc.)
             entity_id: ID of affected entity
-            old_values: Previous values (for updates)
+            old_values: Previous values (for updates, trimmed to the keys of
+                new_values)
             new_values: New values (for updates)
             metadata: Additional context
+            lookup_actor: Resolve the actor's email and snapshot now (otherwise
+                left empty for fill_actors)
+            
+        Returns:
+            Dictionary of AuditLog column values
         """
         from flask import g, request
 
         from app.models.user import User
 
+        import json
         import uuid
 
         user_id = g.get("user_id")
         tenant_id = g.get("tenant_id")
 
-        # Get user email if user_id is available
-        user_email = None
-        if user_id:
+        # Snapshot the actor if user_id is available
+        actor_snapshot = None
+        if user_id and lookup_actor:
             user = db.session.query(User).filter_by(id=user_id).first()
-            user_email = user.email if user else None
+            actor_snapshot = AuditLog._actor_snapshot(user) if user else None
+
+        # For updates keep only the previous values of fields that changed;
+        # callers often pass a full snapshot, which repeated every
+        # unchanged field (key and value) on each row
+        if old_values and new_values:
+            old_values = {k: old_values[k] for k in new_values if k in old_values}
 
-        # Combine old and new values for changes_json
+        # Combine old and new values for changes_json (coerced to JSON-safe types)
         changes_json = None
         if old_values or new_values:
-            changes_json = {
-                "old": old_values or {},
-                "new": new_values or {}
-            }
-
-        audit_entry = AuditLog(
-            id=str(uuid.uuid4()),
-            tenant_id=tenant_id,
-            actor_user_id=user_id,
-            user_email=user_email,
-            action=action.value,
-            entity_type=entity_type,
+            changes_json = json.loads(
+                json.dumps({"old": old_values or {}, "new": new_values or {}}, default=str)
+            )
+
+        return {
+            "id": str(uuid.uuid4()),
+            "tenant_id": tenant_id,
+            "actor_user_id": user_id,
+            "user_email": actor_snapshot["email"] if actor_snapshot else None,
+            "actor_snapshot": actor_snapshot,
+            "action": action.value,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "changes_json": changes_json,
+            "ip_address": request.remote_addr if request else None,
+            "user_agent": request.headers.get("User-Agent") if request else None,
+            "request_id": g.get("request_id"),
+            "audit_metadata": metadata or {},
+            "created_at": datetime.utcnow(),
+        }
+
+    @staticmethod
+    def _actor_snapshot(user) -> dict:
+        """Denormalized actor details stored on each entry."""
+        return {
+            "id": user.id,
+            "email": user.email,
+            "name": f"{user.first_name} {user.last_name}",
+            "role": user.role,
+        }
+
+    @staticmethod
+    def fill_actors(entries: list) -> None:
+        """
+        Resolve actor emails and snapshots for entries built with
+        lookup_actor=False.
+        
+        Snapshots are remembered on g for the rest of the request (or app
+        context), so later commits in the same request skip the lookup;
+        the remaining IDs are fetched with one query.
+        """
+        from flask import g, has_app_context
+
+        from app.models.user import User
+
+        user_ids = {e["actor_user_id"] for e in entries if e["actor_user_id"] and not e["actor_snapshot"]}
+        if not user_ids:
+            return
+        actors = g.setdefault("_actor_cache", {}) if has_app_context() else {}
+        missing = user_ids.difference(actors)
+        if missing:
+            users = db.session.execute(
+                db.select(User.id, User.email, User.first_name, User.last_name, User.role)
+                .where(User.id.in_(missing))
+            ).all()
+            actors.update((user.id, AuditLog._actor_snapshot(user)) for user in users)
+        for entry in entries:
+            actor = actors.get(entry["actor_user_id"])
+            if actor and not entry["actor_snapshot"]:
+                entry["actor_snapshot"] = actor
+                entry["user_email"] = actor["email"]
+
+    @staticmethod
+    def log_action(
+        action: AuditAction,
+        entity_type: str,
+        entity_id: str = None,
+        old_values: dict = None,
+        new_values: dict = None,
+        metadata: dict = None,
+        commit: bool = True,
+    ):
+        """
+        Create an audit log entry.
+        
+        Entries are buffered on the session and written with a single
+        multi-row INSERT when the transaction commits (see
+        write_buffered_audit_entries), so a request logging several actions
+        pays for one INSERT instead of one per entry.
+        
+        Args:
+            action: Action performed
+            entity_type: Type of entity (expense, budget, user, etc.)
+            entity_id: ID of affected entity
+            old_values: Previous values (for updates)
+            new_values: New values (for updates)
+            metadata: Additional context
+            commit: Commit immediately; pass False to write the entry in the
+                caller's transaction
+            
+        Returns:
+            Dictionary of the buffered AuditLog column values
+        """
+        entry = AuditLog.build_entry(
+            action,
+            entity_type,
             entity_id=entity_id,
-            changes_json=changes_json,
-            ip_address=request.remote_addr if request else None,
-            user_agent=request.headers.get("User-Agent") if request else None,
-            request_id=g.get("request_id"),
-            metadata=metadata or {},
-            created_at=datetime.utcnow(),
+            old_values=old_values,
+            new_values=new_values,
+            metadata=metadata,
+            lookup_actor=False,
         )
 
-        db.session.add(audit_entry)
-        db.session.commit()
+        db.session.info.setdefault("audit_buffer", []).append(entry)
+        if commit:
+            db.session.commit()
+
+        return entry
+
+    @staticmethod
+    def log_actions_bulk(events: list, commit: bool = True) -> list:
+        """
+        Create several audit log entries at once.
+        
+        All entries share the buffered multi-row INSERT and a single actor
+        lookup when the transaction commits.
+        
+        Args:
+            events: Dicts of log_action() arguments (action, entity_type,
+                entity_id, old_values, new_values, metadata)
+            commit: Commit immediately; pass False to write the entries in the
+                caller's transaction
+            
+        Returns:
+            List of the buffered AuditLog column values
+        """
+        entries = [AuditLog.build_entry(lookup_actor=False, **event) for event in events]
+
+        db.session.info.setdefault("audit_buffer", []).extend(entries)
+        if commit:
+            db.session.commit()
 
-        return audit_entry
+        return entries
 
     @classmethod
-    def get_resource_history(cls, entity_type: str, entity_id: str):
-        """Get complete audit history for an entity."""
-        return (
-            db.session.query(cls)
+    def ensure_partitions(cls, months_ahead: int = 2, commit: bool = True) -> List[str]:
+        """
+        Create monthly audit_logs partitions up to months_ahead months out.
+        
+        Run ahead of time (see the nightly maintenance task): rows for a
+        month without its own partition land in audit_logs_default, and a
+        partition can't be created for a range the default partition
+        already holds rows for. Old months are retired by dropping their
+        partition table.
+        
+        Args:
+            months_ahead: Months after the current one to prepare
+            commit: Commit immediately
+            
+        Returns:
+            Names of the partitions for the covered months
+        """
+        if db.engine.dialect.name != "postgresql":
+            return []
+
+        names = []
+        start = date.today().replace(day=1)
+        for _ in range(months_ahead + 1):
+            end = (start + timedelta(days=32)).replace(day=1)
+            name = f"audit_logs_{start:%Y_%m}"
+            db.session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+            )
+            names.append(name)
+            start = end
+        if commit:
+            db.session.commit()
+        return names
+
+    @classmethod
+    def get_resource_history(
+        cls, entity_type: str, entity_id: str, batch_size: int = 500
+    ) -> Iterator["AuditLog"]:
+        """
+        Stream the complete audit history for an entity, newest first.
+        
+        Rows are fetched batch_size at a time over a server-side cursor, so
+        memory stays flat however long the history is. Consume the iterator
+        before the session is committed or closed.
+        """
+        return db.session.scalars(
+            db.select(cls)
             .filter_by(entity_type=entity_type, entity_id=entity_id)
             .order_by(cls.created_at.desc())
-            .all()
+            .execution_options(yield_per=batch_size)
         )
 
     @classmethod
-    def get_user_activity(cls, user_id: str, limit: int = 100):
-        """Get recent activity for a user."""
-        return (
-            db.session.query(cls)
-            .filter_by(actor_user_id=user_id)
-            .order_by(cls.created_at.desc())
-            .limit(limit)
-            .all()
+    def get_user_activity(
+        cls, user_id: str, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List["AuditLog"], Optional[str]]:
+        """
+        Get a user's activity, newest first, one keyset page at a time.
+        
+        Args:
+            user_id: Actor user ID
+            limit: Entries per page
+            cursor: Cursor returned with the previous page, if any
+            
+        Returns:
+            Tuple of (entries, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        from app.utils.pagination import keyset_paginate
+
+        return keyset_paginate(
+            db.session.query(cls).filter_by(actor_user_id=user_id),
+            [cls.created_at, cls.id],
+            per_page=limit,
+            cursor=cursor,
         )
+
+
+# Catch-all partition so inserts never fail for a month without its own
+# partition (tables created by create_all rather than migrations)
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+@event.listens_for(Session, "before_commit")
+def write_buffered_audit_entries(session):
+    """Insert buffered audit entries in the committing transaction."""
+    # Commit flushes after this hook; flush now so auto-audited changes
+    # (AuditableMixin) are buffered too
+    session.flush()
+    entries = session.info.pop("audit_buffer", None)
+    if entries:
+        AuditLog.fill_actors(entries)
+        session.execute(insert(AuditLog), entries)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_buffered_audit_entries(session, previous_transaction):
+    """Drop audit entries for rolled-back changes."""
+    # Fires even when no DB transaction had begun yet; keep the buffer
+    # across savepoint rollbacks inside a still-open transaction
+    if not session.in_transaction():
+        session.info.pop("audit_buffer", None)
+        session.info.pop("_pending_audit", None)
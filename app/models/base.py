@@ -1,13 +1,46 @@
 """Base model with common fields and soft delete functionality."""
 import uuid
 from datetime import datetime
+from operator import attrgetter
 
 from sqlalchemy import event
-from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, Session, declared_attr, mapped_column
+from sqlalchemy.orm.attributes import PASSIVE_NO_INITIALIZE, get_history
 
 from app.core.extensions import db
 
 
+class GUID(db.TypeDecorator):
+    """
+    UUID column type with string values.
+    
+    Stored as a native 16-byte uuid on PostgreSQL and as a 36-character
+    string elsewhere. Values that aren't UUIDs (e.g. a mistyped ID in a
+    URL) bind as NULL, so lookups find nothing instead of raising.
+    """
+
+    impl = db.String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(db.String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return None
+
+
+# JSONB on PostgreSQL (binary storage, GIN-indexable), plain JSON elsewhere
+JSONType = db.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
 class BaseModel(db.Model):
     """
     Abstract base model with common fields.
@@ -22,9 +55,11 @@ class BaseModel(db.Model):
     __abstract__ = True
 
     id: Mapped[str] = mapped_column(
-        db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        GUID, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     created_at: Mapped[datetime] = mapped_column(db.DateTime, default=datetime.utcnow, nullable=False)
+    # Set by onupdate for ORM and Core updates; on PostgreSQL a trigger also
+    # covers statements that leave it out (see the set_updated_at migration)
     updated_at: Mapped[datetime] = mapped_column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
@@ -33,32 +68,41 @@ class BaseModel(db.Model):
     is_deleted: Mapped[bool] = mapped_column(db.Boolean, default=False, nullable=False, index=True)
     deleted_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=True)
 
-    def save(self):
-        """Save instance to database."""
+    def save(self, commit: bool = True):
+        """
+        Save instance to database.
+        
+        Args:
+            commit: Commit immediately; pass False to leave the commit to
+                the caller's transaction
+        """
         db.session.add(self)
-        db.session.commit()
+        if commit:
+            db.session.commit()
         return self
 
-    def delete(self, soft: bool = True):
+    def delete(self, soft: bool = True, commit: bool = True):
         """
         Delete instance from database.
         
         Args:
             soft: If True, perform soft delete. If False, hard delete.
+            commit: Commit immediately
         """
         if soft:
             self.is_deleted = True
             self.deleted_at = datetime.utcnow()
-            db.session.commit()
         else:
             db.session.delete(self)
+        if commit:
             db.session.commit()
 
-    def restore(self):
+    def restore(self, commit: bool = True):
         """Restore soft-deleted instance."""
         self.is_deleted = False
         self.deleted_at = None
-        db.session.commit()
+        if commit:
+            db.session.commit()
 
     @classmethod
     def get_by_id(cls, record_id: str):
@@ -73,6 +117,18 @@ class BaseModel(db.Model):
             query = query.filter_by(is_deleted=False)
         return query.all()
 
+    @classmethod
+    def _serializer(cls):
+        """(name, getter, is_datetime) for each column, built once per class."""
+        serializer = cls.__dict__.get("_serializer_cache")
+        if serializer is None:
+            serializer = tuple(
+                (column.name, attrgetter(column.name), isinstance(column.type, db.DateTime))
+                for column in cls.__table__.columns
+            )
+            cls._serializer_cache = serializer
+        return serializer
+
     def to_dict(self, exclude: list = None):
         """
         Convert model instance to dictionary.
@@ -80,14 +136,15 @@ class BaseModel(db.Model):
         Args:
             exclude: List of fields to exclude from output
         """
-        exclude = exclude or []
+        exclude = exclude or ()
         data = {}
-        for column in self.__table__.columns:
-            if column.name not in exclude:
-                value = getattr(self, column.name)
-                if isinstance(value, datetime):
-                    value = value.isoformat()
-                data[column.name] = value
+        for name, getter, is_datetime in self._serializer():
+            if name in exclude:
+                continue
+            value = getter(self)
+            if is_datetime and isinstance(value, datetime):
+                value = value.isoformat()
+            data[name] = value
         return data
 
     def __repr__(self):
@@ -104,12 +161,36 @@ class AuditMixin:
     @declared_attr
     def created_by(cls):
         """User who created the record."""
-        return mapped_column(db.String(36), db.ForeignKey("users.id"), nullable=True)
+        return mapped_column(GUID, db.ForeignKey("users.id"), nullable=True)
 
     @declared_attr
     def updated_by(cls):
         """User who last updated the record."""
-        return mapped_column(db.String(36), db.ForeignKey("users.id"), nullable=True)
+        return mapped_column(GUID, db.ForeignKey("users.id"), nullable=True)
+
+
+class AuditableMixin:
+    """
+    Mixin for models whose changes are audited automatically.
+    
+    Inserts, updates to __audit_fields__, soft deletes and deletes are
+    recorded on flush and written with the transaction's other audit
+    entries, so callers don't log them with AuditLog.log_action.
+    """
+
+    __audit_entity__: str = None  # entity_type; defaults to the table name
+    __audit_fields__: tuple = ()
+
+    def _audit_changes(self):
+        """Old and new values of changed audit fields for a pending update."""
+        old_values, new_values = {}, {}
+        for field in self.__audit_fields__:
+            # Never load expired attributes just to diff them
+            history = get_history(self, field, passive=PASSIVE_NO_INITIALIZE)
+            if history.added:
+                old_values[field] = history.deleted[0] if history.deleted else None
+                new_values[field] = history.added[0]
+        return old_values, new_values
 
 
 class TimestampMixin:
@@ -118,8 +199,52 @@ class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(db.DateTime, default=datetime.utcnow, nullable=False)
 
 
-# Event listeners for automatic timestamp updates
-@event.listens_for(BaseModel, "before_update", propagate=True)
-def receive_before_update(mapper, connection, target):
-    """Update updated_at timestamp before update."""
-    target.updated_at = datetime.utcnow()
+@event.listens_for(Session, "before_flush")
+def collect_audited_changes(session, flush_context, instances):
+    """Diff pending changes to auditable models before they are flushed."""
+    from app.models.audit import AuditAction
+
+    pending = session.info.setdefault("_pending_audit", [])
+    for instance in session.new:
+        if isinstance(instance, AuditableMixin):
+            pending.append((instance, AuditAction.CREATE, None, None))
+    for instance in session.dirty:
+        if not isinstance(instance, AuditableMixin):
+            continue
+        if isinstance(instance, BaseModel) and get_history(
+            instance, "is_deleted", passive=PASSIVE_NO_INITIALIZE
+        ).added == [True]:
+            pending.append((instance, AuditAction.DELETE, None, None))
+            continue
+        old_values, new_values = instance._audit_changes()
+        if new_values:
+            pending.append((instance, AuditAction.UPDATE, old_values, new_values))
+    for instance in session.deleted:
+        if isinstance(instance, AuditableMixin):
+            pending.append((instance, AuditAction.DELETE, None, None))
+
+
+@event.listens_for(Session, "after_flush")
+def buffer_audited_changes(session, flush_context):
+    """Queue audit entries for flushed changes, now that new rows have IDs."""
+    pending = session.info.pop("_pending_audit", None)
+    if not pending:
+        return
+
+    from app.models.audit import AuditLog
+
+    buffer = session.info.setdefault("audit_buffer", [])
+    for instance, action, old_values, new_values in pending:
+        entry = AuditLog.build_entry(
+            action,
+            instance.__audit_entity__ or instance.__tablename__,
+            entity_id=instance.id,
+            old_values=old_values,
+            new_values=new_values,
+            lookup_actor=False,
+        )
+        # Record the row's own tenant; changes made outside a request
+        # (tasks, CLI) have no tenant in context
+        entry["tenant_id"] = getattr(instance, "tenant_id", None) or entry["tenant_id"]
+        if entry["tenant_id"]:
+            buffer.append(entry)
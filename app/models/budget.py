@@ -1,14 +1,29 @@
 """Budget management models."""
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
+from typing import Tuple
 
-from sqlalchemy import CheckConstraint, Numeric
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    CheckConstraint,
+    Numeric,
+    and_,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.core.extensions import db
 from app.core.tenancy import TenantMixin
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel
 
 
 class BudgetPeriod(str, Enum):
@@ -48,10 +63,10 @@ class Budget(BaseModel, TenantMixin):
     
     # Scope (optional filters)
     category_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("categories.id"), nullable=True, index=True
+        GUID, db.ForeignKey("categories.id"), nullable=True, index=True
     )
     owner_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("users.id"), nullable=True, index=True
+        GUID, db.ForeignKey("users.id"), nullable=True, index=True
     )  # Budget for specific user
     
     # Alert settings
@@ -68,6 +83,8 @@ class Budget(BaseModel, TenantMixin):
     category = relationship("Category")
     owner = relationship("User", back_populates="budgets", foreign_keys=[owner_id])
     alerts = relationship("BudgetAlert", back_populates="budget", cascade="all, delete-orphan")
+    # Written with Core statements by refresh_spend_snapshots()
+    spent_cached = relationship("BudgetSpendSnapshot", uselist=False, viewonly=True)
 
     __table_args__ = (
         CheckConstraint("amount > 0", name="check_budget_amount_positive"),
@@ -75,17 +92,20 @@ class Budget(BaseModel, TenantMixin):
         CheckConstraint(
             "alert_threshold >= 0 AND alert_threshold <= 100", name="check_alert_threshold"
         ),
-        db.Index("idx_tenant_period", "tenant_id", "period"),
+        db.Index(
+            "ix_budget_active_period",
+            "tenant_id",
+            "period",
+            postgresql_where=db.text("is_active = true"),
+        ),
         db.Index("idx_tenant_active", "tenant_id", "is_active"),
     )
 
     def __repr__(self):
         return f"<Budget {self.name} - {self.amount} {self.currency}>"
 
-    def get_spent_amount(self) -> Decimal:
-        """Calculate total spent against this budget."""
-        from sqlalchemy import func
-
+    def _query_spent(self) -> Decimal:
+        """Aggregate the expenses counted against this budget."""
         from app.models.expense import Expense
 
         query = (
@@ -109,15 +129,31 @@ class Budget(BaseModel, TenantMixin):
         spent = query.scalar() or Decimal("0.00")
         return spent
 
+    @cached_property
+    def _spent(self) -> Decimal:
+        """
+        Spent amount shared by the helpers below.
+        
+        Read from the spend snapshot when one exists, otherwise aggregated;
+        memoized until the budget is expired or refreshed.
+        """
+        if self.spent_cached is not None:
+            return self.spent_cached.spent
+        return self._query_spent()
+
+    def get_spent_amount(self) -> Decimal:
+        """Calculate total spent against this budget."""
+        return self._spent
+
     def get_remaining_amount(self) -> Decimal:
         """Calculate remaining budget."""
-        return self.amount - self.get_spent_amount()
+        return self.amount - self._spent
 
     def get_utilization_percentage(self) -> float:
         """Calculate budget utilization as percentage."""
         if self.amount == 0:
             return 0.0
-        return float((self.get_spent_amount() / self.amount) * 100)
+        return float((self._spent / self.amount) * 100)
 
     def should_alert(self) -> bool:
         """Check if budget has exceeded alert threshold."""
@@ -127,7 +163,96 @@ class Budget(BaseModel, TenantMixin):
 
     def is_exceeded(self) -> bool:
         """Check if budget is exceeded."""
-        return self.get_spent_amount() > self.amount
+        return self._spent > self.amount
+
+    def get_summary(self) -> Tuple[Decimal, Decimal, float, bool, bool]:
+        """
+        Spend status from a single spent lookup.
+        
+        Returns:
+            Tuple of (spent, remaining, utilization percentage, exceeded,
+            should_alert)
+        """
+        return (
+            self._spent,
+            self.get_remaining_amount(),
+            self.get_utilization_percentage(),
+            self.is_exceeded(),
+            self.should_alert(),
+        )
+
+    @classmethod
+    def refresh_spend_snapshots(cls, *criteria, commit: bool = True) -> None:
+        """
+        Recompute spend snapshots for budgets matching criteria (all if none).
+        
+        Each budget's total is recomputed with the same filters as the live
+        aggregate rather than adjusted by deltas, so edits that move an
+        expense between budgets (date, category, creator, soft delete)
+        can't leave a snapshot drifting. Runs as a single INSERT ... SELECT
+        ... ON CONFLICT DO UPDATE however many budgets match, so concurrent
+        commits refreshing the same budget don't collide on its snapshot
+        row (other databases delete and re-insert the rows instead).
+        
+        Args:
+            criteria: Filters on Budget selecting the budgets to refresh
+            commit: Commit immediately; pass False to refresh in the
+                caller's transaction
+        """
+        from app.models.expense import Expense
+
+        spent = (
+            select(func.coalesce(func.sum(Expense.amount), 0))
+            .where(
+                Expense.tenant_id == cls.tenant_id,
+                Expense.is_deleted == False,
+                Expense.expense_date >= cls.start_date,
+                Expense.expense_date <= cls.end_date,
+                or_(cls.category_id.is_(None), Expense.category_id == cls.category_id),
+                or_(cls.owner_id.is_(None), Expense.created_by == cls.owner_id),
+            )
+            .correlate(cls)
+            .scalar_subquery()
+        )
+        snapshots = BudgetSpendSnapshot.__table__
+        columns = ["budget_id", "spent", "as_of"]
+        rows = select(cls.id, spent, literal(datetime.utcnow(), db.DateTime)).where(*criteria)
+
+        if db.engine.dialect.name == "postgresql":
+            stmt = postgresql.insert(snapshots).from_select(columns, rows)
+            db.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["budget_id"],
+                    set_={"spent": stmt.excluded.spent, "as_of": stmt.excluded.as_of},
+                )
+            )
+        else:
+            budget_ids = select(cls.id).where(*criteria)
+            db.session.execute(delete(snapshots).where(snapshots.c.budget_id.in_(budget_ids)))
+            db.session.execute(insert(snapshots).from_select(columns, rows))
+        if commit:
+            db.session.commit()
+
+
+class BudgetSpendSnapshot(db.Model):
+    """
+    Materialized spend total for a budget.
+    
+    Refreshed when expenses or budgets change (see refresh_changed_budgets)
+    and nightly, so budget status reads one row instead of aggregating
+    expenses.
+    """
+
+    __tablename__ = "budget_spend_snapshots"
+
+    budget_id: Mapped[str] = mapped_column(
+        GUID, db.ForeignKey("budgets.id", ondelete="CASCADE"), primary_key=True
+    )
+    spent: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, default=0)
+    as_of: Mapped[datetime] = mapped_column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<BudgetSpendSnapshot {self.budget_id} - {self.spent}>"
 
 
 class BudgetAlert(BaseModel, TenantMixin):
@@ -136,7 +261,7 @@ class BudgetAlert(BaseModel, TenantMixin):
     __tablename__ = "budget_alerts"
 
     budget_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("budgets.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("budgets.id", ondelete="CASCADE"), nullable=False, index=True
     )
     
     # Alert details
@@ -155,3 +280,70 @@ class BudgetAlert(BaseModel, TenantMixin):
 
     def __repr__(self):
         return f"<BudgetAlert {self.budget_id} - {self.threshold_percentage}%>"
+
+
+@event.listens_for(Budget, "expire")
+@event.listens_for(Budget, "refresh")
+def reset_spent(target, *args):
+    """Drop the memoized spent amount when a budget is reloaded."""
+    target.__dict__.pop("_spent", None)
+
+
+def mark_expense_dates_changed(session, tenant_id, expense_dates) -> None:
+    """
+    Refresh spend snapshots of a tenant's budgets covering any of
+    expense_dates when session commits.
+    
+    For expense writes that bypass the unit of work (bulk inserts), which
+    collect_changed_budgets can't see.
+    """
+    dates = session.info.setdefault("budget_spend_dates", {}).setdefault(tenant_id, set())
+    for value in expense_dates:
+        if value:
+            dates.add(value.date() if isinstance(value, datetime) else value)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_changed_budgets(session, flush_context):
+    """Remember which budgets and expense dates changes may affect."""
+    from app.models.expense import Expense
+
+    for instance in session.new | session.dirty | session.deleted:
+        if isinstance(instance, Budget):
+            session.info.setdefault("budget_spend_budgets", set()).add(instance.id)
+        elif isinstance(instance, Expense):
+            # Include the previous date when an expense is moved
+            history = inspect(instance).attrs.expense_date.history
+            mark_expense_dates_changed(
+                session, instance.tenant_id, (instance.expense_date, *history.deleted)
+            )
+
+
+@event.listens_for(Session, "before_commit")
+def refresh_changed_budgets(session):
+    """Refresh spend snapshots for affected budgets in the committing transaction."""
+    # Commit flushes after this hook; flush now so pending changes are seen
+    session.flush()
+    budget_ids = session.info.pop("budget_spend_budgets", set())
+    dates_by_tenant = session.info.pop("budget_spend_dates", {})
+
+    criteria = [Budget.id.in_(budget_ids)] if budget_ids else []
+    for tenant_id, dates in dates_by_tenant.items():
+        if dates:
+            criteria.append(
+                and_(
+                    Budget.tenant_id == tenant_id,
+                    Budget.start_date <= max(dates),
+                    Budget.end_date >= min(dates),
+                )
+            )
+    if criteria:
+        Budget.refresh_spend_snapshots(or_(*criteria), commit=False)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_changed_budgets(session, previous_transaction):
+    """Forget pending snapshot refreshes for rolled-back changes."""
+    if not session.in_transaction():
+        session.info.pop("budget_spend_budgets", None)
+        session.info.pop("budget_spend_dates", None)
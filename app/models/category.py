@@ -1,10 +1,11 @@
 """Category model for expense categorization."""
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel
 
 
 class Category(BaseModel):
@@ -18,10 +19,10 @@ class Category(BaseModel):
 
     # Tenant relationship
     tenant_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
     project_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Basic fields
@@ -37,7 +38,7 @@ class Category(BaseModel):
 
     # Audit fields
     created_by: Mapped[Optional[str]] = mapped_column(
-        db.String(36), db.ForeignKey("users.id"), nullable=True
+        GUID, db.ForeignKey("users.id"), nullable=True
     )
 
     # Relationships
@@ -58,11 +59,16 @@ class Category(BaseModel):
     @property
     def total_expenses(self) -> int:
         """Count total expenses in this category."""
+        if "_metrics" in self.__dict__:
+            return self._metrics[0]
         return self.expenses.filter_by(is_deleted=False).count()
 
     @property
     def total_amount(self) -> float:
         """Calculate total amount of expenses in this category."""
+        if "_metrics" in self.__dict__:
+            return self._metrics[1]
+
         from app.models.expense import Expense
         
         total = db.session.query(
@@ -74,12 +80,55 @@ class Category(BaseModel):
         
         return float(total or 0)
 
+    @classmethod
+    def with_metrics(
+        cls, tenant_id: str, project_id: Optional[str] = None
+    ) -> List[Tuple["Category", int, float]]:
+        """
+        Categories with their expense count and total from one GROUP BY query.
+        
+        The aggregates are also kept on each category, so total_expenses,
+        total_amount and to_dict(include_metrics=True) don't query again.
+        
+        Args:
+            tenant_id: Tenant ID
+            project_id: Only categories of this project
+            
+        Returns:
+            List of (category, expense count, total amount)
+        """
+        from app.models.expense import Expense
+
+        query = (
+            db.session.query(
+                cls,
+                func.count(Expense.id),
+                func.coalesce(func.sum(Expense.amount), 0),
+            )
+            .outerjoin(
+                Expense,
+                and_(Expense.category_id == cls.id, Expense.is_deleted == False),
+            )
+            .filter(cls.tenant_id == tenant_id, cls.is_deleted == False)
+            .group_by(cls.id)
+            .order_by(cls.name)
+        )
+        if project_id:
+            query = query.filter(cls.project_id == project_id)
+
+        results = []
+        for category, count, total in query.all():
+            category._metrics = (count, float(total))
+            results.append((category, count, float(total)))
+        return results
+
     def to_dict(self, include_metrics: bool = False):
         """
         Convert to dictionary.
         
         Args:
-            include_metrics: Include calculated metrics
+            include_metrics: Include calculated metrics (prefetched by
+                with_metrics() when available)
         """
         data = super().to_dict()
         
@@ -3,12 +3,13 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import JSON, CheckConstraint, Numeric
+from sqlalchemy import CheckConstraint, Numeric, event
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
 from app.core.tenancy import TenantMixin
-from app.models.base import AuditMixin, BaseModel
+from app.models.base import GUID, AuditMixin, BaseModel, JSONType
 
 
 class ExpenseStatus(str, Enum):
@@ -52,27 +53,30 @@ class Expense(BaseModel, TenantMixin, AuditMixin):
     
     # Categorization (nullable as per spec)
     category_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("categories.id"), nullable=True, index=True
+        GUID, db.ForeignKey("categories.id"), nullable=True, index=True
     )
     
     # Project relationship (nullable for unrelated expenses)
     project_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("projects.id"), nullable=True, index=True
+        GUID, db.ForeignKey("projects.id"), nullable=True, index=True
     )
     is_project_related: Mapped[bool] = mapped_column(db.Boolean, nullable=False, default=False)
     
     # Account relationship (required - where money comes from)
     account_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("accounts.id"), nullable=False, index=True
+        GUID, db.ForeignKey("accounts.id"), nullable=False, index=True
     )
     
     # Cross-project reference (optional)
     cross_project_ref_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("expenses.id"), nullable=True
+        GUID, db.ForeignKey("expenses.id"), nullable=True
     )
     
-    # Date tracking (stored in UTC)
-    expense_date: Mapped[datetime] = mapped_column(db.DateTime, nullable=False, index=True)
+    # Date tracking (stored in UTC); previous value kept on change for
+    # budget spend snapshot refreshes
+    expense_date: Mapped[datetime] = mapped_column(
+        db.DateTime, nullable=False, index=True, active_history=True
+    )
     
     # Payment details (kept for compatibility)
     payment_method: Mapped[str] = mapped_column(
@@ -87,13 +91,10 @@ class Expense(BaseModel, TenantMixin, AuditMixin):
     
     # Attachments
     receipt_url: Mapped[str] = mapped_column(db.String(512), nullable=True)
-    attachments: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
-    
-    # Tags for flexible filtering
-    tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    attachments: Mapped[list] = mapped_column(JSONType, nullable=False, default=list)
     
     # Additional metadata (renamed from 'metadata' to avoid SQLAlchemy reserved word)
-    expense_metadata: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    expense_metadata: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # Soft delete field (soft_deleted_at as per spec)
     deleted_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=True)
@@ -106,34 +107,83 @@ class Expense(BaseModel, TenantMixin, AuditMixin):
     creator = relationship("User", foreign_keys="Expense.created_by", backref="created_expenses")
     updater = relationship("User", foreign_keys="Expense.updated_by", backref="updated_expenses")
     cross_project_ref = relationship("Expense", remote_side="Expense.id", foreign_keys=[cross_project_ref_id])
+    tag_rows = relationship(
+        "ExpenseTag",
+        back_populates="expense",
+        lazy="selectin",
+        collection_class=set,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Tags for flexible filtering: a set of strings backed by expense_tags rows,
+    # so adding or removing one tag writes a single row
+    tags = association_proxy("tag_rows", "tag", creator=lambda tag: ExpenseTag(tag=tag))
 
     __table_args__ = (
         CheckConstraint("amount > 0", name="check_expense_amount_positive"),
-        db.Index("idx_tenant_date", "tenant_id", "expense_date"),
+        # Live rows only: soft-deleted expenses are never listed by date
+        db.Index(
+            "ix_expense_active",
+            "tenant_id",
+            "expense_date",
+            postgresql_where=db.text("is_deleted = false"),
+        ),
         db.Index("idx_tenant_category", "tenant_id", "category_id"),
         db.Index("idx_tenant_status", "tenant_id", "status"),
-        db.Index("idx_tenant_project", "tenant_id", "project_id"),
         db.Index("idx_tenant_account", "tenant_id", "account_id"),
+        db.Index("ix_expenses_tenant_project_date", "tenant_id", "project_id", "expense_date"),
+        # Covering index for per-project category breakdowns (PostgreSQL INCLUDE)
+        db.Index(
+            "ix_expenses_project_category",
+            "project_id",
+            "category_id",
+            postgresql_include=["amount"],
+        ),
+        # Containment lookups on metadata (expense_metadata @> '{...}'), JSONB only
+        db.Index(
+            "ix_expense_metadata_gin",
+            "expense_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"expense_metadata": "jsonb_path_ops"},
+        ),
+        # Per-project totals (SUM(amount), daily spend) as index-only scans
+        db.Index(
+            "ix_expenses_proj_amount_covering",
+            "tenant_id",
+            "project_id",
+            postgresql_include=["amount", "expense_date"],
+        ),
+        # Budget spend (Budget._query_spent, snapshot refreshes) as index-only scans
+        db.Index(
+            "ix_expense_budget_rollup",
+            "tenant_id",
+            "is_deleted",
+            "expense_date",
+            postgresql_include=["amount", "category_id", "created_by"],
+        ),
     )
 
     def __repr__(self):
         return f"<Expense {self.vendor or 'N/A'} - {self.amount} {self.currency}>"
 
-    def approve(self, approved_by: str):
+    def approve(self, approved_by: str, commit: bool = True):
         """Approve expense."""
         self.status = ExpenseStatus.APPROVED.value
         self.updated_by = approved_by
-        db.session.commit()
+        if commit:
+            db.session.commit()
 
-    def reject(self, rejected_by: str, reason: str = None):
+    def reject(self, rejected_by: str, reason: str = None, commit: bool = True):
         """Reject expense."""
         self.status = ExpenseStatus.REJECTED.value
         self.updated_by = rejected_by
         if reason:
             self.note = f"Rejection reason: {reason}\n{self.note or ''}"
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
-    def soft_delete(self, deleted_by: str = None):
+    def soft_delete(self, deleted_by: str = None, commit: bool = True):
         """Soft delete expense and reverse account balance impact."""
         from app.models.account import Account
         
@@ -148,23 +198,51 @@ class Expense(BaseModel, TenantMixin, AuditMixin):
             if account:
                 account.credit(self.amount, commit=False)
         
-        db.session.commit()
+        if commit:
+            db.session.commit()
 
-    def add_tag(self, tag: str):
+    def add_tag(self, tag: str, commit: bool = True):
         """Add tag to expense."""
         if tag not in self.tags:
-            tags = self.tags or []
-            tags.append(tag)
-            self.tags = tags
-            db.session.commit()
+            self.tags.add(tag)
+            if commit:
+                db.session.commit()
 
-    def remove_tag(self, tag: str):
+    def remove_tag(self, tag: str, commit: bool = True):
         """Remove tag from expense."""
         if tag in self.tags:
-            tags = self.tags or []
-            tags.remove(tag)
-            self.tags = tags
-            db.session.commit()
+            self.tags.discard(tag)
+            if commit:
+                db.session.commit()
+
+
+class ExpenseTag(db.Model):
+    """Tag attached to an expense."""
+
+    __tablename__ = "expense_tags"
+
+    expense_id: Mapped[str] = mapped_column(
+        GUID, db.ForeignKey("expenses.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(db.String(100), primary_key=True)
+    # Copied from the expense so tag filters don't need to join expenses
+    tenant_id: Mapped[str] = mapped_column(
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+    )
+
+    expense = relationship("Expense", back_populates="tag_rows")
+
+    __table_args__ = (db.Index("ix_expense_tag", "tenant_id", "tag"),)
+
+    def __repr__(self):
+        return f"<ExpenseTag {self.tag}>"
+
+
+@event.listens_for(ExpenseTag, "before_insert")
+def set_expense_tag_tenant(mapper, connection, target):
+    """Take the tenant from the tagged expense."""
+    if target.tenant_id is None:
+        target.tenant_id = target.expense.tenant_id
 
 
 class RecurringExpense(BaseModel, TenantMixin, AuditMixin):
@@ -182,7 +260,7 @@ class RecurringExpense(BaseModel, TenantMixin, AuditMixin):
     
     # Categorization
     category_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("categories.id"), nullable=False
+        GUID, db.ForeignKey("categories.id"), nullable=False
     )
     
     # Recurrence pattern
@@ -1,16 +1,17 @@
 """Project model for tracking budgeted projects."""
 from datetime import date, datetime
+from functools import cached_property
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
-from sqlalchemy import Numeric, event
+from sqlalchemy import DDL, Numeric, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, AuditableMixin, BaseModel
 
 
-class Project(BaseModel):
+class Project(BaseModel, AuditableMixin):
     """
     Project model for budget tracking.
     
@@ -18,10 +19,20 @@ class Project(BaseModel):
     """
 
     __tablename__ = "projects"
+    __audit_entity__ = "project"
+    __audit_fields__ = (
+        "name",
+        "description",
+        "start_date",
+        "end_date",
+        "starting_budget",
+        "projected_estimate",
+        "status",
+    )
 
     # Tenant relationship
     tenant_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Basic fields
@@ -44,7 +55,7 @@ class Project(BaseModel):
     
     # Audit fields
     created_by: Mapped[Optional[str]] = mapped_column(
-        db.String(36), db.ForeignKey("users.id"), nullable=True
+        GUID, db.ForeignKey("users.id"), nullable=True
     )
 
     # Relationships
@@ -57,14 +68,40 @@ class Project(BaseModel):
     __table_args__ = (
         db.Index("ix_projects_tenant_status", "tenant_id", "status"),
         db.Index("ix_projects_tenant_dates", "tenant_id", "start_date", "end_date"),
+        db.Index(
+            "ix_projects_tenant_created",
+            "tenant_id",
+            "is_deleted",
+            db.desc("created_at"),
+            db.desc("id"),
+        ),
+        # Trigram indexes (PostgreSQL) so ILIKE '%term%' search avoids a seq scan
+        db.Index(
+            "ix_projects_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        db.Index(
+            "ix_projects_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self):
         return f"<Project {self.name} ({self.status})>"
 
-    @property
+    @cached_property
     def total_spent(self) -> Decimal:
-        """Calculate total amount spent on this project."""
+        """
+        Calculate total amount spent on this project.
+        
+        Cached on the instance so the derived budget properties and schema
+        dumps share a single SUM query; dropped whenever the project is
+        expired or refreshed (e.g. on commit, see reset_total_spent).
+        """
         from app.models.expense import Expense
         
         total = db.session.query(
@@ -76,6 +113,43 @@ class Project(BaseModel):
         
         return Decimal(total or 0)
 
+    @classmethod
+    def bulk_totals(cls, projects: Iterable["Project"]) -> Dict[str, Decimal]:
+        """
+        Fill total_spent for several projects with one GROUP BY query.
+        
+        Use before reading total_spent (or the budget properties derived
+        from it) across a list of projects, instead of one SUM per project.
+        Seeded totals are dropped like computed ones when a project is
+        expired, so call again after committing expense changes.
+        
+        Args:
+            projects: Projects to load totals for
+            
+        Returns:
+            Mapping of project ID to total spent
+        """
+        from app.models.expense import Expense
+
+        projects = list(projects)
+        if not projects:
+            return {}
+
+        rows = db.session.execute(
+            db.select(Expense.project_id, db.func.sum(Expense.amount))
+            .where(
+                Expense.project_id.in_([p.id for p in projects]),
+                Expense.is_deleted == False,
+            )
+            .group_by(Expense.project_id)
+        ).all()
+        totals = {project_id: Decimal(total or 0) for project_id, total in rows}
+
+        for project in projects:
+            # Seeds the cached_property
+            project.__dict__["total_spent"] = totals.setdefault(project.id, Decimal(0))
+        return totals
+
     @property
     def remaining_budget(self) -> Decimal:
         """Calculate remaining budget."""
@@ -136,3 +210,19 @@ class Project(BaseModel):
             })
         
         return data
+
+
+# The trigram indexes need pg_trgm (tables created by create_all rather
+# than migrations)
+event.listen(
+    Project.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Project, "expire")
+@event.listens_for(Project, "refresh")
+def reset_total_spent(target, *args):
+    """Drop the memoized total spent when a project is reloaded."""
+    target.__dict__.pop("total_spent", None)
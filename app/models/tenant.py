@@ -1,11 +1,10 @@
 """Tenant models for multi-tenancy support."""
 from datetime import datetime
 
-from sqlalchemy import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel, JSONType
 
 
 class Tenant(BaseModel):
@@ -18,10 +17,13 @@ class Tenant(BaseModel):
     __tablename__ = "tenants"
 
     name: Mapped[str] = mapped_column(db.String(255), nullable=False)
-    subdomain: Mapped[str] = mapped_column(db.String(63), unique=True, nullable=False, index=True)
+    # active_history: renames must know the old value to drop its cache entry
+    subdomain: Mapped[str] = mapped_column(
+        db.String(63), unique=True, nullable=False, index=True, active_history=True
+    )
     
     # Settings stored as JSON
-    settings: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    settings: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # Plan and limits
     plan: Mapped[str] = mapped_column(
@@ -52,13 +54,27 @@ class Tenant(BaseModel):
         """
         Check if tenant is within resource limits.
         
+        Counts with a COUNT(*) query rather than loading the relationship.
+        Soft-deleted expenses don't count toward the limit.
+        
         Args:
             resource_type: 'users' or 'expenses'
         """
+        from app.models.expense import Expense
+        from app.models.user import User
+
         if resource_type == "users":
-            return len(self.users) < self.max_users
+            count = db.session.execute(
+                db.select(db.func.count()).select_from(User).filter_by(tenant_id=self.id)
+            ).scalar_one()
+            return count < self.max_users
         elif resource_type == "expenses":
-            return len(self.expenses) < self.max_expenses
+            count = db.session.execute(
+                db.select(db.func.count())
+                .select_from(Expense)
+                .filter_by(tenant_id=self.id, is_deleted=False)
+            ).scalar_one()
+            return count < self.max_expenses
         return True
 
     def suspend(self, reason: str):
@@ -86,9 +102,11 @@ class TenantDomain(BaseModel):
     __tablename__ = "tenant_domains"
 
     tenant_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    domain: Mapped[str] = mapped_column(
+        db.String(255), unique=True, nullable=False, index=True, active_history=True
     )
-    domain: Mapped[str] = mapped_column(db.String(255), unique=True, nullable=False, index=True)
     is_verified: Mapped[bool] = mapped_column(db.Boolean, default=False, nullable=False)
     is_active: Mapped[bool] = mapped_column(db.Boolean, default=True, nullable=False)
     verified_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=True)
@@ -2,13 +2,11 @@
 from datetime import datetime
 from enum import Enum
 
-import bcrypt
-from sqlalchemy import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
 from app.core.tenancy import TenantMixin
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel, JSONType
 
 
 class UserRole(str, Enum):
@@ -53,7 +51,7 @@ class User(BaseModel, TenantMixin):
     login_count: Mapped[int] = mapped_column(db.Integer, default=0, nullable=False)
     
     # Preferences
-    preferences: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    preferences: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
     
     # Relationships
     tenant = relationship("Tenant", back_populates="users")
@@ -66,20 +64,40 @@ class User(BaseModel, TenantMixin):
     )
 
     # Unique constraint: email must be unique within tenant
-    __table_args__ = (db.UniqueConstraint("tenant_id", "email", name="uq_tenant_email"),)
+    __table_args__ = (
+        db.UniqueConstraint("tenant_id", "email", name="uq_tenant_email"),
+        # Keyset pagination over live users, newest first
+        db.Index(
+            "ix_users_tenant_created",
+            "tenant_id",
+            db.desc("created_at"),
+            db.desc("id"),
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+        # User list role/status filters
+        db.Index(
+            "ix_users_tenant_role_active",
+            "tenant_id",
+            "role",
+            "is_active",
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+    )
 
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
 
     def set_password(self, password: str):
         """Hash and set user password."""
-        self.password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-            "utf-8"
-        )
+        from app.core.security import hash_password
+
+        self.password_hash = hash_password(password)
 
     def check_password(self, password: str) -> bool:
         """Verify password against hash."""
-        return bcrypt.checkpw(password.encode("utf-8"), self.password_hash.encode("utf-8"))
+        from app.core.security import verify_password
+
+        return verify_password(password, self.password_hash)
 
     def update_login(self):
         """Update login tracking fields."""
@@ -149,7 +167,7 @@ class PasswordResetToken(BaseModel):
     __tablename__ = "password_reset_tokens"
 
     user_id: Mapped[str] = mapped_column(
-        db.String(36), db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     token: Mapped[str] = mapped_column(db.String(255), unique=True, nullable=False, index=True)
     expires_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=False)
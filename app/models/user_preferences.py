@@ -1,11 +1,10 @@
 """User preferences model for notification settings."""
 from typing import Optional
 
-from sqlalchemy import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.extensions import db
-from app.models.base import BaseModel
+from app.models.base import GUID, BaseModel, JSONType
 
 
 class UserPreferences(BaseModel):
@@ -19,7 +18,7 @@ class UserPreferences(BaseModel):
 
     # User relationship (one-to-one)
     user_id: Mapped[str] = mapped_column(
-        db.String(36),
+        GUID,
         db.ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
@@ -63,8 +62,8 @@ class UserPreferences(BaseModel):
         db.String(20), nullable=False, default="dark"
     )  # dark, light, auto
     
-    dashboard_layout: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    chart_preferences: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    dashboard_layout: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
+    chart_preferences: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
     
     # Timezone
     timezone: Mapped[str] = mapped_column(
@@ -77,7 +76,7 @@ class UserPreferences(BaseModel):
     )
     
     # Additional custom settings
-    custom_settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    custom_settings: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="preferences_model")
@@ -129,21 +128,47 @@ class UserPreferences(BaseModel):
         return self.in_app_notifications
     
     @classmethod
-    def get_or_create_for_user(cls, user_id: str) -> "UserPreferences":
+    def get_or_create_for_user(cls, user_id: str, commit: bool = True) -> "UserPreferences":
         """
         Get or create preferences for user.
         
+        Uses a single INSERT ... ON CONFLICT (user_id) DO UPDATE ... RETURNING
+        statement so the common "already exists" path costs one round trip
+        and concurrent first requests cannot race on the unique constraint.
+        
         Args:
             user_id: User ID
+            commit: Whether to commit transaction
             
         Returns:
             UserPreferences instance
         """
-        prefs = cls.query.filter_by(user_id=user_id).first()
+        dialect = db.session.get_bind().dialect.name
+        
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            prefs = cls.query.filter_by(user_id=user_id).first()
+            if not prefs:
+                prefs = cls(user_id=user_id)
+                db.session.add(prefs)
+                if commit:
+                    db.session.commit()
+            return prefs
+        
+        stmt = (
+            insert(cls)
+            .values(user_id=user_id)
+            .on_conflict_do_update(index_elements=[cls.user_id], set_={"user_id": user_id})
+            .returning(cls)
+        )
+        prefs = db.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).scalar_one()
         
-        if not prefs:
-            prefs = cls(user_id=user_id)
-            db.session.add(prefs)
+        if commit:
             db.session.commit()
         
         return prefs
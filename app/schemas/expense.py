@@ -1,7 +1,7 @@
 """Expense schemas for API validation and serialization."""
 from datetime import date
 
-from marshmallow import Schema, ValidationError, fields, validates
+from marshmallow import Schema, ValidationError, fields, validate, validates
 from app.core.extensions import db
 from app.models.user import User
 
@@ -105,11 +105,49 @@ class ExpenseCreateSchema(Schema):
     )
     payment_reference = fields.Str(allow_none=True)
     receipt_url = fields.Str(allow_none=True)
-    tags = fields.List(fields.Str(), missing=list)
+    tags = fields.List(fields.Str(validate=validate.Length(min=1, max=100)), missing=list)
     notes = fields.Str(allow_none=True)
     metadata = fields.Dict(missing=dict)
 
 
+class ExpenseBulkCreateSchema(Schema):
+    """
+    Schema for one expense of a bulk import.
+
+    Loads straight into Expense column names, since bulk rows are inserted
+    without going through the model constructor.
+    """
+
+    amount = fields.Decimal(required=True, places=2)
+    currency = fields.Str(load_default="USD", validate=lambda x: len(x) == 3)
+    vendor = fields.Str(allow_none=True, validate=validate.Length(max=255))
+    note = fields.Str(allow_none=True)
+    account_id = fields.Str(required=True)
+    project_id = fields.Str(required=True)
+    category_id = fields.Str(allow_none=True)
+    expense_date = fields.Date(required=True)
+    payment_method = fields.Str(
+        load_default="cash",
+        validate=validate.OneOf(["cash", "credit_card", "debit_card", "bank_transfer", "other"]),
+    )
+    payment_reference = fields.Str(allow_none=True)
+    receipt_url = fields.Str(allow_none=True)
+    tags = fields.List(fields.Str(validate=validate.Length(min=1, max=100)), load_default=list)
+    expense_metadata = fields.Dict(data_key="metadata", load_default=dict)
+
+    @validates("amount")
+    def validate_amount(self, value):
+        """Validate amount is positive."""
+        if value <= 0:
+            raise ValidationError("Amount must be greater than 0")
+
+    @validates("expense_date")
+    def validate_date(self, value):
+        """Validate expense date is not in the future."""
+        if value > date.today():
+            raise ValidationError("Expense date cannot be in the future")
+
+
 class ExpenseUpdateSchema(Schema):
     """Schema for updating an expense."""
 
@@ -124,7 +162,7 @@ class ExpenseUpdateSchema(Schema):
     )
     payment_reference = fields.Str(allow_none=True)
     receipt_url = fields.Str(allow_none=True)
-    tags = fields.List(fields.Str())
+    tags = fields.List(fields.Str(validate=validate.Length(min=1, max=100)))
     notes = fields.Str(allow_none=True)
     metadata = fields.Dict()
 
@@ -145,6 +183,7 @@ class ExpenseFilterSchema(Schema):
     search = fields.Str()  # Search in title/description
     page = fields.Int(missing=1, validate=lambda x: x > 0)
     per_page = fields.Int(missing=20, validate=lambda x: 1 <= x <= 100)
+    cursor = fields.Str()  # Keyset pagination; pass empty for the first page
     sort_by = fields.Str(missing="expense_date", validate=lambda x: x in ["expense_date", "amount", "created_at"])
     sort_order = fields.Str(missing="desc", validate=lambda x: x in ["asc", "desc"])
 
@@ -160,6 +160,7 @@ class AlertService:
             query = query.filter_by(id=project_id)
         
         projects = query.all()
+        Project.bulk_totals(projects)
         created_alerts = []
         
         for project in projects:
@@ -238,8 +239,8 @@ class AlertService:
 
         today = date.today()
         for budget in budgets:
-            utilization = budget.get_utilization_percentage()
-            spent = float(budget.get_spent_amount())
+            spent, _, utilization, _, _ = budget.get_summary()
+            spent = float(spent)
             remaining = float(budget.amount) - spent
             threshold_pct = budget.alert_threshold or 80
             alert_type = None
@@ -0,0 +1,165 @@
+"""Background audit log writer."""
+import atexit
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from flask import Flask
+from loguru import logger
+from sqlalchemy import insert
+
+from app.core.extensions import db
+from app.models.audit import AuditAction, AuditLog
+
+
+class AuditQueue:
+    """
+    Fire-and-forget audit log writer.
+
+    Audit entries are captured from the request context and handed to a
+    bounded in-process queue. A daemon worker drains the queue in batches
+    (every AUDIT_FLUSH_INTERVAL seconds or AUDIT_BATCH_SIZE rows) with a
+    single bulk insert, so mutations no longer pay for the audit INSERT on
+    the request path. When the queue is full, or AUDIT_ASYNC is disabled,
+    entries are written synchronously instead.
+    """
+
+    def __init__(self, app: Optional[Flask] = None):
+        self.app = None
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """Bind the queue to an application."""
+        self.app = app
+        self.enabled = app.config.get("AUDIT_ASYNC", True)
+        self.batch_size = app.config.get("AUDIT_BATCH_SIZE", 500)
+        self.flush_interval = app.config.get("AUDIT_FLUSH_INTERVAL", 0.1)
+        self._queue = queue.Queue(maxsize=app.config.get("AUDIT_QUEUE_SIZE", 10000))
+        atexit.register(self.flush)
+
+    def log_action(
+        self,
+        action: AuditAction,
+        entity_type: str,
+        entity_id: str = None,
+        old_values: dict = None,
+        new_values: dict = None,
+        metadata: dict = None,
+    ) -> None:
+        """
+        Queue an audit log entry (same arguments as AuditLog.log_action).
+
+        The actor is resolved by the worker for the whole batch.
+        """
+        entry = AuditLog.build_entry(
+            action,
+            entity_type,
+            entity_id=entity_id,
+            old_values=old_values,
+            new_values=new_values,
+            metadata=metadata,
+            lookup_actor=False,
+        )
+        self._submit([entry])
+
+    def log_actions(self, action: AuditAction, entity_type: str, new_values_by_id: dict) -> None:
+        """
+        Queue one audit log entry per entity for a bulk operation.
+
+        Args:
+            action: Action performed on every entity
+            entity_type: Type of the entities
+            new_values_by_id: Mapping of entity ID to its new values
+        """
+        entries = [
+            AuditLog.build_entry(
+                action, entity_type, entity_id=entity_id, new_values=values, lookup_actor=False
+            )
+            for entity_id, values in new_values_by_id.items()
+        ]
+        self._submit(entries)
+
+    def _submit(self, entries: List[dict]) -> None:
+        """Hand entries to the worker, or write them directly when unavailable."""
+        if not self.enabled:
+            self._write(entries)
+            return
+
+        self._ensure_worker()
+        overflow = []
+        for entry in entries:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                overflow.append(entry)
+        if overflow:
+            logger.warning(f"Audit queue full, writing {len(overflow)} entries synchronously")
+            self._write(overflow)
+
+    def flush(self) -> None:
+        """Write any queued entries immediately."""
+        if self._queue is None:
+            return
+        batch = self._drain(block=False)
+        if batch:
+            self._write(batch)
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use (and after a fork)."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: collect batches and write them."""
+        while True:
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+
+    def _drain(self, block: bool) -> List[dict]:
+        """Collect up to batch_size entries, waiting at most flush_interval."""
+        batch = []
+        if block:
+            # Wait for the first entry, then give the batch flush_interval to fill
+            batch.append(self._queue.get())
+            deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            try:
+                if block:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[dict]) -> None:
+        """Bulk insert a batch of entries in its own app context."""
+        with self.app.app_context():
+            try:
+                AuditLog.fill_actors(batch)
+                db.session.execute(insert(AuditLog), batch)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to write {len(batch)} audit entries: {e}")
+            finally:
+                db.session.remove()
+
+
+audit_queue = AuditQueue()
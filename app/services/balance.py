@@ -75,7 +75,7 @@ class BalanceService:
             
             # Debit account balance
             old_balance = account.current_balance
-            account.debit(amount)
+            account.debit(amount, commit=False)
             new_balance = account.current_balance
             
             db.session.add(expense)
@@ -86,12 +86,13 @@ class BalanceService:
                 action=AuditAction.CREATE,
                 entity_type="expense",
                 entity_id=expense.id,
-                details={
+                metadata={
                     "amount": float(amount),
                     "account_id": account_id,
                     "old_balance": float(old_balance),
                     "new_balance": float(new_balance)
-                }
+                },
+                commit=False,
             )
             
             # Commit transaction
@@ -172,10 +173,10 @@ class BalanceService:
                     raise ValueError("One or both accounts not found")
                 
                 # Reverse old expense (credit old account)
-                old_account.credit(old_amount)
+                old_account.credit(old_amount, commit=False)
                 
                 # Apply new expense (debit new account)
-                new_account.debit(new_amount)
+                new_account.debit(new_amount, commit=False)
                 
                 expense.account_id = new_account_id
                 expense.amount = new_amount
@@ -204,10 +205,10 @@ class BalanceService:
                 
                 if delta > 0:
                     # Increased expense - debit more
-                    account.debit(delta)
+                    account.debit(delta, commit=False)
                 elif delta < 0:
                     # Decreased expense - credit back
-                    account.credit(abs(delta))
+                    account.credit(abs(delta), commit=False)
                 
                 expense.amount = new_amount
                 
@@ -225,11 +226,12 @@ class BalanceService:
                 action=AuditAction.UPDATE,
                 entity_type="expense",
                 entity_id=expense.id,
-                details={
+                metadata={
                     "old_amount": float(old_amount),
                     "new_amount": float(new_amount),
                     "account_changed": account_changed
-                }
+                },
+                commit=False,
             )
             
             db.session.commit()
@@ -280,26 +282,24 @@ class BalanceService:
             if not account:
                 raise ValueError(f"Account {expense.account_id} not found")
             
-            # Reverse the expense (credit account)
+            # Soft delete expense; this credits the (locked) account back
             old_balance = account.current_balance
-            account.credit(expense.amount)
+            expense.soft_delete(commit=False)
             new_balance = account.current_balance
             
-            # Soft delete expense
-            expense.soft_delete()
-            
             # Log audit
             AuditLog.log_action(
                 action=AuditAction.DELETE,
                 entity_type="expense",
                 entity_id=expense.id,
-                details={
+                metadata={
                     "amount": float(expense.amount),
                     "account_id": expense.account_id,
                     "old_balance": float(old_balance),
                     "new_balance": float(new_balance),
                     "balance_reversed": True
-                }
+                },
+                commit=False,
             )
             
             db.session.commit()
@@ -0,0 +1,128 @@
+"""Short-lived Redis cache for project report endpoints."""
+import hashlib
+import json
+from functools import wraps
+
+from flask import current_app, g, has_app_context, request
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+
+def _tag_key(tenant_id, project_id) -> str:
+    """Redis set holding every cached report key for a project."""
+    return f"rpt:{tenant_id}:{project_id}:keys"
+
+
+def cached_report(endpoint: str):
+    """
+    Cache a project report's result in Redis for REPORT_CACHE_TTL seconds.
+
+    Keys are scoped by tenant, project, endpoint and a hash of the query
+    string. Cached entries for a project are dropped whenever the project
+    or one of its expenses is written (see invalidate_project_reports).
+
+    Args:
+        endpoint: Short report name used in the cache key
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, project_id, *args, **kwargs):
+            ttl = current_app.config.get("REPORT_CACHE_TTL", 60)
+            redis_client = getattr(current_app, "redis", None)
+            if not ttl or redis_client is None:
+                return fn(self, project_id, *args, **kwargs)
+
+            tenant_id = g.get("current_tenant_id")
+            params = json.dumps(sorted(request.args.items()))
+            params_hash = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+            key = f"rpt:{tenant_id}:{project_id}:{endpoint}:{params_hash}"
+
+            try:
+                cached = redis_client.get(key)
+                if cached:
+                    return current_app.json.loads(cached)
+            except Exception as e:
+                logger.warning(f"Report cache read failed: {e}")
+
+            result = fn(self, project_id, *args, **kwargs)
+
+            try:
+                tag_key = _tag_key(tenant_id, project_id)
+                # One round trip; the writes need no MULTI/EXEC atomicity
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.setex(key, ttl, current_app.json.dumps(result))
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Report cache write failed: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_project_reports(tenant_id, project_id) -> None:
+    """Drop all cached reports for a project."""
+    if not has_app_context():
+        return
+    redis_client = getattr(current_app, "redis", None)
+    if redis_client is None:
+        return
+
+    tag_key = _tag_key(tenant_id, project_id)
+    try:
+        keys = redis_client.smembers(tag_key)
+        redis_client.delete(tag_key, *keys)
+    except Exception as e:
+        logger.warning(f"Report cache invalidation failed: {e}")
+
+
+def mark_projects_changed(session, tenant_id, project_ids) -> None:
+    """
+    Invalidate a tenant's project reports when session commits.
+    
+    For expense writes that bypass the unit of work (bulk inserts), which
+    collect_changed_projects can't see.
+    """
+    session.info.setdefault("report_cache_projects", set()).update(
+        (tenant_id, project_id) for project_id in project_ids if project_id
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def collect_changed_projects(session, flush_context):
+    """Remember which projects changed or had expenses written."""
+    from app.models.expense import Expense
+    from app.models.project import Project
+
+    for instance in session.new | session.dirty | session.deleted:
+        if isinstance(instance, Project):
+            # Reports include the project's budget figures
+            if instance not in session.new:
+                mark_projects_changed(session, instance.tenant_id, (instance.id,))
+            continue
+        if not isinstance(instance, Expense):
+            continue
+        # Include the previous project when an expense is moved
+        history = inspect(instance).attrs.project_id.history
+        mark_projects_changed(
+            session, instance.tenant_id, (instance.project_id, *history.deleted)
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_projects(session):
+    """Invalidate cached reports once project or expense changes are committed."""
+    for tenant_id, project_id in session.info.pop("report_cache_projects", ()):
+        invalidate_project_reports(tenant_id, project_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_projects(session):
+    """Forget pending invalidations for rolled-back changes."""
+    session.info.pop("report_cache_projects", None)
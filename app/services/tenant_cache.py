@@ -0,0 +1,224 @@
+"""Short-lived Redis cache for tenant lookups."""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import current_app, has_app_context
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+
+def _tenant_key(tenant_id) -> str:
+    """Redis key for a tenant's serialized details."""
+    return f"tenant:{tenant_id}"
+
+
+def _subdomain_key(subdomain) -> str:
+    """Redis key mapping an active tenant's subdomain to its ID."""
+    return f"tenant:subdomain:{subdomain}"
+
+
+def _domain_key(domain) -> str:
+    """Redis key mapping an active custom domain to its tenant ID."""
+    return f"tenant:domain:{domain}"
+
+
+# In-process layer in front of Redis for host -> tenant ID lookups. Commits
+# clear this process's entries; other workers pick changes up once their
+# entries expire after TENANT_LOCAL_CACHE_TTL seconds.
+_LOCAL_CACHE_MAX = 10_000
+_local_cache: Dict[str, Tuple[float, str]] = {}
+_local_lock = threading.Lock()
+
+
+def _local_get(key: str) -> Optional[str]:
+    """Unexpired in-process entry for key, if any."""
+    entry = _local_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _local_set(key: str, value: str) -> None:
+    """Remember key in-process when the local cache is enabled."""
+    ttl = current_app.config.get("TENANT_LOCAL_CACHE_TTL", 5)
+    if not ttl:
+        return
+    with _local_lock:
+        if len(_local_cache) >= _LOCAL_CACHE_MAX:
+            _local_cache.clear()
+        _local_cache[key] = (time.monotonic() + ttl, value)
+
+
+def _local_discard(*keys: str) -> None:
+    """Drop in-process entries."""
+    with _local_lock:
+        for key in keys:
+            _local_cache.pop(key, None)
+
+
+def _redis():
+    """Redis client when tenant caching is enabled, else None."""
+    if not has_app_context() or not current_app.config.get("TENANT_CACHE_TTL", 60):
+        return None
+    return getattr(current_app, "redis", None)
+
+
+def _get_cached_id(key: str, load: Callable[[], Optional[str]]) -> Optional[str]:
+    """Resolve key from the in-process cache, then Redis, then load()."""
+    tenant_id = _local_get(key)
+    if tenant_id:
+        return tenant_id
+
+    redis_client = _redis()
+    if redis_client is not None:
+        try:
+            tenant_id = redis_client.get(key)
+            if tenant_id:
+                _local_set(key, tenant_id)
+                return tenant_id
+        except Exception as e:
+            logger.warning(f"Tenant cache read failed: {e}")
+
+    tenant_id = load()
+
+    if tenant_id:
+        _local_set(key, tenant_id)
+        if redis_client is not None:
+            try:
+                redis_client.setex(key, current_app.config["TENANT_CACHE_TTL"], tenant_id)
+            except Exception as e:
+                logger.warning(f"Tenant cache write failed: {e}")
+    return tenant_id
+
+
+def get_tenant_id_by_subdomain(subdomain: str) -> Optional[str]:
+    """
+    Look up an active tenant's ID by subdomain, cached for TENANT_CACHE_TTL seconds.
+
+    Args:
+        subdomain: Subdomain string (e.g., 'acme')
+
+    Returns:
+        Tenant ID if found, None otherwise
+    """
+    from app.core.extensions import db
+    from app.models.tenant import Tenant
+
+    return _get_cached_id(
+        _subdomain_key(subdomain),
+        lambda: db.session.execute(
+            db.select(Tenant.id).filter_by(subdomain=subdomain, is_active=True)
+        ).scalar_one_or_none(),
+    )
+
+
+def get_tenant_id_by_domain(domain: str) -> Optional[str]:
+    """
+    Look up the tenant ID for an active custom domain, cached like subdomains.
+
+    Args:
+        domain: Host name without port (e.g., 'expenses.acmecorp.com')
+
+    Returns:
+        Tenant ID if found, None otherwise
+    """
+    from app.core.extensions import db
+    from app.models.tenant import TenantDomain
+
+    return _get_cached_id(
+        _domain_key(domain),
+        lambda: db.session.execute(
+            db.select(TenantDomain.tenant_id).filter_by(domain=domain, is_active=True)
+        ).scalar_one_or_none(),
+    )
+
+
+def get_cached_tenant(tenant_id: str, build: Callable[[], Optional[dict]]) -> Optional[dict]:
+    """
+    Return a tenant's serialized details, calling build() on a cache miss.
+
+    Args:
+        tenant_id: Tenant ID
+        build: Loads and serializes the tenant; returns None if not found
+
+    Returns:
+        Serialized tenant, or None if not found (misses are not cached)
+    """
+    redis_client = _redis()
+    key = _tenant_key(tenant_id)
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(key)
+            if cached:
+                return current_app.json.loads(cached)
+        except Exception as e:
+            logger.warning(f"Tenant cache read failed: {e}")
+
+    result = build()
+
+    if result is not None and redis_client is not None:
+        try:
+            redis_client.setex(
+                key, current_app.config["TENANT_CACHE_TTL"], current_app.json.dumps(result)
+            )
+        except Exception as e:
+            logger.warning(f"Tenant cache write failed: {e}")
+    return result
+
+
+def invalidate_tenant(tenant_id, *subdomains) -> None:
+    """Drop cached details and subdomain mappings for a tenant."""
+    _invalidate(_tenant_key(tenant_id), *[_subdomain_key(s) for s in subdomains if s])
+
+
+def invalidate_domains(*domains) -> None:
+    """Drop cached custom domain mappings."""
+    _invalidate(*[_domain_key(d) for d in domains if d])
+
+
+def _invalidate(*keys) -> None:
+    """Delete keys from the in-process cache and Redis."""
+    _local_discard(*keys)
+    redis_client = _redis()
+    if redis_client is None or not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Tenant cache invalidation failed: {e}")
+
+
+@event.listens_for(Session, "after_flush")
+def collect_changed_tenants(session, flush_context):
+    """Remember which tenants and custom domains were updated or deleted."""
+    from app.models.tenant import Tenant, TenantDomain
+
+    for instance in session.dirty | session.deleted:
+        if isinstance(instance, Tenant):
+            # Include the previous subdomain when it is renamed
+            history = inspect(instance).attrs.subdomain.history
+            changed = session.info.setdefault("tenant_cache_tenants", set())
+            for subdomain in (instance.subdomain, *history.deleted):
+                changed.add((instance.id, subdomain))
+        elif isinstance(instance, TenantDomain):
+            history = inspect(instance).attrs.domain.history
+            session.info.setdefault("tenant_cache_domains", set()).update(
+                (instance.domain, *history.deleted)
+            )
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_tenants(session):
+    """Invalidate cached tenants once their changes are committed."""
+    for tenant_id, subdomain in session.info.pop("tenant_cache_tenants", ()):
+        invalidate_tenant(tenant_id, subdomain)
+    invalidate_domains(*session.info.pop("tenant_cache_domains", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_tenants(session):
+    """Forget pending invalidations for rolled-back changes."""
+    session.info.pop("tenant_cache_tenants", None)
+    session.info.pop("tenant_cache_domains", None)
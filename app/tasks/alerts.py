@@ -4,6 +4,7 @@ from datetime import datetime
 from loguru import logger
 
 from app.core.extensions import db
+from app.models.budget import Budget
 from app.models.project import Project
 from app.models.tenant import Tenant
 from app.services.alerts import AlertService
@@ -103,6 +104,20 @@ def update_forecast_and_generate_alerts():
     }
 
 
+@celery.task(name="app.tasks.alerts.refresh_budget_spend_snapshots")
+def refresh_budget_spend_snapshots():
+    """
+    Recompute spend snapshots for all budgets.
+    
+    Runs nightly to correct snapshots for expenses changed outside the ORM.
+    """
+    logger.info("Starting budget spend snapshot refresh")
+    
+    Budget.refresh_spend_snapshots(Budget.is_deleted == False)
+    
+    logger.info("Budget spend snapshot refresh completed")
+
+
 @celery.task(name="app.tasks.alerts.send_daily_summary")
 def send_daily_summary():
     """
@@ -32,6 +32,14 @@ celery.conf.beat_schedule = {
         "task": "app.tasks.alerts.check_low_balance_accounts",
         "schedule": crontab(minute=0),  # Every hour
     },
+    "refresh-budget-snapshots-nightly": {
+        "task": "app.tasks.alerts.refresh_budget_spend_snapshots",
+        "schedule": crontab(hour=2, minute=0),  # 2 AM daily
+    },
+    "ensure-audit-partitions-nightly": {
+        "task": "app.tasks.maintenance.ensure_audit_partitions",
+        "schedule": crontab(hour=2, minute=30),  # 2:30 AM daily
+    },
     "check-forecast-daily": {
         "task": "app.tasks.alerts.update_forecast_and_generate_alerts",
         "schedule": crontab(hour=8, minute=0),  # 8 AM daily
@@ -0,0 +1,18 @@
+"""Database maintenance tasks."""
+from loguru import logger
+
+from app.models.audit import AuditLog
+from app.tasks.celery_app import celery
+
+
+@celery.task(name="app.tasks.maintenance.ensure_audit_partitions")
+def ensure_audit_partitions():
+    """
+    Create upcoming monthly audit log partitions.
+    
+    Runs nightly so partitions exist well before their month starts.
+    """
+    partitions = AuditLog.ensure_partitions()
+    logger.info(f"Audit log partitions ensured: {', '.join(partitions) or 'none'}")
+    
+    return {"partitions": partitions}
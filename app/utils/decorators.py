@@ -7,13 +7,26 @@ from loguru import logger
 
 from app.models.user import UserRole
 
+# Role hierarchy, keyed by the lowercase role values stored on users and
+# carried in the JWT "role" claim
+ROLE_LEVELS = {
+    UserRole.OWNER.value: 4,
+    UserRole.ADMIN.value: 3,
+    UserRole.ANALYST.value: 2,
+    UserRole.MEMBER.value: 1,
+}
+
 
 def roles_required(*allowed_roles):
     """
     Decorator to enforce role-based access control.
     
+    Authorization uses only the role claim of the verified JWT; the
+    required level is resolved once when the view is decorated.
+    
     Args:
-        *allowed_roles: Variable number of allowed roles (Owner, Admin, Analyst, Member)
+        *allowed_roles: Variable number of allowed roles (Owner, Admin, Analyst, Member),
+            case-insensitive; a single list of roles is also accepted
         
     Usage:
         @roles_required('Owner', 'Admin')
@@ -24,6 +37,15 @@ def roles_required(*allowed_roles):
         def owner_endpoint():
             pass
     """
+    roles = [
+        role
+        for arg in allowed_roles
+        for role in (arg if isinstance(arg, (list, tuple, set)) else [arg])
+    ]
+    # Any listed role grants access, as does any role above it; names not
+    # in the hierarchy are ignored (owner-only if none are known)
+    levels = [ROLE_LEVELS[role.lower()] for role in roles if role.lower() in ROLE_LEVELS]
+    required_level = min(levels) if levels else max(ROLE_LEVELS.values())
 
     def decorator(fn):
         @wraps(fn)
@@ -52,29 +74,21 @@ def roles_required(*allowed_roles):
                 )
             
             # Check if user has one of the allowed roles
-            role_hierarchy = {
-                'Owner': 4,
-                'Admin': 3,
-                'Analyst': 2,
-                'Member': 1,
-            }
+            user_level = ROLE_LEVELS.get(str(user_role).lower(), 0)
             
-            user_level = role_hierarchy.get(user_role, 0)
-            max_allowed_level = max(role_hierarchy.get(role, 0) for role in allowed_roles)
-            
-            if user_level < max_allowed_level:
+            if user_level < required_level:
                 logger.warning(
                     f"Insufficient permissions",
                     user_id=g.get("user_id"),
                     user_role=user_role,
-                    required_roles=allowed_roles,
+                    required_roles=roles,
                 )
                 return (
                     jsonify(
                         {
                             "error": "Insufficient permissions",
                             "code": "FORBIDDEN",
-                            "required_roles": list(allowed_roles),
+                            "required_roles": roles,
                             "your_role": user_role,
                         }
                     ),
@@ -142,15 +156,8 @@ def require_role(required_role: UserRole):
                 )
 
             # Check role hierarchy
-            role_hierarchy = {
-                UserRole.OWNER: 4,
-                UserRole.ADMIN: 3,
-                UserRole.ANALYST: 2,
-                UserRole.MEMBER: 1,
-            }
-
-            user_level = role_hierarchy.get(UserRole(g.user_role), 0)
-            required_level = role_hierarchy.get(required_role, 0)
+            user_level = ROLE_LEVELS.get(str(g.user_role).lower(), 0)
+            required_level = ROLE_LEVELS.get(required_role.value, 0)
 
             if user_level < required_level:
                 logger.warning(
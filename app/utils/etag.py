@@ -0,0 +1,28 @@
+"""Conditional GET helpers for API endpoints."""
+from typing import Any, Callable
+
+from flask import Response, current_app, jsonify, request
+
+
+def conditional_json(version: Any, build: Callable[[], Any]) -> Response:
+    """
+    JSON response tagged with a weak ETag, honoring If-None-Match.
+
+    When the client already holds this version an empty 304 is returned and
+    build() is never called, so nothing is serialized.
+
+    Args:
+        version: Value that changes whenever the resource does (e.g. updated_at)
+        build: Returns the JSON payload for a full response
+
+    Returns:
+        200 response with the payload, or 304 Not Modified
+    """
+    etag = version.isoformat() if hasattr(version, "isoformat") else str(version)
+
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(build())
+    response.set_etag(etag, weak=True)
+    return response
@@ -1,7 +1,12 @@
 """Pagination utilities for API endpoints."""
-from typing import Any, Dict, List, Optional
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 from flask import request
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Query
 
 
@@ -135,3 +140,107 @@ def add_pagination_headers(response, pagination: Pagination) -> None:
         response.headers['X-Next-Page'] = str(pagination.next_num)
     if pagination.has_prev:
         response.headers['X-Prev-Page'] = str(pagination.prev_num)
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode keyset values into an opaque URL-safe cursor.
+    
+    Args:
+        values: Sort key values of the last row on the current page
+        
+    Returns:
+        Cursor string
+    """
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else
+        str(value) if isinstance(value, Decimal) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, columns: List[Any]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor back into typed values.
+    
+    Args:
+        cursor: Cursor string
+        columns: Columns the cursor values correspond to (used for typing)
+        
+    Returns:
+        List of values in column order
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, list) or len(payload) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    values = []
+    try:
+        for column, value in zip(columns, payload):
+            python_type = column.type.python_type
+            if value is None or isinstance(value, python_type):
+                values.append(value)
+            elif python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is date:
+                values.append(date.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+    except (TypeError, ValueError, ArithmeticError) as e:
+        # e.g. decimal.InvalidOperation, or a non-string where a date belongs
+        raise ValueError("Invalid cursor") from e
+    return values
+
+
+def keyset_paginate(
+    query: Query,
+    columns: List[Any],
+    per_page: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Paginate a SQLAlchemy query using keyset (seek) pagination.
+    
+    Unlike OFFSET/LIMIT, the cost of fetching a page does not grow with its
+    depth. The last column must be unique (usually the primary key) so the
+    ordering is total.
+    
+    Args:
+        query: SQLAlchemy query object (without ORDER BY)
+        columns: Sort key columns, e.g. [Expense.expense_date, Expense.id]
+        per_page: Items per page
+        cursor: Cursor returned for the previous page, if any
+        descending: Sort direction for all key columns
+        
+    Returns:
+        Tuple of (items, next_cursor); next_cursor is None on the last page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+
+    query = query.order_by(*[col.desc() if descending else col.asc() for col in columns])
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.limit(per_page + 1).all()
+    items = rows[:per_page]
+
+    next_cursor = None
+    if len(rows) > per_page:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, col.key) for col in columns])
+
+    return items, next_cursor
@@ -827,9 +827,14 @@ def project_detail(project_id):
         .order_by(Expense.expense_date)
         .all()
     )
-    daily_map = {r[0].isoformat(): float(r[1] or 0) for r in daily_rows}
+    # Single pass into per-day buckets (expense_date carries a time of day,
+    # so rows are bucketed by calendar date rather than matched by key)
     daily_labels = [(start_30d + timedelta(days=i)).isoformat() for i in range(30)]
-    daily_data = [daily_map.get(d, 0.0) for d in daily_labels]
+    daily_data = [0.0] * 30
+    for expense_date, amount in daily_rows:
+        idx = (expense_date.date() - start_30d).days
+        if 0 <= idx < 30:
+            daily_data[idx] += float(amount or 0)
 
     spend_7d = float(sum(daily_data[-7:])) if daily_data else 0.0
     spend_30d = float(sum(daily_data)) if daily_data else 0.0
@@ -0,0 +1,31 @@
+"""Gunicorn configuration for TrackTok (loaded automatically from the project root)."""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+
+# Requests spend most of their time waiting on PostgreSQL and Redis, so each
+# worker serves many of them concurrently as greenlets. Set
+# GUNICORN_WORKER_CLASS=sync to fall back to one request per worker.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperate with gevent so queries yield instead of blocking."""
+    if worker_class == "gevent":
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+
+
+def worker_exit(server, worker):
+    """Write audit entries still queued for the background writer before exiting."""
+    from app.services.audit import audit_queue
+
+    audit_queue.flush()
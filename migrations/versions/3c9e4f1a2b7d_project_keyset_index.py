@@ -0,0 +1,26 @@
+"""Index projects for keyset pagination.
+
+- Add (tenant_id, is_deleted, created_at DESC, id DESC) index on projects so
+  cursor pages are an index seek.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3c9e4f1a2b7d"
+down_revision = "1b3c5e0ac9a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_projects_tenant_created",
+        "projects",
+        ["tenant_id", "is_deleted", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_projects_tenant_created", table_name="projects")
@@ -0,0 +1,42 @@
+"""Trigram indexes for project search.
+
+- Enable pg_trgm and add GIN trigram indexes on projects.name and
+  projects.description so ILIKE '%term%' searches can use an index.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5d2a8c7e1f40"
+down_revision = "3c9e4f1a2b7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_projects_name_trgm",
+        "projects",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_projects_description_trgm",
+        "projects",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_projects_description_trgm", table_name="projects")
+    op.drop_index("ix_projects_name_trgm", table_name="projects")
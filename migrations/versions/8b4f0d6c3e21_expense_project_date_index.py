@@ -0,0 +1,25 @@
+"""Index expenses by tenant, project and date.
+
+- Add (tenant_id, project_id, expense_date) index on expenses for per-project
+  date-range report queries.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8b4f0d6c3e21"
+down_revision = "5d2a8c7e1f40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expenses_tenant_project_date",
+        "expenses",
+        ["tenant_id", "project_id", "expense_date"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_expenses_tenant_project_date", table_name="expenses")
@@ -0,0 +1,26 @@
+"""Covering index for project category breakdowns.
+
+- Add (project_id, category_id) INCLUDE (amount) index on expenses so the
+  category breakdown can be answered from the index alone.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9e7c2a5b1d34"
+down_revision = "8b4f0d6c3e21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expenses_project_category",
+        "expenses",
+        ["project_id", "category_id"],
+        postgresql_include=["amount"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_expenses_project_category", table_name="expenses")
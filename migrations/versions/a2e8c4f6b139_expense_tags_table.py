@@ -0,0 +1,111 @@
+"""Relational expense tags.
+
+- Add expense_tags (expense_id, tag) with the expense's tenant_id and a
+  (tenant_id, tag) index for tag filters.
+- Move tags out of the expenses.tags JSON column and drop it. Tags are
+  limited to 100 characters (expense_tags.tag is String(100)); longer
+  tags are truncated to their first 100 characters when copied.
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a2e8c4f6b139"
+down_revision = "f1d6b8c3e047"
+branch_labels = None
+depends_on = None
+
+TAG_MAX_LENGTH = 100
+
+expenses = sa.table(
+    "expenses",
+    sa.column("id", sa.String),
+    sa.column("tenant_id", sa.String),
+    sa.column("tags", sa.JSON),
+)
+expense_tags = sa.table(
+    "expense_tags",
+    sa.column("expense_id", sa.String),
+    sa.column("tag", sa.String),
+    sa.column("tenant_id", sa.String),
+)
+
+
+def _load_tags(value):
+    """Tags of an expenses.tags value, however the driver returned it."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value or []
+
+
+def upgrade():
+    op.create_table(
+        "expense_tags",
+        sa.Column("expense_id", sa.String(length=36), nullable=False),
+        sa.Column("tag", sa.String(length=TAG_MAX_LENGTH), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.ForeignKeyConstraint(["expense_id"], ["expenses.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("expense_id", "tag"),
+    )
+    op.create_index("ix_expense_tag", "expense_tags", ["tenant_id", "tag"])
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            f"""
+            INSERT INTO expense_tags (expense_id, tag, tenant_id)
+            SELECT DISTINCT e.id, left(t.tag, {TAG_MAX_LENGTH}), e.tenant_id
+              FROM expenses e
+             CROSS JOIN LATERAL json_array_elements_text(e.tags) AS t(tag)
+            """
+        )
+    else:
+        rows = set()
+        for expense_id, tenant_id, tags in bind.execute(
+            sa.select(expenses.c.id, expenses.c.tenant_id, expenses.c.tags)
+        ):
+            for tag in _load_tags(tags):
+                rows.add((expense_id, tag[:TAG_MAX_LENGTH], tenant_id))
+        if rows:
+            op.bulk_insert(
+                expense_tags,
+                [{"expense_id": e, "tag": t, "tenant_id": tn} for e, t, tn in rows],
+            )
+    op.drop_column("expenses", "tags")
+
+
+def downgrade():
+    op.add_column(
+        "expenses",
+        sa.Column("tags", sa.JSON(), nullable=False, server_default=sa.text("'[]'")),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            UPDATE expenses e
+               SET tags = agg.tags
+              FROM (SELECT expense_id, json_agg(tag ORDER BY tag) AS tags
+                      FROM expense_tags
+                     GROUP BY expense_id) agg
+             WHERE agg.expense_id = e.id
+            """
+        )
+        op.alter_column("expenses", "tags", server_default=None)
+    else:
+        tags_by_expense = {}
+        for expense_id, tag in bind.execute(
+            sa.select(expense_tags.c.expense_id, expense_tags.c.tag)
+        ):
+            tags_by_expense.setdefault(expense_id, []).append(tag)
+        for expense_id, tags in tags_by_expense.items():
+            bind.execute(
+                expenses.update().where(expenses.c.id == expense_id).values(tags=sorted(tags))
+            )
+    op.drop_index("ix_expense_tag", table_name="expense_tags")
+    op.drop_table("expense_tags")
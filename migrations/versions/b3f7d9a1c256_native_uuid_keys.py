@@ -0,0 +1,95 @@
+"""Store UUID keys as native uuid.
+
+- Convert every primary and foreign key column holding a UUID from
+  varchar(36) to uuid (16 bytes instead of 37, cheaper comparisons and
+  smaller indexes).
+- Foreign keys are dropped first and recreated afterwards with the same
+  options, since both sides of a constraint must change type together.
+
+Polymorphic references (audit_logs.entity_id, alerts.entity_id) and
+request IDs stay varchar. PostgreSQL only; other databases keep strings.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3f7d9a1c256"
+down_revision = "a2e8c4f6b139"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "tenants": ("id",),
+    "tenant_domains": ("id", "tenant_id"),
+    "users": ("id", "tenant_id"),
+    "password_reset_tokens": ("id", "user_id"),
+    "user_preferences": ("id", "user_id"),
+    "accounts": ("id", "tenant_id", "created_by"),
+    "projects": ("id", "tenant_id", "created_by"),
+    "categories": ("id", "tenant_id", "project_id", "created_by"),
+    "budgets": ("id", "tenant_id", "category_id", "owner_id"),
+    "budget_alerts": ("id", "tenant_id", "budget_id"),
+    "budget_spend_snapshots": ("budget_id",),
+    "expenses": (
+        "id",
+        "tenant_id",
+        "category_id",
+        "project_id",
+        "account_id",
+        "cross_project_ref_id",
+        "created_by",
+        "updated_by",
+    ),
+    "expense_tags": ("expense_id", "tenant_id"),
+    "recurring_expenses": ("id", "tenant_id", "category_id", "created_by", "updated_by"),
+    "alerts": ("id", "tenant_id", "read_by"),
+    "audit_logs": ("id", "tenant_id", "actor_user_id"),
+}
+
+
+def _foreign_keys(bind):
+    """(table, reflected FK) pairs for every FK touching a converted table."""
+    inspector = sa.inspect(bind)
+    return [
+        (table, fk)
+        for table in UUID_COLUMNS
+        for fk in inspector.get_foreign_keys(table)
+        if fk["referred_table"] in UUID_COLUMNS
+    ]
+
+
+def _convert(column_type: str, cast: str):
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    foreign_keys = _foreign_keys(bind)
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk["name"], table, type_="foreignkey")
+
+    for table, columns in UUID_COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {c} TYPE {column_type} USING {c}::{cast}" for c in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    for table, fk in foreign_keys:
+        options = fk.get("options") or {}
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            ondelete=options.get("ondelete"),
+            onupdate=options.get("onupdate"),
+        )
+
+
+def upgrade():
+    _convert("uuid", "uuid")
+
+
+def downgrade():
+    _convert("varchar(36)", "text")
@@ -0,0 +1,47 @@
+"""Budget spend snapshots.
+
+- Add budget_spend_snapshots holding each budget's materialized spend
+  total, read by Budget.get_spent_amount instead of aggregating expenses.
+- Backfill it for existing budgets.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6e2d4a8c913"
+down_revision = "f3a9c7d2e1b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "budget_spend_snapshots",
+        sa.Column("budget_id", sa.String(length=36), nullable=False),
+        sa.Column("spent", sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column("as_of", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["budget_id"], ["budgets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("budget_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO budget_spend_snapshots (budget_id, spent, as_of)
+        SELECT b.id,
+               (SELECT COALESCE(SUM(e.amount), 0)
+                  FROM expenses e
+                 WHERE e.tenant_id = b.tenant_id
+                   AND e.is_deleted = false
+                   AND e.expense_date >= b.start_date
+                   AND e.expense_date <= b.end_date
+                   AND (b.category_id IS NULL OR e.category_id = b.category_id)
+                   AND (b.owner_id IS NULL OR e.created_by = b.owner_id)),
+               now() AT TIME ZONE 'utc'
+          FROM budgets b
+         WHERE b.is_deleted = false
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("budget_spend_snapshots")
@@ -0,0 +1,29 @@
+"""Covering index for per-project expense totals.
+
+- Replace the (tenant_id, project_id) index on expenses with one that
+  INCLUDEs amount and expense_date, so project totals and daily spend
+  are served by index-only scans.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c4f1b8e2a9d7"
+down_revision = "9e7c2a5b1d34"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expenses_proj_amount_covering",
+        "expenses",
+        ["tenant_id", "project_id"],
+        postgresql_include=["amount", "expense_date"],
+    )
+    op.drop_index("idx_tenant_project", table_name="expenses")
+
+
+def downgrade():
+    op.create_index("idx_tenant_project", "expenses", ["tenant_id", "project_id"])
+    op.drop_index("ix_expenses_proj_amount_covering", table_name="expenses")
@@ -0,0 +1,40 @@
+"""Add audit_logs.actor_snapshot.
+
+- Store the actor's {id, email, name, role} on each audit entry at write
+  time so history reads no longer look users up per row.
+- Backfill existing entries from users (PostgreSQL only); entries whose
+  actor has since been deleted keep a NULL snapshot.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5a1e7f3d408"
+down_revision = "b3f7d9a1c256"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("audit_logs", sa.Column("actor_snapshot", sa.JSON(), nullable=True))
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        """
+        UPDATE audit_logs AS a
+        SET actor_snapshot = json_build_object(
+            'id', u.id::text,
+            'email', u.email,
+            'name', u.first_name || ' ' || u.last_name,
+            'role', u.role
+        )
+        FROM users AS u
+        WHERE u.id = a.actor_user_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("audit_logs", "actor_snapshot")
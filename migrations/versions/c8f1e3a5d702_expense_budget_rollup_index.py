@@ -0,0 +1,27 @@
+"""Covering index for budget spend aggregates.
+
+- Add (tenant_id, is_deleted, expense_date) INCLUDE (amount, category_id,
+  created_by) index on expenses so budget spend totals can be answered
+  from the index alone.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c8f1e3a5d702"
+down_revision = "b6e2d4a8c913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expense_budget_rollup",
+        "expenses",
+        ["tenant_id", "is_deleted", "expense_date"],
+        postgresql_include=["amount", "category_id", "created_by"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_expense_budget_rollup", table_name="expenses")
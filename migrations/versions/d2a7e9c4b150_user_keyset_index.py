@@ -0,0 +1,27 @@
+"""Index users for keyset pagination.
+
+- Add (tenant_id, created_at DESC, id DESC) index on live users so cursor
+  pages in the user list are an index seek.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d2a7e9c4b150"
+down_revision = "c4f1b8e2a9d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_users_tenant_created",
+        "users",
+        ["tenant_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_users_tenant_created", table_name="users")
@@ -0,0 +1,40 @@
+"""Partial indexes on live expenses and active budgets.
+
+- Replace the (tenant_id, expense_date) index on expenses with a partial
+  index WHERE is_deleted = false.
+- Replace the (tenant_id, period) index on budgets with a partial index
+  WHERE is_active = true.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4b9a6e2f815"
+down_revision = "c8f1e3a5d702"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expense_active",
+        "expenses",
+        ["tenant_id", "expense_date"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.drop_index("idx_tenant_date", table_name="expenses")
+    op.create_index(
+        "ix_budget_active_period",
+        "budgets",
+        ["tenant_id", "period"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+    op.drop_index("idx_tenant_period", table_name="budgets")
+
+
+def downgrade():
+    op.create_index("idx_tenant_period", "budgets", ["tenant_id", "period"])
+    op.drop_index("ix_budget_active_period", table_name="budgets")
+    op.create_index("idx_tenant_date", "expenses", ["tenant_id", "expense_date"])
+    op.drop_index("ix_expense_active", table_name="expenses")
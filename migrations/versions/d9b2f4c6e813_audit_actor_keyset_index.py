@@ -0,0 +1,26 @@
+"""Index audit_logs for keyset pages of a user's activity.
+
+- Replace ix_audit_logs_actor_user_id with ix_audit_actor_created on
+  (actor_user_id, created_at, id), which serves both plain actor lookups
+  and the (created_at, id) < cursor seek used by get_user_activity.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d9b2f4c6e813"
+down_revision = "c5a1e7f3d408"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_audit_actor_created", "audit_logs", ["actor_user_id", "created_at", "id"]
+    )
+    op.drop_index("ix_audit_logs_actor_user_id", table_name="audit_logs")
+
+
+def downgrade():
+    op.create_index("ix_audit_logs_actor_user_id", "audit_logs", ["actor_user_id"])
+    op.drop_index("ix_audit_actor_created", table_name="audit_logs")
@@ -0,0 +1,68 @@
+"""Keep updated_at current on PostgreSQL with a trigger.
+
+- Add set_updated_at(), a BEFORE UPDATE row trigger function that stamps
+  updated_at with the current UTC time when an UPDATE leaves it
+  unchanged (raw SQL, bulk statements, other clients). Updates that set
+  it themselves, like the ORM's onupdate, keep their value, so the
+  timestamp held in memory still matches the row.
+- Attach it to every table with an updated_at column.
+
+PostgreSQL only.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e2c8a4f1b637"
+down_revision = "d9b2f4c6e813"
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    "tenants",
+    "tenant_domains",
+    "users",
+    "password_reset_tokens",
+    "user_preferences",
+    "accounts",
+    "projects",
+    "categories",
+    "budgets",
+    "budget_alerts",
+    "expenses",
+    "recurring_expenses",
+    "alerts",
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # updated_at is timestamp without time zone holding UTC
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := timezone('utc', now());
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,27 @@
+"""Index live users by role and status.
+
+- Add partial (tenant_id, role, is_active) index on users WHERE
+  is_deleted = false for the user list role/status filters.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5b3c1d8f962"
+down_revision = "d2a7e9c4b150"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_users_tenant_role_active",
+        "users",
+        ["tenant_id", "role", "is_active"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_users_tenant_role_active", table_name="users")
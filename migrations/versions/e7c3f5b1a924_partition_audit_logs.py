@@ -0,0 +1,112 @@
+"""Partition audit_logs by month.
+
+- Recreate audit_logs as a table range-partitioned on created_at, with
+  primary key (id, created_at), a default partition and monthly
+  partitions from the oldest entry through two months ahead.
+- Recreate its indexes on the parent so each partition gets its own.
+- Copy existing rows across and drop the old table.
+
+PostgreSQL only; other databases keep the plain table.
+"""
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e7c3f5b1a924"
+down_revision = "d4b9a6e2f815"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "id, actor_user_id, user_email, action, entity_type, entity_id, changes_json, "
+    "ip_address, user_agent, request_id, audit_metadata, created_at, tenant_id"
+)
+
+INDEXES = (
+    ("idx_created_at", ["created_at"]),
+    ("idx_tenant_action", ["tenant_id", "action"]),
+    ("idx_tenant_entity", ["tenant_id", "entity_type", "entity_id"]),
+    ("ix_audit_logs_action", ["action"]),
+    ("ix_audit_logs_actor_user_id", ["actor_user_id"]),
+    ("ix_audit_logs_entity_id", ["entity_id"]),
+    ("ix_audit_logs_entity_type", ["entity_type"]),
+    ("ix_audit_logs_request_id", ["request_id"]),
+    ("ix_audit_logs_tenant_id", ["tenant_id"]),
+)
+
+
+def _create_audit_logs(*constraints, **kw):
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("actor_user_id", sa.String(length=36), nullable=True),
+        sa.Column("user_email", sa.String(length=255), nullable=True),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.String(length=36), nullable=True),
+        sa.Column("changes_json", sa.JSON(), nullable=True),
+        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.String(length=512), nullable=True),
+        sa.Column("request_id", sa.String(length=36), nullable=True),
+        sa.Column("audit_metadata", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.ForeignKeyConstraint(["actor_user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        *constraints,
+        **kw,
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", columns)
+
+
+def _swap_out_audit_logs():
+    """Rename the current table out of the way, dropping its indexes."""
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="audit_logs")
+    op.rename_table("audit_logs", "audit_logs_old")
+    op.execute("ALTER TABLE audit_logs_old RENAME CONSTRAINT audit_logs_pkey TO audit_logs_old_pkey")
+
+
+def _copy_and_drop_old():
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_old")
+    op.drop_table("audit_logs_old")
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _swap_out_audit_logs()
+    _create_audit_logs(
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM audit_logs_old")).scalar()
+    today = date.today().replace(day=1)
+    start = (oldest.date() if oldest else today).replace(day=1)
+    last = (today + timedelta(days=62)).replace(day=1)
+    while start <= last:
+        end = (start + timedelta(days=32)).replace(day=1)
+        op.execute(
+            f"CREATE TABLE audit_logs_{start:%Y_%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+        start = end
+
+    _copy_and_drop_old()
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _swap_out_audit_logs()
+    _create_audit_logs(sa.PrimaryKeyConstraint("id"))
+    _copy_and_drop_old()
@@ -0,0 +1,58 @@
+"""LZ4 TOAST compression for JSON columns.
+
+- Compress audit_logs.changes_json / audit_metadata and
+  expenses.attachments / tags / expense_metadata with LZ4 instead of
+  pglz. Applies to newly written values; existing rows keep pglz until
+  they are rewritten.
+
+Requires PostgreSQL 14+ built with LZ4; skipped otherwise.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f1d6b8c3e047"
+down_revision = "e7c3f5b1a924"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    ("audit_logs", "changes_json"),
+    ("audit_logs", "audit_metadata"),
+    ("expenses", "attachments"),
+    ("expenses", "tags"),
+    ("expenses", "expense_metadata"),
+)
+
+
+def _set_compression(method):
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    if bind.execute(sa.text("SELECT current_setting('server_version_num')::int")).scalar() < 140000:
+        return
+
+    statements = " ".join(
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method};"
+        for table, column in COLUMNS
+    )
+    # Servers built without LZ4 reject the method; leave the default then
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            {statements}
+        EXCEPTION WHEN feature_not_supported THEN
+            RAISE NOTICE 'LZ4 compression unavailable, keeping default';
+        END $$
+        """
+    )
+
+
+def upgrade():
+    _set_compression("lz4")
+
+
+def downgrade():
+    _set_compression("pglz")
@@ -0,0 +1,32 @@
+"""Partial index for unread alert counts.
+
+- Replace the (tenant_id, is_read) index on alerts with a partial
+  (tenant_id) index WHERE is_read, is_dismissed and is_deleted are all
+  false, matching Alert.get_unread_count.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f3a9c7d2e1b4"
+down_revision = "e5b3c1d8f962"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_alerts_tenant_unread_active",
+        "alerts",
+        ["tenant_id"],
+        postgresql_where=sa.text(
+            "is_read = false AND is_dismissed = false AND is_deleted = false"
+        ),
+    )
+    op.drop_index("ix_alerts_tenant_unread", table_name="alerts")
+
+
+def downgrade():
+    op.create_index("ix_alerts_tenant_unread", "alerts", ["tenant_id", "is_read"])
+    op.drop_index("ix_alerts_tenant_unread_active", table_name="alerts")
@@ -0,0 +1,57 @@
+"""Store JSON columns as JSONB.
+
+- Convert every json column to jsonb: parsed once on write instead of on
+  every read, and indexable with GIN.
+- Add a jsonb_path_ops GIN index on expenses.expense_metadata for
+  containment (@>) lookups.
+
+Column compression settings (see f1d6b8c3e047) survive the type change.
+PostgreSQL only; other databases keep JSON.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f5d3b7e9a241"
+down_revision = "e2c8a4f1b637"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = {
+    "tenants": ("settings",),
+    "users": ("preferences",),
+    "user_preferences": ("dashboard_layout", "chart_preferences", "custom_settings"),
+    "expenses": ("attachments", "expense_metadata"),
+    "alerts": ("alert_metadata",),
+    "audit_logs": ("changes_json", "audit_metadata", "actor_snapshot"),
+}
+
+
+def _convert(column_type: str):
+    for table, columns in JSON_COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {c} TYPE {column_type} USING {c}::{column_type}" for c in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _convert("jsonb")
+    op.create_index(
+        "ix_expense_metadata_gin",
+        "expenses",
+        ["expense_metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"expense_metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_expense_metadata_gin", table_name="expenses")
+    _convert("json")
@@ -1,5 +1,8 @@
 """Pytest configuration and fixtures."""
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
 from app import create_app
 from app.core.extensions import db as _db
 from app.models import Tenant, User, UserRole
@@ -18,6 +21,19 @@ def app():
 def db(app):
     """Create database for testing."""
     _db.app = app
+
+    if _db.engine.dialect.name == "sqlite":
+        # pysqlite defers BEGIN and breaks SAVEPOINT; let SQLAlchemy emit it
+        @event.listens_for(_db.engine, "connect")
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(_db.engine, "begin")
+        def emit_begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+        _db.engine.dispose()
+
     _db.create_all()
     
     yield _db
@@ -30,15 +46,20 @@ def session(db):
     """Create a new database session for a test."""
     connection = db.engine.connect()
     transaction = connection.begin()
-    
-    session = db.create_scoped_session(options={"bind": connection})
-    db.session = session
-    
+
+    # Commits inside the test release a savepoint; the outer transaction
+    # is rolled back afterwards
+    session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    original_session, db.session = db.session, session
+
     yield session
-    
+
+    session.remove()
     transaction.rollback()
     connection.close()
-    session.remove()
+    db.session = original_session
 
 
 @pytest.fixture
@@ -88,3 +109,29 @@ def auth_headers(client, user, tenant):
         "Authorization": f"Bearer {tokens['access_token']}",
         "X-Tenant-Id": tenant.id,
     }
+
+
+@pytest.fixture
+def account(session, tenant):
+    """Create a test account."""
+    from decimal import Decimal
+
+    from app.models import Account
+
+    account = Account(tenant_id=tenant.id, name="Cash", current_balance=Decimal("1000.00"))
+    session.add(account)
+    session.commit()
+    return account
+
+
+@pytest.fixture
+def project(session, tenant):
+    """Create a test project."""
+    from decimal import Decimal
+
+    from app.models import Project
+
+    project = Project(tenant_id=tenant.id, name="Launch", starting_budget=Decimal("500.00"))
+    session.add(project)
+    session.commit()
+    return project
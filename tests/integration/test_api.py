@@ -85,3 +85,124 @@ class TestExpensesAPI:
         data = json.loads(response.data)
         assert 'expenses' in data
         assert 'pagination' in data
+
+    def test_create_expense_rejects_long_tag(self, client, auth_headers):
+        """Test tags longer than expense_tags.tag allows are rejected with 422."""
+        response = client.post(
+            '/api/v1/expenses/',
+            headers=auth_headers,
+            json={
+                'amount': '10.00',
+                'title': 'Lunch',
+                'category_id': 'any',
+                'expense_date': '2025-01-15',
+                'tags': ['x' * 101],
+            }
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize('payload', [['zz', 'x'], [{'a': 1}, 'x']])
+    def test_get_expenses_malformed_cursor(self, client, auth_headers, payload):
+        """Test a tampered keyset cursor is rejected with 400."""
+        import base64
+
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        response = client.get(
+            f'/api/v1/expenses/?sort_by=amount&cursor={cursor}',
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'] == 'Invalid cursor'
+
+    def test_bulk_create_expenses(self, client, auth_headers, session, tenant, user):
+        """Test bulk import inserts rows, debits accounts and refreshes budgets."""
+        from datetime import date
+        from decimal import Decimal
+
+        from app.models import Account, Budget, Category, Expense, Project
+
+        account = Account(tenant_id=tenant.id, name='Cash', current_balance=Decimal('500.00'))
+        project = Project(tenant_id=tenant.id, name='Launch', starting_budget=Decimal('1000'))
+        session.add_all([account, project])
+        session.commit()
+        category = Category(tenant_id=tenant.id, project_id=project.id, name='Travel')
+        budget = Budget(
+            tenant_id=tenant.id,
+            name='Year',
+            amount=Decimal('1000'),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+        )
+        session.add_all([category, budget])
+        session.commit()
+        account_id, budget_id = account.id, budget.id
+
+        response = client.post(
+            '/api/v1/expenses/bulk',
+            headers=auth_headers,
+            json=[
+                {
+                    'amount': '100.50',
+                    'account_id': account_id,
+                    'project_id': project.id,
+                    'category_id': category.id,
+                    'expense_date': '2025-01-01',
+                    'vendor': 'Airline',
+                    'note': 'Flight',
+                    'tags': ['travel', 'q1'],
+                    'metadata': {'source': 'csv'},
+                },
+                {
+                    'amount': '20.00',
+                    'account_id': account_id,
+                    'project_id': project.id,
+                    'expense_date': '2025-02-01',
+                },
+            ]
+        )
+
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data['count'] == 2
+
+        session.expire_all()
+        first = session.get(Expense, data['ids'][0])
+        assert first.vendor == 'Airline'
+        assert first.note == 'Flight'
+        assert first.expense_metadata == {'source': 'csv'}
+        assert first.tags == {'travel', 'q1'}
+        assert session.get(Account, account_id).current_balance == Decimal('379.50')
+        assert session.get(Budget, budget_id).spent_cached.spent == Decimal('120.50')
+    
+    def test_bulk_create_rejects_other_tenant_account(self, client, auth_headers, session, tenant):
+        """Test bulk import rejects references outside the tenant."""
+        from decimal import Decimal
+
+        from app.models import Account, Project, Tenant
+
+        other = Tenant(name='Other Org', subdomain='other')
+        session.add(other)
+        session.commit()
+        account = Account(tenant_id=other.id, name='Theirs', current_balance=Decimal('10'))
+        project = Project(tenant_id=tenant.id, name='Launch')
+        session.add_all([account, project])
+        session.commit()
+        account_id = account.id
+
+        response = client.post(
+            '/api/v1/expenses/bulk',
+            headers=auth_headers,
+            json=[
+                {
+                    'amount': '5.00',
+                    'account_id': account_id,
+                    'project_id': project.id,
+                    'expense_date': '2025-01-01',
+                }
+            ]
+        )
+
+        assert response.status_code == 400
+        assert session.get(Account, account_id).current_balance == Decimal('10.00')
@@ -0,0 +1,69 @@
+"""Unit tests for account balance updates."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask import g
+
+from app.models import Account, Expense
+from app.services.balance import BalanceService
+
+
+def stored_balance(session, account):
+    """Balance as persisted, bypassing the instance's loaded value."""
+    session.expire_all()
+    return session.get(Account, account.id).current_balance
+
+
+@pytest.mark.unit
+class TestAccountBalance:
+    """Test debits and credits applied through Account._add_to_balance."""
+
+    def test_debit_then_credit_persistent_account(self, session, account):
+        """Test a debit and a credit are both applied to the stored balance."""
+        account.debit(Decimal("250.00"))
+        assert account.current_balance == Decimal("750.00")
+
+        account.credit(Decimal("100.50"))
+        assert account.current_balance == Decimal("850.50")
+        assert stored_balance(session, account) == Decimal("850.50")
+
+    def test_pending_account_adjusts_in_memory(self, session, tenant):
+        """Test an account that isn't persisted yet is adjusted on the instance."""
+        account = Account(tenant_id=tenant.id, name="Wallet", current_balance=Decimal("20.00"))
+        session.add(account)
+
+        account.debit(Decimal("5.00"), commit=False)
+        assert account.current_balance == Decimal("15.00")
+
+        session.commit()
+        assert stored_balance(session, account) == Decimal("15.00")
+
+    def test_pending_balance_change_is_kept(self, session, account):
+        """Test a delta applies on top of an unflushed balance change."""
+        account.adjust_balance(Decimal("50.00"), commit=False)
+        with session.no_autoflush:
+            account.debit(Decimal("10.00"), commit=False)
+
+        assert account.current_balance == Decimal("40.00")
+        session.commit()
+        assert stored_balance(session, account) == Decimal("40.00")
+
+    def test_delete_expense_credits_once(self, session, monkeypatch, tenant, project, account):
+        """Test deleting an expense credits its account back exactly once."""
+        monkeypatch.setattr(g, "tenant_id", tenant.id, raising=False)
+        expense = Expense(
+            tenant_id=tenant.id,
+            account_id=account.id,
+            project_id=project.id,
+            amount=Decimal("75.25"),
+            expense_date=datetime(2025, 1, 15),
+        )
+        session.add(expense)
+        account.debit(expense.amount)
+        assert stored_balance(session, account) == Decimal("924.75")
+
+        assert BalanceService.delete_expense_with_balance_reversal(expense.id, tenant.id)
+
+        assert stored_balance(session, account) == Decimal("1000.00")
+        assert session.get(Expense, expense.id).is_deleted
@@ -0,0 +1,72 @@
+"""Unit tests for buffered audit log writes."""
+import uuid
+
+import pytest
+from flask import g
+
+from app.models import AuditLog, Project
+from app.models.audit import AuditAction
+
+
+@pytest.mark.unit
+class TestAuditBuffer:
+    """Test buffered audit entries follow the caller's transaction."""
+
+    @pytest.fixture(autouse=True)
+    def tenant_context(self, monkeypatch, tenant):
+        """Log actions as if inside a request for tenant."""
+        monkeypatch.setattr(g, "tenant_id", tenant.id, raising=False)
+
+    @staticmethod
+    def _entries(session, entity_id):
+        return session.query(AuditLog).filter_by(entity_id=entity_id).all()
+
+    def test_entry_written_by_callers_commit(self, session):
+        """Test a commit=False entry is inserted when the caller commits."""
+        entity_id = str(uuid.uuid4())
+        AuditLog.log_action(AuditAction.APPROVE, "expense", entity_id=entity_id, commit=False)
+
+        assert self._entries(session, entity_id) == []
+
+        session.commit()
+
+        entries = self._entries(session, entity_id)
+        assert [entry.action for entry in entries] == [AuditAction.APPROVE.value]
+
+    def test_rollback_drops_entry(self, session):
+        """Test a rolled-back transaction discards its buffered entries."""
+        entity_id = str(uuid.uuid4())
+        AuditLog.log_action(AuditAction.APPROVE, "expense", entity_id=entity_id, commit=False)
+
+        session.rollback()
+        session.commit()
+
+        assert "audit_buffer" not in session.info
+        assert self._entries(session, entity_id) == []
+
+    def test_savepoint_rollback_keeps_entry(self, session, project):
+        """Test rolling back a savepoint keeps entries of the outer transaction."""
+        entity_id = str(uuid.uuid4())
+        AuditLog.log_action(AuditAction.APPROVE, "expense", entity_id=entity_id, commit=False)
+
+        with session.begin_nested() as savepoint:
+            project.name = "Renamed"
+            session.flush()
+            savepoint.rollback()
+        session.commit()
+
+        assert len(self._entries(session, entity_id)) == 1
+
+    def test_change_flushed_by_commit_is_audited(self, session, project):
+        """Test an AuditableMixin change left unflushed until commit is recorded."""
+        project.name = "Relaunch"
+        session.commit()
+
+        entries = [
+            entry
+            for entry in self._entries(session, project.id)
+            if entry.action == AuditAction.UPDATE.value
+        ]
+        assert len(entries) == 1
+        assert entries[0].changes_json["new"] == {"name": "Relaunch"}
+        assert entries[0].entity_type == "project"
@@ -0,0 +1,82 @@
+"""Unit tests for budget spend snapshot refreshes."""
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from app.models import Budget, Expense
+
+
+@pytest.mark.unit
+class TestBudgetSpendSnapshots:
+    """Test expense commits refresh the snapshots of affected budgets."""
+
+    @pytest.fixture
+    def budgets(self, session, tenant):
+        """January and February budgets."""
+        january = Budget(
+            tenant_id=tenant.id,
+            name="January",
+            amount=Decimal("1000"),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+        )
+        february = Budget(
+            tenant_id=tenant.id,
+            name="February",
+            amount=Decimal("1000"),
+            start_date=date(2025, 2, 1),
+            end_date=date(2025, 2, 28),
+        )
+        session.add_all([january, february])
+        session.commit()
+        return january, february
+
+    @staticmethod
+    def _spent(session, budget):
+        session.expire_all()
+        snapshot = session.get(Budget, budget.id).spent_cached
+        return snapshot.spent if snapshot else None
+
+    def test_expense_changes_refresh_snapshots(self, session, tenant, account, project, budgets):
+        """Test insert, date move and soft delete each refresh the right budgets."""
+        january, february = budgets
+        assert self._spent(session, january) == Decimal("0.00")
+
+        expense = Expense(
+            tenant_id=tenant.id,
+            account_id=account.id,
+            project_id=project.id,
+            amount=Decimal("40.00"),
+            expense_date=datetime(2025, 1, 15),
+        )
+        session.add(expense)
+        session.commit()
+        assert self._spent(session, january) == Decimal("40.00")
+        assert self._spent(session, february) == Decimal("0.00")
+
+        expense.expense_date = datetime(2025, 2, 10)
+        session.commit()
+        assert self._spent(session, january) == Decimal("0.00")
+        assert self._spent(session, february) == Decimal("40.00")
+
+        expense.soft_delete()
+        assert self._spent(session, february) == Decimal("0.00")
+
+    def test_refresh_replaces_existing_snapshot(self, session, tenant, account, project, budgets):
+        """Test refreshing a budget that already has a snapshot updates it in place."""
+        january, _ = budgets
+        session.add(
+            Expense(
+                tenant_id=tenant.id,
+                account_id=account.id,
+                project_id=project.id,
+                amount=Decimal("15.00"),
+                expense_date=datetime(2025, 1, 3),
+            )
+        )
+        session.commit()
+
+        Budget.refresh_spend_snapshots(Budget.id == january.id)
+        Budget.refresh_spend_snapshots(Budget.id == january.id)
+
+        assert self._spent(session, january) == Decimal("15.00")
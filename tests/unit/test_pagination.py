@@ -0,0 +1,35 @@
+"""Unit tests for pagination utilities."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from app.models import Expense
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.unit
+class TestKeysetCursor:
+    """Test keyset cursor encoding and decoding."""
+
+    def test_cursor_round_trip(self):
+        """Test cursor values decode back to their column types."""
+        values = [datetime(2025, 1, 2, 3, 4, 5), "abc-123"]
+
+        cursor = encode_cursor(values)
+
+        assert decode_cursor(cursor, [Expense.expense_date, Expense.id]) == values
+
+    def test_cursor_decimal_round_trip(self):
+        """Test decimal sort keys survive encoding without float conversion."""
+        cursor = encode_cursor([Decimal("100.10"), "abc-123"])
+
+        amount, _ = decode_cursor(cursor, [Expense.amount, Expense.id])
+        assert amount == Decimal("100.10")
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", [Expense.expense_date, Expense.id])
+
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(["abc-123"]), [Expense.expense_date, Expense.id])
@@ -0,0 +1,65 @@
+"""Unit tests for project spend totals."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from app.models import Expense
+
+
+def add_expense(session, project, account, amount):
+    """Commit an expense of amount against project."""
+    expense = Expense(
+        tenant_id=project.tenant_id,
+        account_id=account.id,
+        project_id=project.id,
+        amount=Decimal(amount),
+        expense_date=datetime(2025, 1, 15),
+    )
+    session.add(expense)
+    session.commit()
+    return expense
+
+
+@pytest.mark.unit
+class TestProjectTotals:
+    """Test the memoized Project.total_spent."""
+
+    def test_total_spent_follows_commits(self, session, project, account):
+        """Test the cached total is dropped once new expenses are committed."""
+        assert project.total_spent == Decimal("0")
+
+        add_expense(session, project, account, "120.00")
+        assert project.total_spent == Decimal("120.00")
+        assert project.remaining_budget == Decimal("380.00")
+
+        add_expense(session, project, account, "30.00")
+        assert project.to_dict(include_metrics=True)["total_spent"] == 150.0
+
+    def test_bulk_totals_match_total_spent(self, session, tenant, project, account):
+        """Test bulk_totals agrees with per-project totals, including empty projects."""
+        from app.models import Project
+
+        empty = Project(tenant_id=tenant.id, name="Empty")
+        session.add(empty)
+        session.commit()
+        add_expense(session, project, account, "70.00")
+        add_expense(session, project, account, "5.50")
+        deleted = add_expense(session, project, account, "100.00")
+        deleted.soft_delete()
+
+        totals = Project.bulk_totals([project, empty])
+
+        assert totals == {project.id: Decimal("75.50"), empty.id: Decimal("0")}
+        assert project.total_spent == Decimal("75.50")
+        assert empty.total_spent == Decimal("0")
+        session.expire_all()
+        assert {p.id: p.total_spent for p in (project, empty)} == totals
+
+    def test_bulk_totals_seed_is_dropped_on_commit(self, session, project, account):
+        """Test totals seeded by bulk_totals don't outlive a commit."""
+        from app.models import Project
+
+        Project.bulk_totals([project])
+        add_expense(session, project, account, "12.00")
+
+        assert project.total_spent == Decimal("12.00")
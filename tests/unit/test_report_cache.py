@@ -0,0 +1,37 @@
+"""Unit tests for project report cache invalidation."""
+from decimal import Decimal
+
+import pytest
+
+from app.services.report_cache import _tag_key
+
+
+class FakeRedis:
+    """Records the keys deleted by invalidate_project_reports."""
+
+    def __init__(self):
+        self.deleted = []
+
+    def smembers(self, key):
+        return set()
+
+    def delete(self, *keys):
+        self.deleted.extend(keys)
+
+
+@pytest.mark.unit
+class TestReportCacheInvalidation:
+    """Test committed changes drop the affected project's cached reports."""
+
+    @pytest.fixture
+    def redis(self, app, monkeypatch):
+        redis = FakeRedis()
+        monkeypatch.setattr(app, "redis", redis)
+        return redis
+
+    def test_project_budget_change_invalidates(self, session, project, redis):
+        """Test editing a project's budget drops its cached reports."""
+        project.starting_budget = Decimal("750.00")
+        session.commit()
+
+        assert _tag_key(project.tenant_id, project.id) in redis.deleted